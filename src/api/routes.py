@@ -173,8 +173,8 @@ async def synthesize(
     try:
         import base64
         
-        # Synthesize to bytes
-        audio_bytes = _assistant.tts.synthesize_to_bytes(text)
+        # Synthesize to bytes off the event loop
+        audio_bytes = await _assistant.tts.asynthesize_to_bytes(text)
         
         # Encode to base64
         audio_b64 = base64.b64encode(audio_bytes).decode('utf-8')
@@ -27,6 +27,7 @@ from src.utils.logger import get_logger, log_performance, log_timing
 from src.utils.error_handler import handle_error
 from src.utils.sentence_splitter import SentenceSplitter
 from src.utils.memory_manager import get_memory_manager
+from src.utils.factories import create_llm_engine
 from typing import Dict, List, Optional, Tuple
 import json
 import time
@@ -115,8 +116,8 @@ class AssistantCore:
             self.logger.info("3. Using injected LLM engine...")
             self.llm = llm
         else:
-            self.logger.info("3. Initializing LLM engine...")
-            self.llm = LLMEngine(config=config.llm)
+            self.logger.info(f"3. Initializing LLM engine ({config.llm.backend})...")
+            self.llm = create_llm_engine(config)
         
         # Controllers (dependency injection with defaults)
         if file_ctrl is not None:
@@ -865,14 +866,13 @@ Be concise and helpful. When asked to perform actions, use the available functio
             # Process stream
             for chunk in stream:
                 if chunk.get('done'):
+                    full_response = chunk.get('text', '')
                     break
                 
                 delta = chunk.get('delta', '')
                 if not delta:
                     continue
                 
-                full_response += delta
-                
                 # Print delta for visual feedback (optional)
                 print(delta, end='', flush=True)
             
@@ -27,7 +27,8 @@ class AudioCapture:
         sample_rate: int = 16000,
         frame_duration: int = 30,
         vad_aggressiveness: int = 3,
-        channels: int = 1
+        channels: int = 1,
+        ring_seconds: float = 60.0
     ):
         """
         Initialize audio capture.
@@ -37,6 +38,9 @@ class AudioCapture:
             frame_duration: Frame duration in milliseconds (10, 20, or 30)
             vad_aggressiveness: VAD aggressiveness (0-3, 3 is most aggressive)
             channels: Number of audio channels (1 = mono, 2 = stereo)
+            ring_seconds: Capacity of the speech ring buffer in seconds; speech
+                          segments are handed out as views into it until
+                          released with release_speech()
         """
         self.sample_rate = sample_rate
         self.frame_duration = frame_duration  # ms
@@ -49,6 +53,11 @@ class AudioCapture:
         # Audio buffer
         self.audio_queue = queue.Queue(maxsize=100)
         self.audio_buffer = deque(maxlen=1000)  # Store recent audio chunks
+        # Preallocated speech storage so segments don't allocate per utterance
+        self._speech_ring = np.empty((int(ring_seconds * sample_rate), channels), dtype=np.float32)
+        # Ring spans handed to on_speech_end and not yet released (start -> end)
+        self._outstanding = {}
+        self._outstanding_lock = threading.Lock()
         
         # State
         self.is_recording = False
@@ -106,7 +115,7 @@ class AudioCapture:
             self.is_recording = True
             self.stream.start()
             print("✅ Audio capture started")
-            
+        
         except Exception as e:
             print(f"❌ Error starting audio capture: {e}")
             self.is_recording = False
@@ -136,7 +145,7 @@ class AudioCapture:
         
         Args:
             audio_chunk: Audio data as numpy array (float32, shape: [samples] or [samples, channels])
-            
+        
         Returns:
             True if speech detected, False otherwise
         """
@@ -179,7 +188,7 @@ class AudioCapture:
         
         Args:
             timeout: Timeout in seconds for getting chunks
-            
+        
         Yields:
             Audio chunks as numpy arrays
         """
@@ -196,7 +205,7 @@ class AudioCapture:
         
         Args:
             duration_seconds: Duration of audio to retrieve in seconds
-            
+        
         Returns:
             Concatenated audio array or None if not enough audio
         """
@@ -232,7 +241,11 @@ class AudioCapture:
             speech_threshold: Number of consecutive speech frames to trigger speech start
             silence_threshold: Number of consecutive silence frames to trigger speech end
             on_speech_start: Callback when speech starts (called with audio chunk)
-            on_speech_end: Callback when speech ends (called with audio array)
+            on_speech_end: Callback when speech ends (called with audio array).
+                The array is usually a view into the speech ring buffer; pass
+                it to release_speech() once consumed. Until then the ring
+                won't overwrite it, and new speech that would is copied
+                instead.
         """
         self.on_speech_start = on_speech_start
         self.on_speech_end = on_speech_end
@@ -240,7 +253,12 @@ class AudioCapture:
         speech_frames = 0
         silence_frames = 0
         in_speech = False
-        speech_audio = []
+        ring = self._speech_ring
+        # Current segment occupies ring[segment_start:write_pos], or the
+        # spill list when it couldn't stay in the ring
+        segment_start = 0
+        write_pos = 0
+        spill = None
         
         print(f"Monitoring speech... (speech threshold: {speech_threshold}, silence: {silence_threshold})")
         
@@ -255,14 +273,25 @@ class AudioCapture:
                     if speech_frames >= speech_threshold:
                         # Speech started
                         in_speech = True
-                        speech_audio = [chunk]
+                        segment_start, spill = write_pos, None
+                        segment_start, write_pos, spill = self._ring_append(chunk, segment_start, write_pos, spill)
                         print("🎤 Speech detected!")
                         
                         if self.on_speech_start:
                             self.on_speech_start(chunk)
                 else:
                     # Continue speech
-                    speech_audio.append(chunk)
+                    if spill is None and write_pos - segment_start + len(chunk) > len(ring):
+                        # Segment outgrew the ring: hand over a copy of what we have
+                        # (the next append reuses this space) and keep recording
+                        if self.on_speech_end:
+                            self.on_speech_end(ring[segment_start:write_pos].copy())
+                        segment_start = write_pos
+                    elif spill is not None and sum(len(c) for c in spill) + len(chunk) > len(ring):
+                        if self.on_speech_end:
+                            self.on_speech_end(np.concatenate(spill))
+                        segment_start, spill = write_pos, None
+                    segment_start, write_pos, spill = self._ring_append(chunk, segment_start, write_pos, spill)
             else:
                 silence_frames += 1
                 speech_frames = 0
@@ -271,17 +300,75 @@ class AudioCapture:
                     if silence_frames >= silence_threshold:
                         # Speech ended
                         in_speech = False
-                        audio_array = np.concatenate(speech_audio, axis=0)
+                        if spill is not None:
+                            audio_array = np.concatenate(spill)
+                        else:
+                            audio_array = ring[segment_start:write_pos]
+                            with self._outstanding_lock:
+                                self._outstanding[segment_start] = write_pos
                         print(f"🔇 Speech ended ({len(audio_array) / self.sample_rate:.2f}s)")
                         
                         if self.on_speech_end:
                             self.on_speech_end(audio_array)
-                        
-                        speech_audio = []
                 else:
                     # Continue silence
                     pass
-
+    
+    
+    def release_speech(self, audio_array: np.ndarray):
+        """
+        Release a segment handed to on_speech_end so its ring space can be reused.
+        
+        Arrays that aren't views into the ring (copies) are ignored.
+        
+        Args:
+            audio_array: The array passed to on_speech_end (or a reshape of it)
+        """
+        ring = self._speech_ring
+        offset = audio_array.__array_interface__["data"][0] - ring.__array_interface__["data"][0]
+        if not 0 <= offset < ring.nbytes:
+            return
+        with self._outstanding_lock:
+            self._outstanding.pop(offset // ring.strides[0], None)
+    
+    def _ring_append(self, chunk: np.ndarray, segment_start: int, write_pos: int, spill: Optional[list]):
+        """
+        Append a chunk to the current speech segment in the ring buffer.
+        
+        When the chunk doesn't fit before the end of the ring, the segment so
+        far is moved to the front so it stays contiguous. If the write would
+        overlap a segment that hasn't been released yet, the current segment
+        moves to a spill list of copies instead.
+        
+        Args:
+            chunk: Audio chunk, shape [samples, channels]
+            segment_start: Ring index where the current segment starts
+            write_pos: Ring index just past the current segment
+            spill: Chunks of the current segment if it already spilled, else None
+        
+        Returns:
+            Tuple of (segment_start, write_pos, spill) after the append
+        """
+        ring = self._speech_ring
+        n = len(chunk)
+        chunk = chunk.reshape(n, -1)
+        if spill is not None:
+            spill.append(chunk)
+            return segment_start, write_pos, spill
+        
+        length = write_pos - segment_start
+        wraps = write_pos + n > len(ring)
+        lo, hi = (0, length + n) if wraps else (write_pos, write_pos + n)
+        with self._outstanding_lock:
+            overlaps = any(start < hi and lo < end for start, end in self._outstanding.items())
+        if overlaps:
+            return segment_start, write_pos, [ring[segment_start:write_pos].copy(), chunk]
+        
+        if wraps:
+            ring[:length] = ring[segment_start:write_pos]
+            segment_start, write_pos = 0, length
+        ring[write_pos:write_pos + n] = chunk
+        return segment_start, write_pos + n, None
 
 if __name__ == "__main__":
     # Test audio capture
@@ -312,7 +399,7 @@ if __name__ == "__main__":
                 silence_count += 1
                 if silence_count % 100 == 0:
                     print(f"🔇 Silence... ({silence_count} frames)")
-                    
+    
     except KeyboardInterrupt:
         print("\n\nStopping...")
     finally:
@@ -6,6 +6,8 @@ that the LLM can call to control the computer and perform actions.
 """
 
 import json
+import functools
+import logging
 from typing import Dict, List, Callable, Optional, Any
 from datetime import datetime
 import inspect
@@ -14,6 +16,95 @@ from src.utils.error_handler import handle_error
 from src.interfaces.function_handler import FunctionHandlerInterface
 
 
+@functools.lru_cache(maxsize=512)
+def _cached_sig(func: Callable) -> inspect.Signature:
+    """Introspect a callable once, shared across FunctionHandler instances."""
+    return inspect.signature(func)
+
+
+def _signature(func: Callable) -> inspect.Signature:
+    """Get a function signature, using the module-level cache when possible."""
+    try:
+        return _cached_sig(func)
+    except TypeError:
+        # Unhashable callable - introspect directly
+        return inspect.signature(func)
+
+
+def _param_sets(sig: inspect.Signature):
+    """
+    Precompute accepted and required parameter names for a signature.
+    
+    Returns:
+        Tuple of (param_names, required) frozensets
+    """
+    params = sig.parameters
+    param_names = frozenset(params)
+    required = frozenset(
+        name for name, param in params.items()
+        if param.default is inspect.Parameter.empty
+    )
+    return param_names, required
+
+
+class _MissingParameter(Exception):
+    """Raised by argument filtering when a required parameter is absent."""
+
+
+# Parameter kinds that can be passed by keyword from an arguments dict
+_KEYWORD_KINDS = (
+    inspect.Parameter.POSITIONAL_OR_KEYWORD,
+    inspect.Parameter.KEYWORD_ONLY,
+)
+
+
+def _build_dispatcher(func: Callable, sig: Optional[inspect.Signature]) -> Optional[Callable]:
+    """
+    Generate a straight-line dispatcher specialized to a function's signature.
+    
+    The generated ``_dispatch(args)`` checks required parameters, picks the
+    accepted keys out of ``args`` and calls ``func`` without looping over the
+    signature. Returns None when the signature can't be specialized (no
+    signature, ``*args``/``**kwargs``, positional-only parameters) so the
+    caller falls back to generic filtering.
+    
+    Args:
+        func: Function to dispatch to
+        sig: Signature of ``func``
+        
+    Returns:
+        Dispatcher taking the arguments dict, or None
+    """
+    if sig is None:
+        return None
+    
+    params = list(sig.parameters.values())
+    if any(p.kind not in _KEYWORD_KINDS for p in params):
+        return None
+    
+    required = [p.name for p in params if p.default is inspect.Parameter.empty]
+    optional = [p.name for p in params if p.default is not inspect.Parameter.empty]
+    
+    lines = ["def _dispatch(args, _f=_f, _missing=_missing):"]
+    for name in required:
+        lines.append(f"    if {name!r} not in args: raise _missing({name!r})")
+    call_args = ", ".join(f"{name}=args[{name!r}]" for name in required)
+    if optional:
+        lines.append(f"    kwargs = {{{', '.join(f'{n!r}: args[{n!r}]' for n in required)}}}")
+        for name in optional:
+            lines.append(f"    if {name!r} in args: kwargs[{name!r}] = args[{name!r}]")
+        lines.append("    return _f(**kwargs)")
+    else:
+        lines.append(f"    return _f({call_args})")
+    
+    namespace = {"_f": func, "_missing": _MissingParameter}
+    try:
+        exec("\n".join(lines), namespace)
+    except SyntaxError:
+        return None
+    return namespace["_dispatch"]
+
+
 class FunctionHandler(FunctionHandlerInterface):
     """
     Handler for LLM function calling.
@@ -48,10 +139,21 @@ class FunctionHandler(FunctionHandlerInterface):
         if name in self.functions:
             self.logger.warning(f"Function '{name}' already registered, overwriting...")
         
+        try:
+            sig = _signature(func)
+        except ValueError:
+            # No introspectable signature (some builtins) - resolved at execute time
+            sig = None
+        param_names, required = _param_sets(sig) if sig is not None else (None, None)
+        
         self.functions[name] = {
             "function": func,
             "description": description,
-            "parameters": parameters
+            "parameters": parameters,
+            "signature": sig,
+            "param_names": param_names,
+            "required": required,
+            "dispatcher": _build_dispatcher(func, sig)
         }
         self.logger.debug(f"Registered function: {name}")
     
@@ -170,61 +272,75 @@ class FunctionHandler(FunctionHandlerInterface):
         func = func_info["function"]
         args = arguments or {}
         
-        self.logger.debug(f"Executing function: {function_name} with args: {args}")
+        self.logger.debug("Executing function: %s with args: %s", function_name, args)
         
         try:
             with log_timing(f"Function execution: {function_name}", self.logger):
-                # Get function signature to validate arguments
-                sig = inspect.signature(func)
-                params = sig.parameters
+                dispatcher = func_info.get("dispatcher")
+                if dispatcher is not None:
+                    # Specialized straight-line path generated at registration
+                    result = dispatcher(args)
+                else:
+                    sig = func_info.get("signature") or _signature(func)
+                    param_names = func_info.get("param_names")
+                    required = func_info.get("required")
+                    if param_names is None:
+                        param_names, required = _param_sets(sig)
+                    
+                    # Validate and filter arguments with C-level set operations
+                    missing = required - args.keys()
+                    if missing:
+                        raise _MissingParameter(next(n for n in sig.parameters if n in missing))
+                    filtered_args = {k: args[k] for k in args.keys() & param_names}
+                    
+                    # Execute function
+                    result = func(**filtered_args)
                 
-                # Filter arguments to only include those the function accepts
-                filtered_args = {}
-                for param_name, param in params.items():
-                    if param_name in args:
-                        filtered_args[param_name] = args[param_name]
-                    elif param.default == inspect.Parameter.empty:
-                        # Required parameter missing
-                        error_msg = f"Missing required parameter: {param_name}"
-                        self.logger.error(error_msg)
-                        return {
-                            "success": False,
-                            "error": error_msg
-                        }
-                
-                # Execute function
-                result = func(**filtered_args)
-                
-                self.logger.info(f"Function {function_name} executed successfully")
+                self.logger.info("Function %s executed successfully", function_name)
                 return {
                     "success": True,
                     "result": result
                 }
             
-        except TypeError as e:
-            error_info = handle_error(e, context={"function": function_name, "arguments": args}, logger=self.logger)
+        except _MissingParameter as e:
+            error_msg = f"Missing required parameter: {e}"
+            self.logger.error(error_msg)
             return {
                 "success": False,
-                "error": error_info["message"]
+                "error": error_msg
             }
-        except Exception as e:
-            error_info = handle_error(e, context={"function": function_name, "arguments": args}, logger=self.logger)
-            self.logger.error(f"Error executing function {function_name}: {error_info['message']}", exc_info=True)
-            return {
-                "success": False,
-                "error": error_info["message"]
-            }
-            
         except TypeError as e:
-            return {
-                "success": False,
-                "error": f"Invalid arguments: {str(e)}"
-            }
+            return self._error_result(e, function_name, args, exc_info=False)
         except Exception as e:
+            return self._error_result(e, function_name, args, exc_info=True)
+    
+    def _error_result(
+        self,
+        error: Exception,
+        function_name: str,
+        args: Dict,
+        exc_info: bool
+    ) -> Dict:
+        """
+        Build the failure result for a function execution error.
+        
+        Error classification and traceback capture only happen when the
+        logger would actually emit the record; otherwise the plain
+        exception text is returned.
+        """
+        if not self.logger.isEnabledFor(logging.ERROR):
             return {
                 "success": False,
-                "error": str(e)
+                "error": str(error)
             }
+        
+        error_info = handle_error(error, context={"function": function_name, "arguments": args}, logger=self.logger)
+        if exc_info:
+            self.logger.error("Error executing function %s: %s", function_name, error_info["message"], exc_info=True)
+        return {
+            "success": False,
+            "error": error_info["message"]
+        }
     
     def list_functions(self) -> List[str]:
         """Get list of all registered function names."""
@@ -236,8 +352,10 @@ class FunctionHandler(FunctionHandlerInterface):
             return None
         
         info = self.functions[function_name].copy()
-        # Don't include the actual function object
+        # Don't include the actual function object or execution internals
         info.pop("function", None)
+        for key in ("signature", "param_names", "required", "dispatcher"):
+            info.pop(key, None)
         return info
 
 
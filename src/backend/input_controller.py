@@ -14,6 +14,129 @@ from src.utils.logger import get_logger
 from src.interfaces.controllers import InputControllerInterface
 
 
+class IOResult:
+    """
+    Lightweight result for high-rate input queries.
+    
+    Uses ``__slots__`` so polling loops (e.g. a mouse tracker calling
+    ``get_mouse_position()`` at 60Hz) don't allocate a dict per sample.
+    Supports dict-style access (``result["x"]``, ``result.get("error")``,
+    ``"x" in result``) so existing callers keep working.
+    """
+    
+    __slots__ = ("success", "x", "y", "error", "payload")
+    
+    def __init__(
+        self,
+        success: bool,
+        x: Optional[int] = None,
+        y: Optional[int] = None,
+        error: Optional[str] = None,
+        payload: Optional[Dict] = None
+    ):
+        self.success = success
+        self.x = x
+        self.y = y
+        self.error = error
+        self.payload = payload
+    
+    def __getitem__(self, key: str):
+        if key == "success":
+            return self.success
+        if key in ("x", "y", "error"):
+            value = getattr(self, key)
+            if value is not None:
+                return value
+        elif self.payload is not None and key in self.payload:
+            return self.payload[key]
+        raise KeyError(key)
+    
+    def __contains__(self, key: str) -> bool:
+        try:
+            self[key]
+        except KeyError:
+            return False
+        return True
+    
+    def get(self, key: str, default=None):
+        """Dict-style get with a default."""
+        try:
+            return self[key]
+        except KeyError:
+            return default
+    
+    def to_dict(self) -> Dict:
+        """Convert to a plain dictionary."""
+        result = {"success": self.success}
+        for key in ("x", "y", "error"):
+            value = getattr(self, key)
+            if value is not None:
+                result[key] = value
+        if self.payload:
+            result.update(self.payload)
+        return result
+    
+    def __repr__(self) -> str:
+        return f"IOResult({self.to_dict()!r})"
+
+
+def _fail(error: Exception) -> Dict:
+    """Build the shared failure result for an input action."""
+    return {"success": False, "error": str(error)}
+
+
+def _build_position_reader():
+    """
+    Build a fast cursor-position reader for the current platform.
+    
+    Calls the native API directly instead of going through pyautogui's
+    platform dispatch. Falls back to pyautogui.position() when the native
+    bindings are unavailable.
+    
+    Returns:
+        Callable returning an (x, y) tuple
+    """
+    system = platform.system()
+    try:
+        if system == "Windows":
+            import ctypes
+            import ctypes.wintypes
+            
+            point = ctypes.wintypes.POINT()
+            point_ref = ctypes.byref(point)
+            get_cursor_pos = ctypes.windll.user32.GetCursorPos
+            
+            def _get_pos():
+                get_cursor_pos(point_ref)
+                return point.x, point.y
+            
+            return _get_pos
+        
+        if system == "Darwin":
+            import Quartz
+            
+            def _get_pos():
+                loc = Quartz.CGEventGetLocation(Quartz.CGEventCreate(None))
+                return int(loc.x), int(loc.y)
+            
+            return _get_pos
+        
+        if system == "Linux":
+            from Xlib import display
+            
+            root = display.Display().screen().root
+            
+            def _get_pos():
+                data = root.query_pointer()._data
+                return data["root_x"], data["root_y"]
+            
+            return _get_pos
+    except Exception:
+        pass
+    
+    return pyautogui.position
+
+
 class InputController(InputControllerInterface):
     """
     Controller for keyboard and mouse input.
@@ -33,7 +156,13 @@ class InputController(InputControllerInterface):
         Args:
             config: InputControllerConfig object (takes precedence over individual params)
             safe_mode: Enable safety features (failsafe, pauses)
-            pause: Pause between actions in seconds
+            pause: Pause after each logical action in seconds
+
+        Note:
+            ``pause`` is applied once after each action method (``type_text``,
+            ``hotkey``, ``click``, ...) rather than after every pyautogui
+            primitive. ``pyautogui.PAUSE`` is set to 0, so code that relied on
+            per-keystroke throttling should pass an explicit ``interval``.
         """
         # Use config if provided, otherwise use individual params or defaults
         if config:
@@ -44,12 +173,27 @@ class InputController(InputControllerInterface):
             pause = pause if pause is not None else 0.1
         
         self.safe_mode = safe_mode
+        self._post_action_pause = pause
         self.logger = get_logger(__name__)
         
-        # Configure pyautogui
-        pyautogui.PAUSE = pause
+        # Configure pyautogui (pause is applied once per action, not per primitive)
+        pyautogui.PAUSE = 0
         pyautogui.FAILSAFE = safe_mode  # Move mouse to corner to abort
         
+        # Pre-bind pyautogui entry points to skip module attribute lookups per call
+        self._pa_typewrite = pyautogui.typewrite
+        self._pa_press = pyautogui.press
+        self._pa_hotkey = pyautogui.hotkey
+        self._pa_moveTo = pyautogui.moveTo
+        self._pa_click = pyautogui.click
+        self._pa_drag = pyautogui.drag
+        self._pa_scroll = pyautogui.scroll
+        self._pa_screenshot = pyautogui.screenshot
+        self._pa_size = pyautogui.size
+        
+        # Native cursor reader for get_mouse_position() polling
+        self._get_pos = _build_position_reader()
+        
         if safe_mode:
             self.logger.info("InputController initialized (safe_mode=True)")
             self.logger.debug("  Failsafe enabled: Move mouse to corner to abort")
@@ -57,6 +201,11 @@ class InputController(InputControllerInterface):
             self.logger.warning("InputController initialized (safe_mode=False)")
             self.logger.warning("  ⚠️  WARNING: Failsafe disabled!")
     
+    def _settle(self):
+        """Sleep for the configured post-action pause, if any."""
+        if self._post_action_pause:
+            time.sleep(self._post_action_pause)
+    
     def type_text(
         self,
         text: str,
@@ -73,17 +222,15 @@ class InputController(InputControllerInterface):
             Dictionary with results
         """
         try:
-            pyautogui.typewrite(text, interval=interval)
+            self._pa_typewrite(text, interval=interval)
+            self._settle()
             return {
                 "success": True,
                 "typed": text,
                 "length": len(text)
             }
         except Exception as e:
-            return {
-                "success": False,
-                "error": str(e)
-            }
+            return _fail(e)
     
     def press_key(self, key: str) -> Dict:
         """
@@ -96,16 +243,14 @@ class InputController(InputControllerInterface):
             Dictionary with results
         """
         try:
-            pyautogui.press(key)
+            self._pa_press(key)
+            self._settle()
             return {
                 "success": True,
                 "key": key
             }
         except Exception as e:
-            return {
-                "success": False,
-                "error": str(e)
-            }
+            return _fail(e)
     
     def hotkey(self, *keys) -> Dict:
         """
@@ -118,16 +263,14 @@ class InputController(InputControllerInterface):
             Dictionary with results
         """
         try:
-            pyautogui.hotkey(*keys)
+            self._pa_hotkey(*keys)
+            self._settle()
             return {
                 "success": True,
                 "keys": keys
             }
         except Exception as e:
-            return {
-                "success": False,
-                "error": str(e)
-            }
+            return _fail(e)
     
     def move_mouse(
         self,
@@ -147,16 +290,14 @@ class InputController(InputControllerInterface):
             Dictionary with results
         """
         try:
-            pyautogui.moveTo(x, y, duration=duration)
+            self._pa_moveTo(x, y, duration=duration)
+            self._settle()
             return {
                 "success": True,
                 "position": (x, y)
             }
         except Exception as e:
-            return {
-                "success": False,
-                "error": str(e)
-            }
+            return _fail(e)
     
     def click(
         self,
@@ -181,9 +322,10 @@ class InputController(InputControllerInterface):
         """
         try:
             if x is not None and y is not None:
-                pyautogui.click(x, y, clicks=clicks, button=button, interval=interval)
+                self._pa_click(x, y, clicks=clicks, button=button, interval=interval)
             else:
-                pyautogui.click(clicks=clicks, button=button, interval=interval)
+                self._pa_click(clicks=clicks, button=button, interval=interval)
+            self._settle()
             
             return {
                 "success": True,
@@ -192,10 +334,7 @@ class InputController(InputControllerInterface):
                 "position": (x, y) if x is not None and y is not None else None
             }
         except Exception as e:
-            return {
-                "success": False,
-                "error": str(e)
-            }
+            return _fail(e)
     
     def drag(
         self,
@@ -221,17 +360,15 @@ class InputController(InputControllerInterface):
             Dictionary with results
         """
         try:
-            pyautogui.drag(start_x, start_y, end_x - start_x, end_y - start_y, duration=duration, button=button)
+            self._pa_drag(start_x, start_y, end_x - start_x, end_y - start_y, duration=duration, button=button)
+            self._settle()
             return {
                 "success": True,
                 "start": (start_x, start_y),
                 "end": (end_x, end_y)
             }
         except Exception as e:
-            return {
-                "success": False,
-                "error": str(e)
-            }
+            return _fail(e)
     
     def scroll(
         self,
@@ -252,9 +389,10 @@ class InputController(InputControllerInterface):
         """
         try:
             if x is not None and y is not None:
-                pyautogui.scroll(clicks, x=x, y=y)
+                self._pa_scroll(clicks, x=x, y=y)
             else:
-                pyautogui.scroll(clicks)
+                self._pa_scroll(clicks)
+            self._settle()
             
             return {
                 "success": True,
@@ -262,17 +400,14 @@ class InputController(InputControllerInterface):
                 "position": (x, y) if x is not None and y is not None else None
             }
         except Exception as e:
-            return {
-                "success": False,
-                "error": str(e)
-            }
+            return _fail(e)
     
-    def get_mouse_position(self) -> Dict:
+    def get_mouse_position(self) -> IOResult:
         """
         Get current mouse position.
         
         Returns:
-            Dictionary with mouse position:
+            IOResult with mouse position (also readable dict-style):
             {
                 "success": bool,
                 "x": int,
@@ -280,17 +415,10 @@ class InputController(InputControllerInterface):
             }
         """
         try:
-            x, y = pyautogui.position()
-            return {
-                "success": True,
-                "x": x,
-                "y": y
-            }
+            x, y = self._get_pos()
+            return IOResult(True, x, y)
         except Exception as e:
-            return {
-                "success": False,
-                "error": str(e)
-            }
+            return IOResult(False, error=str(e))
     
     def screenshot(
         self,
@@ -314,9 +442,9 @@ class InputController(InputControllerInterface):
         """
         try:
             if region:
-                img = pyautogui.screenshot(region=region)
+                img = self._pa_screenshot(region=region)
             else:
-                img = pyautogui.screenshot()
+                img = self._pa_screenshot()
             
             if filename:
                 img.save(filename)
@@ -330,12 +458,8 @@ class InputController(InputControllerInterface):
                     "success": True,
                     "image": img
                 }
-                
         except Exception as e:
-            return {
-                "success": False,
-                "error": str(e)
-            }
+            return _fail(e)
     
     def get_screen_size(self) -> Dict:
         """
@@ -345,17 +469,14 @@ class InputController(InputControllerInterface):
             Dictionary with screen dimensions
         """
         try:
-            width, height = pyautogui.size()
+            width, height = self._pa_size()
             return {
                 "success": True,
                 "width": width,
                 "height": height
             }
         except Exception as e:
-            return {
-                "success": False,
-                "error": str(e)
-            }
+            return _fail(e)
 
 
 if __name__ == "__main__":
@@ -4,20 +4,299 @@ Language Model Engine using llama.cpp
 This module provides GPU-accelerated LLM inference using llama.cpp.
 """
 
-from llama_cpp import Llama
+import llama_cpp
+from llama_cpp import Llama, LlamaRAMCache
+from llama_cpp.llama_speculative import LlamaPromptLookupDecoding
+import os
+import queue
 import time
 import re
+import asyncio
+import logging
+import threading
+from concurrent.futures import Future
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import AsyncIterator, Callable, Dict, Iterator, List, Optional, Tuple
 import json
-import torch
 from src.config.config_schema import LLMConfig
-from src.utils.logger import get_logger, log_performance, log_timing
+from src.utils.logger import get_logger, log_timing
 from src.utils.retry import retry
 from src.utils.error_handler import handle_error, ErrorType
 from src.interfaces.engines import LLMEngineInterface
 
 
+# KV cache storage types (llama.cpp --cache-type-k/--cache-type-v)
+_KV_CACHE_TYPES = {
+    "f16": llama_cpp.GGML_TYPE_F16,
+    "q8_0": llama_cpp.GGML_TYPE_Q8_0,
+    "q4_0": llama_cpp.GGML_TYPE_Q4_0,
+}
+
+
+# Qwen-style text tool calls; the closing tag may be cut off by a stop sequence
+_TOOL_CALL_TAG = '<tool_call>'
+_TOOL_CALL_BLOCK_RE = re.compile(r'<tool_call>.*?(?:</tool_call>|$)', re.DOTALL)
+_JSON_START_RE = re.compile(r'\s*')
+_JSON_DECODER = json.JSONDecoder()
+
+
+def _detect_cpu_threads(limit: int = 16) -> int:
+    """
+    Detect the number of CPU cores available to this process.
+    
+    Uses the scheduler affinity mask where supported so containers and
+    pinned processes don't oversubscribe, capped at ``limit``.
+    """
+    try:
+        cores = len(os.sched_getaffinity(0))
+    except AttributeError:
+        cores = os.cpu_count() or 8
+    return max(1, min(limit, cores))
+
+
+def _token_metrics(
+    start_ns: int,
+    first_token_ns: Optional[int],
+    end_ns: int,
+    prefill_tokens: Optional[int],
+    decode_tokens: int
+) -> Dict:
+    """
+    Build token-granular latency metrics for one request.
+    
+    TTFT (time to first token) covers prefill; TPOT (time per output token)
+    covers decode. Reporting them separately shows which phase to tune.
+    
+    Args:
+        start_ns: perf_counter_ns() before the request
+        first_token_ns: perf_counter_ns() when the first token arrived (None if unknown)
+        end_ns: perf_counter_ns() after the last token
+        prefill_tokens: Prompt tokens processed (None if unknown)
+        decode_tokens: Tokens generated
+        
+    Returns:
+        Dictionary with time, tokens_per_second, ttft_ms, tpot_ms,
+        prefill_tokens and decode_tokens
+    """
+    elapsed = (end_ns - start_ns) / 1e9
+    ttft_ms = None
+    tpot_ms = None
+    if first_token_ns is not None:
+        ttft_ms = (first_token_ns - start_ns) / 1e6
+        if decode_tokens > 1:
+            tpot_ms = (end_ns - first_token_ns) / 1e6 / (decode_tokens - 1)
+    return {
+        'time': elapsed,
+        'tokens_per_second': decode_tokens / elapsed if elapsed > 0 else 0,
+        'ttft_ms': ttft_ms,
+        'tpot_ms': tpot_ms,
+        'prefill_tokens': prefill_tokens,
+        'decode_tokens': decode_tokens
+    }
+
+
+def parse_tool_calls(content: str, logger) -> Tuple[str, List[Dict]]:
+    """
+    Parse function calls embedded in model text output.
+    
+    Handles the ``<tool_call>{...}</tool_call>`` format emitted by Qwen-style
+    chat templates, including calls cut off by a ``</tool_call>`` stop sequence.
+    
+    Args:
+        content: Raw assistant message content
+        logger: Logger for parse warnings
+        
+    Returns:
+        Tuple of (content with tool calls removed, list of function calls)
+    """
+    # Most replies contain no tool call; skip the parser entirely
+    if not content or _TOOL_CALL_TAG not in content:
+        return content, []
+    
+    function_calls = []
+    pos = 0
+    while True:
+        tag_start = content.find(_TOOL_CALL_TAG, pos)
+        if tag_start == -1:
+            break
+        pos = tag_start + len(_TOOL_CALL_TAG)
+        json_start = _JSON_START_RE.match(content, pos).end()
+        if not content.startswith('{', json_start):
+            continue
+        
+        # raw_decode stops at the end of the first JSON object, so calls cut
+        # off after the closing brace (no </tool_call>) parse the same way,
+        # and braces inside string arguments are handled correctly
+        try:
+            tool_call_data, pos = _JSON_DECODER.raw_decode(content, json_start)
+        except json.JSONDecodeError:
+            logger.warning(f"Failed to parse tool_call JSON: {content[json_start:json_start + 200]}")
+            continue
+        
+        function_calls.append({
+            'id': f"call_{len(function_calls)}",
+            'function': {
+                'name': tool_call_data.get('name', ''),
+                'arguments': json.dumps(tool_call_data.get('arguments', {}))
+            }
+        })
+    
+    if function_calls:
+        # Remove the tool calls from content so they're not shown to user
+        content = _TOOL_CALL_BLOCK_RE.sub('', content).strip()
+    
+    return content, function_calls
+
+
+async def iterate_in_thread(make_iterator: Callable[[], Iterator]) -> AsyncIterator:
+    """
+    Drive a blocking iterator on a worker thread and yield its items asynchronously.
+    
+    llama.cpp releases the GIL while decoding, so running the iteration on
+    its own thread lets the event loop serve other coroutines between tokens.
+    If the consumer stops early, the worker closes the iterator after the
+    next item.
+    
+    Args:
+        make_iterator: Zero-argument callable returning the blocking iterator
+                       (called on the worker thread)
+        
+    Yields:
+        Items produced by the iterator
+    """
+    loop = asyncio.get_running_loop()
+    items: asyncio.Queue = asyncio.Queue()
+    stopped = threading.Event()
+    done = object()
+    
+    def worker():
+        try:
+            iterator = make_iterator()
+            try:
+                for item in iterator:
+                    loop.call_soon_threadsafe(items.put_nowait, (item, None))
+                    if stopped.is_set():
+                        break
+            finally:
+                close = getattr(iterator, "close", None)
+                if close:
+                    close()
+            loop.call_soon_threadsafe(items.put_nowait, (done, None))
+        except Exception as e:
+            loop.call_soon_threadsafe(items.put_nowait, (done, e))
+    
+    threading.Thread(target=worker, daemon=True).start()
+    try:
+        while True:
+            item, error = await items.get()
+            if item is done:
+                if error is not None:
+                    raise error
+                return
+            yield item
+    finally:
+        stopped.set()
+
+
+class SpeculativeSession:
+    """
+    Chat completion running ahead of the end-of-turn decision.
+    
+    Created by LLMEngine.begin_speculative(). Generation runs on a daemon
+    thread and buffers its output; commit() waits for and returns the text,
+    cancel() stops generation after the current token.
+    """
+    
+    def __init__(
+        self,
+        engine: "LLMEngine",
+        messages: List[Dict[str, str]],
+        max_tokens: int,
+        temperature: float
+    ):
+        self.messages = [dict(m) for m in messages]
+        self._engine = engine
+        self._max_tokens = max_tokens
+        self._temperature = temperature
+        self._cancelled = threading.Event()
+        self._future: Future = Future()
+        # Token metrics (as in stream_chat's final chunk), set once generation finishes
+        self.metrics: Optional[Dict] = None
+        self._start_ns = time.perf_counter_ns()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+    
+    def _run(self):
+        """Generate into the buffer until done or cancelled."""
+        parts = []
+        first_token_ns = None
+        try:
+            with self._engine._lock:
+                if self._cancelled.is_set():
+                    self._future.set_result(None)
+                    return
+                messages, max_tokens, prompt_tokens, prompt_ids = self._engine._fit_kv_budget(self.messages, self._max_tokens)
+                stream = self._engine._stream_chat_deltas(
+                    messages,
+                    prompt_ids=prompt_ids,
+                    max_tokens=max_tokens,
+                    temperature=self._temperature
+                )
+                try:
+                    for delta in stream:
+                        if self._cancelled.is_set():
+                            break
+                        if first_token_ns is None:
+                            first_token_ns = time.perf_counter_ns()
+                        parts.append(delta)
+                finally:
+                    # Closing the generator stops llama.cpp from decoding further tokens
+                    stream.close()
+                end_ns = time.perf_counter_ns()
+                text = ''.join(parts)
+                decode_tokens = self._engine._count_decode_tokens(text)
+            if self._cancelled.is_set():
+                self._future.set_result(None)
+                return
+            self.metrics = _token_metrics(
+                self._start_ns,
+                first_token_ns,
+                end_ns,
+                prompt_tokens if prompt_ids is not None else None,
+                decode_tokens
+            )
+            self.metrics['kv_tokens_used'] = prompt_tokens + decode_tokens
+            self._future.set_result(text)
+        except Exception as e:
+            self._future.set_exception(e)
+    
+    def matches(self, messages: List[Dict[str, str]]) -> bool:
+        """Check whether this session was started from the given messages."""
+        return self.messages == messages
+    
+    def commit(self, timeout: Optional[float] = None) -> Optional[str]:
+        """
+        Wait for the speculative response.
+        
+        Args:
+            timeout: Maximum seconds to wait (None = until finished)
+            
+        Returns:
+            Generated text, or None if the session was cancelled
+        """
+        return self._future.result(timeout)
+    
+    def cancel(self):
+        """Stop generation and wait for the worker to release the model."""
+        self._cancelled.set()
+        self._thread.join()
+    
+    @property
+    def done(self) -> bool:
+        """Whether generation has finished."""
+        return self._future.done()
+
+
 class LLMEngine(LLMEngineInterface):
     """
     Language Model engine using llama.cpp.
@@ -52,30 +331,52 @@ class LLMEngine(LLMEngineInterface):
             n_ctx = config.n_ctx
             n_batch = config.n_batch
             verbose = config.verbose
+            prompt_cache_mb = config.prompt_cache_mb
+            max_kv_tokens = config.max_kv_tokens_per_request
         else:
             # Require model_path if no config
             if model_path is None:
                 raise ValueError("model_path is required if config is not provided")
             n_gpu_layers = n_gpu_layers if n_gpu_layers is not None else -1
             n_ctx = n_ctx if n_ctx is not None else 4096
-            n_batch = n_batch if n_batch is not None else 512
+            n_batch = n_batch if n_batch is not None else 2048
             verbose = verbose if verbose is not None else False
+            prompt_cache_mb = 2048
+            max_kv_tokens = None
         
         if not Path(model_path).exists():
             raise FileNotFoundError(f"Model file not found: {model_path}")
         
         self.logger = get_logger(__name__)
+        # llama.cpp contexts are not thread-safe; serialize all inference calls
+        self._lock = threading.Lock()
+        self._speculative: Optional["SpeculativeSession"] = None
+        # Chat template (compiled lazily) and tokenized conversation prefix cache
+        self._template = False
+        self._template_added_bos = False
+        self._bos_text = ""
+        self._eos_text = ""
+        self._prefix_key: Optional[int] = None
+        self._prefix_text = ""
+        self._prefix_ids: List[int] = []
+        # Per-request KV budget (prompt + output tokens); never more than the context
+        self.max_kv_tokens = min(max_kv_tokens or n_ctx, n_ctx)
         self.logger.info(f"Loading LLM from: {model_path}")
         self.logger.debug(f"  GPU layers: {n_gpu_layers} ({'all' if n_gpu_layers == -1 else n_gpu_layers} layers)")
         self.logger.debug(f"  Context size: {n_ctx}")
         self.logger.debug(f"  Batch size: {n_batch}")
+        self.logger.debug(f"  KV tokens per request: {self.max_kv_tokens}")
         
         try:
             with log_timing("LLM model loading", self.logger):
                 # Get optimization parameters from config if available
-                n_threads = config.n_threads if config and hasattr(config, 'n_threads') else 8
-                use_mmap = config.use_mmap if config and hasattr(config, 'use_mmap') else True
-                n_threads_batch = config.n_threads_batch if config and hasattr(config, 'n_threads_batch') else 8
+                n_threads = config.n_threads if config and config.n_threads else _detect_cpu_threads()
+                use_mmap = config.use_mmap if config else True
+                n_threads_batch = config.n_threads_batch if config and config.n_threads_batch else n_threads
+                n_ubatch = config.n_ubatch if config else 512
+                num_pred_tokens = config.num_pred_tokens if config else 0
+                kv_cache_type = config.kv_cache_type if config else "f16"
+                flash_attn = config.flash_attn if config else True
                 
                 # Build Llama initialization kwargs
                 llama_kwargs = {
@@ -83,17 +384,52 @@ class LLMEngine(LLMEngineInterface):
                     "n_gpu_layers": n_gpu_layers,
                     "n_ctx": n_ctx,
                     "n_batch": n_batch,
+                    "n_ubatch": n_ubatch,
                     "verbose": verbose,
                     "n_threads": n_threads,
                     "use_mmap": use_mmap,
-                    "n_threads_batch": n_threads_batch
+                    "n_threads_batch": n_threads_batch,
+                    "flash_attn": flash_attn
                 }
                 
+                if kv_cache_type != "f16":
+                    # Quantized KV cache halves (q8_0) or quarters (q4_0) bytes read per
+                    # decoded token; llama.cpp requires flash attention for a quantized V cache
+                    ggml_type = _KV_CACHE_TYPES[kv_cache_type]
+                    llama_kwargs["type_k"] = ggml_type
+                    llama_kwargs["type_v"] = ggml_type
+                    llama_kwargs["flash_attn"] = True
+                    self.logger.debug(f"  KV cache type: {kv_cache_type}")
+                self.logger.debug(f"  Flash attention: {llama_kwargs['flash_attn']}")
+                
+                if num_pred_tokens > 0:
+                    # Speculative decoding: draft tokens by n-gram lookup in the prompt,
+                    # then verify them in one batched forward pass
+                    llama_kwargs["draft_model"] = LlamaPromptLookupDecoding(num_pred_tokens=num_pred_tokens)
+                    self.logger.debug(f"  Speculative decoding: prompt lookup ({num_pred_tokens} draft tokens)")
+                
+                self.logger.debug(f"  Micro-batch size: {n_ubatch}")
                 self.logger.debug(f"  CPU threads: {n_threads}")
                 self.logger.debug(f"  Use mmap: {use_mmap}")
                 self.logger.debug(f"  Batch threads: {n_threads_batch}")
                 
-                self.llm = Llama(**llama_kwargs)
+                try:
+                    self.llm = self._load_model(**llama_kwargs)
+                except ValueError as e:
+                    # Not every backend/GPU supports quantized KV or flash attention;
+                    # llama.cpp reports that as a failed context ("Failed to create
+                    # llama_context"), so retry without them. Other errors (e.g. an
+                    # unreadable GGUF) would only fail again.
+                    if not llama_kwargs["flash_attn"] or "context" not in str(e).lower():
+                        raise
+                    self.logger.warning(
+                        f"Could not create context with {kv_cache_type} KV cache and flash attention ({e}), "
+                        f"falling back to f16 without flash attention"
+                    )
+                    for key in ("type_k", "type_v", "flash_attn"):
+                        llama_kwargs.pop(key, None)
+                    kv_cache_type = "f16"
+                    self.llm = self._load_model(**llama_kwargs)
             self.logger.info("LLM loaded successfully!")
             
             # Store configuration
@@ -101,6 +437,9 @@ class LLMEngine(LLMEngineInterface):
             self.n_gpu_layers = n_gpu_layers
             self.n_ctx = n_ctx
             self.n_batch = n_batch
+            self.kv_cache_type = kv_cache_type
+            
+            self._enable_prompt_cache(prompt_cache_mb)
             
             # Verify GPU utilization
             self.verify_gpu_utilization()
@@ -112,15 +451,21 @@ class LLMEngine(LLMEngineInterface):
             if error_info["error_type"] == ErrorType.RESOURCE and "gpu" in str(e).lower():
                 self.logger.warning("GPU error detected, attempting CPU fallback...")
                 try:
-                    self.llm = Llama(
+                    self.llm = self._load_model(
                         model_path=model_path,
                         n_gpu_layers=0,  # Force CPU
                         n_ctx=n_ctx,
                         n_batch=n_batch,
-                        verbose=verbose
+                        verbose=verbose,
+                        flash_attn=config.flash_attn if config else True
                     )
                     self.logger.info("LLM loaded successfully on CPU (GPU fallback)")
+                    self.model_path = model_path
                     self.n_gpu_layers = 0
+                    self.n_ctx = n_ctx
+                    self.n_batch = n_batch
+                    self.kv_cache_type = "f16"
+                    self._enable_prompt_cache(prompt_cache_mb)
                     return
                 except Exception as fallback_error:
                     self.logger.error(f"CPU fallback also failed: {fallback_error}")
@@ -128,8 +473,250 @@ class LLMEngine(LLMEngineInterface):
             self.logger.error(f"Error loading LLM: {error_info['message']}", exc_info=True)
             raise
     
-    @log_performance("LLM Generation")
     @retry(max_retries=2, initial_delay=0.5, retryable_exceptions=(RuntimeError,))
+    def _load_model(self, **llama_kwargs) -> Llama:
+        """
+        Construct the llama.cpp model.
+        
+        Retries live here rather than on generate/chat: a transient failure
+        while allocating the model is worth retrying, whereas re-running a
+        multi-second decode after a mid-generation error only adds latency.
+        
+        Args:
+            **llama_kwargs: Keyword arguments for Llama()
+            
+        Returns:
+            Loaded Llama instance
+        """
+        return Llama(**llama_kwargs)
+    
+    def _enable_prompt_cache(self, capacity_mb: int):
+        """
+        Attach an in-memory prompt (KV state) cache to the model.
+        
+        The system prompt and tool definitions are identical on every call,
+        so caching the evaluated prefix lets llama.cpp skip re-running prefill
+        for those tokens on later turns.
+        
+        Args:
+            capacity_mb: Cache capacity in megabytes (0 disables caching)
+        """
+        if capacity_mb <= 0:
+            self.logger.debug("Prompt cache disabled")
+            return
+        self.llm.set_cache(LlamaRAMCache(capacity_bytes=capacity_mb << 20))
+        self.logger.debug(f"  Prompt cache: {capacity_mb} MB")
+    
+    def _chat_template(self):
+        """
+        Compile the model's Jinja chat template once.
+        
+        Returns:
+            Compiled template, or None if the model has no usable template
+        """
+        if self._template is False:
+            template_src = self.llm.metadata.get("tokenizer.chat_template")
+            self._template = None
+            if template_src:
+                try:
+                    from jinja2.sandbox import ImmutableSandboxedEnvironment
+                    env = ImmutableSandboxedEnvironment(trim_blocks=True, lstrip_blocks=True)
+                    self._template = env.from_string(template_src)
+                    self._template_added_bos = "bos_token" in template_src
+                    self._bos_text = self.llm.detokenize([self.llm.token_bos()]).decode("utf-8", errors="ignore")
+                    self._eos_text = self.llm.detokenize([self.llm.token_eos()]).decode("utf-8", errors="ignore")
+                except Exception as e:
+                    self.logger.debug(f"Chat template unavailable, using create_chat_completion: {e}")
+        return self._template
+    
+    def _render_chat(
+        self,
+        messages: List[Dict[str, str]],
+        add_generation_prompt: bool,
+        tools: Optional[List[Dict]] = None
+    ) -> str:
+        """Render messages (and tool definitions, if any) with the model's chat template."""
+        return self._template.render(
+            messages=messages,
+            tools=tools,
+            bos_token=self._bos_text,
+            eos_token=self._eos_text,
+            add_generation_prompt=add_generation_prompt
+        )
+    
+    def _chat_prompt_ids(
+        self,
+        messages: List[Dict[str, str]],
+        tools: Optional[List[Dict]] = None
+    ) -> Optional[List[int]]:
+        """
+        Tokenize a chat prompt, reusing the cached tokenization of its history.
+        
+        The conversation prefix (every message but the last) is rendered and
+        tokenized once and cached by content; later calls with the same
+        history - e.g. speculative restarts as the partial user turn grows -
+        only tokenize the new tail.
+        
+        Args:
+            messages: Conversation messages
+            tools: Tool definitions rendered into the prompt (optional)
+            
+        Returns:
+            Prompt token IDs, or None to fall back to create_chat_completion
+        """
+        if self._chat_template() is None:
+            return None
+        try:
+            tools_key = json.dumps(tools, sort_keys=True) if tools else None
+            prefix_key = hash((tools_key, tuple((m['role'], m['content']) for m in messages[:-1])))
+            if prefix_key != self._prefix_key:
+                prefix_text = (
+                    self._render_chat(messages[:-1], add_generation_prompt=False, tools=tools)
+                    if len(messages) > 1 else ""
+                )
+                self._prefix_text = prefix_text
+                self._prefix_ids = self.llm.tokenize(
+                    prefix_text.encode("utf-8"),
+                    add_bos=not self._template_added_bos,
+                    special=True
+                )
+                self._prefix_key = prefix_key
+            
+            full_text = self._render_chat(messages, add_generation_prompt=True, tools=tools)
+            if not self._prefix_text or not full_text.startswith(self._prefix_text):
+                return self.llm.tokenize(full_text.encode("utf-8"), add_bos=not self._template_added_bos, special=True)
+            tail = full_text[len(self._prefix_text):]
+            return self._prefix_ids + self.llm.tokenize(tail.encode("utf-8"), add_bos=False, special=True)
+        except Exception as e:
+            self.logger.debug(f"Chat template rendering failed, using create_chat_completion: {e}")
+            return None
+    
+    def _count_decode_tokens(self, text: str) -> int:
+        """
+        Count the tokens in generated text.
+        
+        Streamed chunks don't map 1:1 to tokens (empty finish chunks,
+        stop-sequence hold-back, merged multibyte characters), so the
+        joined output is re-tokenized instead.
+        """
+        if not text:
+            return 0
+        return len(self.llm.tokenize(text.encode("utf-8"), add_bos=False, special=True))
+    
+    def _count_prompt_tokens(
+        self,
+        messages: List[Dict[str, str]],
+        tools: Optional[List[Dict]] = None
+    ) -> Tuple[int, Optional[List[int]]]:
+        """
+        Count the prompt tokens a chat request will occupy in the KV cache.
+        
+        Args:
+            messages: Conversation messages
+            tools: Tool definitions sent with the request (optional)
+            
+        Returns:
+            Tuple of (token count, prompt token IDs or None if the chat
+            template is unavailable and the count is an estimate)
+        """
+        prompt_ids = self._chat_prompt_ids(messages, tools)
+        if prompt_ids is not None:
+            return len(prompt_ids), prompt_ids
+        text = "\n".join(m.get('content') or '' for m in messages)
+        if tools:
+            text += "\n" + json.dumps(tools)
+        return len(self.llm.tokenize(text.encode("utf-8"))), None
+    
+    def _fit_kv_budget(
+        self,
+        messages: List[Dict[str, str]],
+        max_tokens: int,
+        tools: Optional[List[Dict]] = None
+    ) -> Tuple[List[Dict[str, str]], int, int, Optional[List[int]]]:
+        """
+        Make a chat request fit the per-request KV budget.
+        
+        Drops the oldest non-system messages (never the last one) until
+        prompt + max_tokens fits, then shortens max_tokens if needed.
+        
+        Args:
+            messages: Conversation messages
+            max_tokens: Requested output tokens
+            tools: Tool definitions sent with the request; they count
+                   toward the prompt (optional)
+            
+        Returns:
+            Tuple of (messages, max_tokens, prompt tokens, prompt token IDs or None)
+            
+        Raises:
+            ValueError: If the system prompt and last message alone exceed the budget
+        """
+        budget = self.max_kv_tokens
+        prompt_tokens, prompt_ids = self._count_prompt_tokens(messages, tools)
+        if prompt_tokens + max_tokens <= budget:
+            return messages, max_tokens, prompt_tokens, prompt_ids
+        
+        original_count = len(messages)
+        messages = list(messages)
+        while prompt_tokens + max_tokens > budget:
+            droppable = next(
+                (i for i, m in enumerate(messages[:-1]) if m.get('role') != 'system'),
+                None
+            )
+            if droppable is None:
+                break
+            del messages[droppable]
+            # Keep the history starting on a user turn; many chat templates require it
+            while droppable < len(messages) - 1 and messages[droppable].get('role') != 'user':
+                del messages[droppable]
+            prompt_tokens, prompt_ids = self._count_prompt_tokens(messages, tools)
+        
+        if prompt_tokens >= budget:
+            raise ValueError(f"Prompt needs {prompt_tokens} tokens; KV budget per request is {budget}")
+        if prompt_tokens + max_tokens > budget:
+            max_tokens = budget - prompt_tokens
+        self.logger.warning(
+            f"KV budget {budget}: dropped {original_count - len(messages)} oldest message(s), "
+            f"prompt {prompt_tokens} tokens, max_tokens {max_tokens}"
+        )
+        return messages, max_tokens, prompt_tokens, prompt_ids
+    
+    def _stream_chat_deltas(
+        self,
+        messages: List[Dict[str, str]],
+        prompt_ids: Optional[List[int]] = None,
+        **kwargs
+    ):
+        """
+        Stream a chat completion as plain text deltas.
+        
+        Must be called with self._lock held.
+        
+        Args:
+            messages: Conversation messages
+            prompt_ids: Already tokenized prompt for these messages (optional)
+            **kwargs: Sampling arguments (max_tokens, temperature, top_p, stop)
+            
+        Yields:
+            Non-empty text deltas
+        """
+        if prompt_ids is None:
+            prompt_ids = self._chat_prompt_ids(messages)
+        if prompt_ids is not None:
+            stream = self.llm.create_completion(prompt=prompt_ids, stream=True, **kwargs)
+            key = 'text'
+        else:
+            stream = self.llm.create_chat_completion(messages=messages, stream=True, **kwargs)
+            key = None
+        try:
+            for chunk in stream:
+                choice = chunk['choices'][0]
+                delta = choice[key] if key else choice['delta'].get('content')
+                if delta:
+                    yield delta
+        finally:
+            stream.close()
+    
     def generate(
         self,
         prompt: str,
@@ -158,14 +745,33 @@ class LLMEngine(LLMEngineInterface):
                 'text': str,                    # Generated text
                 'tokens': int,                   # Number of tokens generated
                 'time': float,                   # Generation time in seconds
-                'tokens_per_second': float       # Generation speed
+                'tokens_per_second': float,      # Generation speed
+                'ttft_ms': float,                # Time to first token (prefill)
+                'tpot_ms': float,                # Time per output token (decode)
+                'prefill_tokens': int,           # Prompt tokens
+                'decode_tokens': int,            # Same as 'tokens'
+                'kv_tokens_used': int            # Prompt + generated tokens held in the KV cache
             }
+            
+        Raises:
+            ValueError: If the prompt alone exceeds the per-request KV budget
         """
         self.logger.debug(f"Generating text (max_tokens={max_tokens}, temp={temperature})")
-        self.logger.debug(f"Prompt: '{prompt[:100]}{'...' if len(prompt) > 100 else ''}'")
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug(f"Prompt: '{prompt[:100]}{'...' if len(prompt) > 100 else ''}'")
         
-        try:
-            response = self.llm(
+        start_ns = time.perf_counter_ns()
+        first_token_ns = None
+        parts = []
+        with self._lock:
+            prefill_tokens = len(self.llm.tokenize(prompt.encode("utf-8")))
+            if prefill_tokens >= self.max_kv_tokens:
+                raise ValueError(
+                    f"Prompt needs {prefill_tokens} tokens; KV budget per request is {self.max_kv_tokens}"
+                )
+            max_tokens = min(max_tokens, self.max_kv_tokens - prefill_tokens)
+            # Stream internally so the first token's arrival can be timed
+            for chunk in self.llm(
                 prompt,
                 max_tokens=max_tokens,
                 temperature=temperature,
@@ -173,34 +779,38 @@ class LLMEngine(LLMEngineInterface):
                 top_k=top_k,
                 repeat_penalty=repeat_penalty,
                 stop=stop,
-                echo=False
-            )
-            
-            text = response['choices'][0]['text']
-            tokens = response['usage']['completion_tokens']
-            
-            result = {
-                'text': text.strip(),
-                'tokens': tokens,
-                'time': 0,  # Will be set by decorator
-                'tokens_per_second': 0  # Will be calculated by decorator
-            }
-            
-            self.logger.info(f"Generated {tokens} tokens: '{text[:100]}{'...' if len(text) > 100 else ''}'")
-            
-            return result
-            
-        except Exception as e:
-            error_info = handle_error(
-                e,
-                context={"prompt_length": len(prompt), "max_tokens": max_tokens},
-                logger=self.logger
-            )
-            self.logger.error(f"Error during generation: {error_info['message']}", exc_info=True)
-            raise
+                echo=False,
+                stream=True
+            ):
+                delta = chunk['choices'][0]['text']
+                if not delta:
+                    continue
+                if first_token_ns is None:
+                    first_token_ns = time.perf_counter_ns()
+                parts.append(delta)
+            end_ns = time.perf_counter_ns()
+            text = ''.join(parts)
+            tokens = self._count_decode_tokens(text)
+        
+        # Only pay for strip() when there is surrounding whitespace to remove
+        if text and (text[0] <= ' ' or text[-1] <= ' '):
+            text = text.strip()
+        
+        result = {
+            'text': text,
+            'tokens': tokens,
+            'kv_tokens_used': prefill_tokens + tokens,
+            **_token_metrics(start_ns, first_token_ns, end_ns, prefill_tokens, tokens)
+        }
+        
+        self.logger.info(
+            f"Generated {tokens} tokens in {result['time']:.3f}s "
+            f"(ttft={result['ttft_ms'] or 0:.0f}ms, tpot={result['tpot_ms'] or 0:.1f}ms): "
+            f"'{text[:100]}{'...' if len(text) > 100 else ''}'"
+        )
+        
+        return result
     
-    @log_performance("LLM Chat")
-    @retry(max_retries=2, initial_delay=0.5, retryable_exceptions=(RuntimeError,))
     def chat(
         self,
         messages: List[Dict[str, str]],
@@ -229,31 +839,57 @@ class LLMEngine(LLMEngineInterface):
                 'time': float,                  # Generation time
                 'tokens': int,                  # Tokens generated
                 'tokens_per_second': float,     # Generation speed
+                'ttft_ms': float,               # Time to first token (None when tools are used)
+                'tpot_ms': float,               # Time per output token (None when tools are used)
+                'prefill_tokens': int,          # Prompt tokens (None if unknown)
+                'decode_tokens': int,           # Same as 'tokens'
+                'kv_tokens_used': int,          # Prompt + generated tokens held in the KV cache
                 'function_calls': List[Dict]    # List of function calls if any
             }
+            
+        Raises:
+            ValueError: If the system prompt and last message alone exceed the per-request KV budget
         """
         self.logger.debug(f"Chat completion (messages={len(messages)}, max_tokens={max_tokens}, tools={len(tools) if tools else 0})")
         
         try:
-            # Prepare chat completion kwargs
-            completion_kwargs = {
-                "messages": messages,
-                "max_tokens": max_tokens,
-                "temperature": temperature,
-                "top_p": top_p
-            }
-            
-            if stop:
-                completion_kwargs["stop"] = stop
-            
-            if tools:
-                completion_kwargs["tools"] = tools
-            
-            response = self.llm.create_chat_completion(**completion_kwargs)
-            
-            message = response['choices'][0]['message']
-            content = message.get('content', '')
-            tokens = response['usage']['completion_tokens']
+            start_ns = time.perf_counter_ns()
+            first_token_ns = None
+            with self._lock:
+                messages, max_tokens, prompt_tokens, prompt_ids = self._fit_kv_budget(messages, max_tokens, tools)
+                
+                # Prepare chat completion kwargs
+                completion_kwargs = {
+                    "messages": messages,
+                    "max_tokens": max_tokens,
+                    "temperature": temperature,
+                    "top_p": top_p
+                }
+                
+                if stop:
+                    completion_kwargs["stop"] = stop
+                
+                if tools:
+                    # Structured tool_calls are only returned by a non-streamed completion
+                    response = self.llm.create_chat_completion(tools=tools, **completion_kwargs)
+                    
+                    message = response['choices'][0]['message']
+                    content = message.get('content', '')
+                    tokens = response['usage']['completion_tokens']
+                    prefill_tokens = response['usage']['prompt_tokens']
+                else:
+                    # Stream internally so the first token's arrival can be timed
+                    parts = []
+                    for delta in self._stream_chat_deltas(prompt_ids=prompt_ids, **completion_kwargs):
+                        if first_token_ns is None:
+                            first_token_ns = time.perf_counter_ns()
+                        parts.append(delta)
+                    message = {}
+                    content = ''.join(parts)
+                    tokens = self._count_decode_tokens(content)
+                    prefill_tokens = prompt_tokens if prompt_ids is not None else None
+            end_ns = time.perf_counter_ns()
+            self.logger.debug(f"Prompt tokens: {prefill_tokens}")
             
             # Check for function calls
             function_calls = []
@@ -269,68 +905,14 @@ class LLMEngine(LLMEngineInterface):
                     })
             else:
                 # Parse function calls from text content (llama.cpp format)
-                # Look for <tool_call>...</tool_call> tags
-                # Also handle incomplete tool calls (when stop sequence cuts off closing tag)
-                tool_call_pattern = r'<tool_call>\s*(\{.*?\})\s*(?:</tool_call>|$)'
-                matches = re.findall(tool_call_pattern, content, re.DOTALL)
-                for match in matches:
-                    try:
-                        tool_call_data = json.loads(match)
-                        function_calls.append({
-                            'id': f"call_{len(function_calls)}",
-                            'function': {
-                                'name': tool_call_data.get('name', ''),
-                                'arguments': json.dumps(tool_call_data.get('arguments', {}))
-                            }
-                        })
-                        # Remove the tool_call from content so it's not shown to user
-                        content = re.sub(r'<tool_call>.*?(?:</tool_call>|$)', '', content, flags=re.DOTALL).strip()
-                    except json.JSONDecodeError:
-                        self.logger.warning(f"Failed to parse tool_call JSON: {match}")
-                        continue
-                
-                # Also try to parse if we see <tool_call> but no closing tag (stop sequence case)
-                if not function_calls and '<tool_call>' in content:
-                    # Extract JSON after <tool_call> tag
-                    tool_call_start = content.find('<tool_call>')
-                    if tool_call_start != -1:
-                        json_start = content.find('{', tool_call_start)
-                        if json_start != -1:
-                            # Try to extract complete JSON (may be cut off by stop sequence)
-                            json_text = content[json_start:]
-                            # Try to find closing brace
-                            brace_count = 0
-                            json_end = -1
-                            for i, char in enumerate(json_text):
-                                if char == '{':
-                                    brace_count += 1
-                                elif char == '}':
-                                    brace_count -= 1
-                                    if brace_count == 0:
-                                        json_end = i + 1
-                                        break
-                            
-                            if json_end > 0:
-                                try:
-                                    tool_call_data = json.loads(json_text[:json_end])
-                                    function_calls.append({
-                                        'id': f"call_{len(function_calls)}",
-                                        'function': {
-                                            'name': tool_call_data.get('name', ''),
-                                            'arguments': json.dumps(tool_call_data.get('arguments', {}))
-                                        }
-                                    })
-                                    # Remove the tool_call from content
-                                    content = re.sub(r'<tool_call>.*?$', '', content, flags=re.DOTALL).strip()
-                                except json.JSONDecodeError:
-                                    self.logger.warning(f"Failed to parse incomplete tool_call JSON: {json_text[:json_end]}")
+                content, function_calls = parse_tool_calls(content, self.logger)
             
             result = {
                 'response': content.strip() if content else '',
-                'time': 0,  # Will be set by decorator
                 'tokens': tokens,
-                'tokens_per_second': 0,  # Will be calculated by decorator
-                'function_calls': function_calls
+                'kv_tokens_used': (prefill_tokens or prompt_tokens) + tokens,
+                'function_calls': function_calls,
+                **_token_metrics(start_ns, first_token_ns, end_ns, prefill_tokens, tokens)
             }
             
             if function_calls:
@@ -338,7 +920,10 @@ class LLMEngine(LLMEngineInterface):
                 for fc in function_calls:
                     self.logger.debug(f"  Function call: {fc['function']['name']}")
             else:
-                self.logger.info(f"Chat response: {tokens} tokens")
+                self.logger.info(
+                    f"Chat response: {tokens} tokens in {result['time']:.3f}s "
+                    f"(ttft={result['ttft_ms'] or 0:.0f}ms, tpot={result['tpot_ms'] or 0:.1f}ms)"
+                )
                 self.logger.debug(f"Response: '{content[:100]}{'...' if len(content) > 100 else ''}'")
             
             return result
@@ -356,52 +941,230 @@ class LLMEngine(LLMEngineInterface):
         self,
         messages: List[Dict[str, str]],
         max_tokens: int = 256,
-        temperature: float = 0.7
+        temperature: float = 0.7,
+        include_full_text: bool = False
     ):
         """
         Stream chat completion (generator).
         
+        Tokens are generated on a worker thread that holds the model lock;
+        the caller's thread never holds it between chunks, so other engine
+        calls work even if iteration is abandoned or raises mid-stream.
+        
         Args:
             messages: List of message dictionaries
             max_tokens: Maximum tokens to generate
             temperature: Sampling temperature
+            include_full_text: Include the running 'text' in every chunk.
+                               Off by default; the full text is always
+                               included in the final chunk.
             
         Yields:
             Dictionary with partial response:
             {
                 'delta': str,                   # New text chunk
-                'text': str,                    # Full text so far
-                'done': bool                    # Whether generation is complete
+                'text': str,                    # Full text (final chunk, or every chunk if include_full_text)
+                'done': bool,                   # Whether generation is complete
+                'metrics': Dict                 # Final chunk only: ttft_ms, tpot_ms, kv_tokens_used, ...
             }
         """
+        start_ns = time.perf_counter_ns()
+        items: "queue.Queue" = queue.Queue()
+        stopped = threading.Event()
+        
+        def produce():
+            # Generate on a worker thread so the model lock is never held while
+            # the consumer runs; an abandoned or failed consumer can't leave it
+            # locked. Stops after the next token once the consumer goes away.
+            try:
+                with self._lock:
+                    fitted, fitted_max_tokens, prompt_tokens, prompt_ids = self._fit_kv_budget(messages, max_tokens)
+                    stream = self._stream_chat_deltas(
+                        fitted,
+                        prompt_ids=prompt_ids,
+                        max_tokens=fitted_max_tokens,
+                        temperature=temperature
+                    )
+                    parts = []
+                    first_token_ns = None
+                    try:
+                        for delta in stream:
+                            if first_token_ns is None:
+                                first_token_ns = time.perf_counter_ns()
+                            parts.append(delta)
+                            items.put(delta)
+                            if stopped.is_set():
+                                break
+                    finally:
+                        stream.close()
+                    end_ns = time.perf_counter_ns()
+                    text = ''.join(parts)
+                    decode_tokens = self._count_decode_tokens(text)
+                metrics = _token_metrics(
+                    start_ns,
+                    first_token_ns,
+                    end_ns,
+                    prompt_tokens if prompt_ids is not None else None,
+                    decode_tokens
+                )
+                metrics['kv_tokens_used'] = prompt_tokens + decode_tokens
+                # Deltas are strings; the final item is a (text, metrics or error) tuple
+                items.put((text, metrics))
+            except Exception as e:
+                items.put((None, e))
+        
+        threading.Thread(target=produce, daemon=True).start()
         try:
-            stream = self.llm.create_chat_completion(
-                messages=messages,
-                max_tokens=max_tokens,
-                temperature=temperature,
-                stream=True
-            )
-            
-            full_text = ""
-            for chunk in stream:
-                delta = chunk['choices'][0]['delta'].get('content', '')
-                if delta:
-                    full_text += delta
+            # Collect deltas and join once instead of growing a string per token
+            parts = []
+            while True:
+                item = items.get()
+                if isinstance(item, tuple):
+                    break
+                parts.append(item)
+                if include_full_text:
+                    yield {
+                        'delta': item,
+                        'text': ''.join(parts),
+                        'done': False
+                    }
+                else:
                     yield {
-                        'delta': delta,
-                        'text': full_text,
+                        'delta': item,
                         'done': False
                     }
             
+            text, metrics = item
+            if isinstance(metrics, Exception):
+                raise metrics
+            self.logger.debug(f"Stream complete: ttft={metrics['ttft_ms'] or 0:.0f}ms, tpot={metrics['tpot_ms'] or 0:.1f}ms")
             yield {
                 'delta': '',
-                'text': full_text,
-                'done': True
+                'text': text,
+                'done': True,
+                'metrics': metrics
             }
             
         except Exception as e:
             self.logger.error(f"Error during streaming: {e}", exc_info=True)
             raise
+        finally:
+            stopped.set()
+    
+    async def astream_chat(
+        self,
+        messages: List[Dict[str, str]],
+        max_tokens: int = 256,
+        temperature: float = 0.7,
+        include_full_text: bool = False
+    ) -> AsyncIterator[Dict]:
+        """
+        Async version of stream_chat() for use inside an event loop.
+        
+        Generation runs on a worker thread, so awaiting each chunk does not
+        block other coroutines.
+        
+        Args:
+            messages: List of message dictionaries
+            max_tokens: Maximum tokens to generate
+            temperature: Sampling temperature
+            include_full_text: Include the running 'text' in every chunk
+            
+        Yields:
+            Same chunk dictionaries as stream_chat()
+        """
+        async for chunk in iterate_in_thread(
+            lambda: self.stream_chat(messages, max_tokens, temperature, include_full_text)
+        ):
+            yield chunk
+    
+    def begin_speculative(
+        self,
+        messages: List[Dict[str, str]],
+        max_tokens: int = 256,
+        temperature: float = 0.7
+    ) -> "SpeculativeSession":
+        """
+        Start generating a response before the user's turn is final.
+        
+        Runs a streaming chat completion on a worker thread so prefill and
+        early decode overlap with end-of-turn detection. Any previous
+        speculative session is cancelled first.
+        
+        Args:
+            messages: Conversation so far (including the partial user turn)
+            max_tokens: Maximum tokens to generate
+            temperature: Sampling temperature
+            
+        Returns:
+            SpeculativeSession; call commit() to take the result or cancel()
+            to discard it
+        """
+        if self._speculative is not None:
+            self._speculative.cancel()
+        self._speculative = SpeculativeSession(self, messages, max_tokens, temperature)
+        return self._speculative
+    
+    def stream_chat_speculative(
+        self,
+        get_partial_messages_fn: Callable[[], List[Dict[str, str]]],
+        is_final_fn: Callable[[], bool],
+        max_tokens: int = 256,
+        temperature: float = 0.7,
+        poll_interval: float = 0.05
+    ):
+        """
+        Stream a chat response, speculating on partial user input.
+        
+        While ``is_final_fn()`` is False, a speculative session is (re)started
+        whenever ``get_partial_messages_fn()`` changes. Once the turn is final,
+        the speculative result is used if it was started from the final
+        messages; otherwise it is cancelled and a normal stream is started.
+        
+        Args:
+            get_partial_messages_fn: Returns the current conversation messages
+            is_final_fn: Returns True once the user has finished speaking
+            max_tokens: Maximum tokens to generate
+            temperature: Sampling temperature
+            poll_interval: Seconds between turn-taking checks
+            
+        Yields:
+            Dictionary with partial response (same format as stream_chat)
+        """
+        session = None
+        while not is_final_fn():
+            messages = get_partial_messages_fn()
+            if session is None or not session.matches(messages):
+                session = self.begin_speculative(messages, max_tokens, temperature)
+            time.sleep(poll_interval)
+        
+        messages = get_partial_messages_fn()
+        if session is not None and session.matches(messages):
+            text = session.commit()
+            self._speculative = None
+            if text is not None:
+                self.logger.debug("Speculative session committed")
+                if text:
+                    yield {
+                        'delta': text,
+                        'done': False
+                    }
+                yield {
+                    'delta': '',
+                    'text': text,
+                    'done': True,
+                    'metrics': session.metrics
+                }
+                return
+            # Cancelled elsewhere (e.g. by another begin_speculative); generate normally
+            self.logger.debug("Speculative session was cancelled; streaming normally")
+            session = None
+        
+        if session is not None:
+            self.logger.debug("Speculative session discarded (input changed)")
+            session.cancel()
+            self._speculative = None
+        yield from self.stream_chat(messages, max_tokens=max_tokens, temperature=temperature)
     
     def verify_gpu_utilization(self) -> bool:
         """
@@ -446,6 +1209,7 @@ class LLMEngine(LLMEngineInterface):
             "n_gpu_layers": self.n_gpu_layers,
             "n_ctx": self.n_ctx,
             "n_batch": self.n_batch,
+            "kv_cache_type": self.kv_cache_type,
             "context_size": self.n_ctx
         }
 
@@ -8,19 +8,19 @@ voice transcription.
 import sounddevice as sd
 import soundfile as sf
 import numpy as np
-from faster_whisper import WhisperModel
-from collections import deque
 import time
-import tempfile
-import os
-from pathlib import Path
+import io
+import queue
+import threading
 from typing import Dict, Optional, Callable
 
 from src.backend.audio_capture import AudioCapture
 from src.backend.stt_engine import STTEngine
 from src.config.config_schema import STTConfig
-from src.utils.memory_manager import temp_file
-from typing import Optional
+from src.utils.logger import get_logger
+
+# Speech segments allowed to wait for transcription before capture blocks
+_MAX_QUEUED_SEGMENTS = 8
 
 
 class StreamingSTT:
@@ -38,17 +38,21 @@ class StreamingSTT:
         model_size: Optional[str] = None,
         device: Optional[str] = None,
         compute_type: Optional[str] = None,
-        sample_rate: Optional[int] = None
+        sample_rate: Optional[int] = None,
+        stt_engine: Optional[STTEngine] = None
     ):
         """
         Initialize streaming STT.
         
         Args:
             config: STTConfig object (takes precedence over individual params)
-            model_size: Whisper model size
+            model_size: Whisper model size (default: large-v3-turbo on GPU,
+                        whose 4-layer decoder keeps short utterances fast at
+                        near large-v3 accuracy; medium on CPU)
             device: Device ("cuda" or "cpu")
             compute_type: Computation type
             sample_rate: Audio sample rate
+            stt_engine: Already loaded STTEngine to reuse (skips model setup)
         """
         # Use config if provided, otherwise use individual params or defaults
         if config:
@@ -57,34 +61,40 @@ class StreamingSTT:
             compute_type = config.compute_type
             sample_rate = config.sample_rate
         else:
-            model_size = model_size or "medium"
             device = device or "cuda"
+            model_size = model_size or ("large-v3-turbo" if device == "cuda" else "medium")
             compute_type = compute_type or "float16"
             sample_rate = sample_rate or 16000
         
-        print("Initializing Streaming STT...")
+        self.logger = get_logger(__name__)
+        self.logger.info("Initializing Streaming STT...")
         
-        # Initialize STT engine
-        self.stt_engine = STTEngine(
-            config=config,
-            model_size=model_size,
-            device=device,
-            compute_type=compute_type
-        )
+        # Initialize STT engine (reuse the caller's engine when given)
+        if stt_engine is not None:
+            self.stt_engine = stt_engine
+        else:
+            self.stt_engine = STTEngine(
+                config=config,
+                model_size=model_size,
+                device=device,
+                compute_type=compute_type
+            )
         
         # Initialize audio capture
         self.audio_capture = AudioCapture(sample_rate=sample_rate)
         
         self.sample_rate = sample_rate
         self.is_listening = False
+        self._segment_queue: "queue.Queue[Optional[np.ndarray]]" = queue.Queue(maxsize=_MAX_QUEUED_SEGMENTS)
+        self._worker: Optional[threading.Thread] = None
         
-        print("Streaming STT initialized")
+        self.logger.info("Streaming STT initialized")
     
     def listen_and_transcribe(
         self,
         duration: float = 5.0,
         language: str = "en",
-        beam_size: int = 5
+        beam_size: int = 1
     ) -> Dict:
         """
         Record for specified duration and transcribe.
@@ -92,12 +102,13 @@ class StreamingSTT:
         Args:
             duration: Recording duration in seconds
             language: Language code
-            beam_size: Beam size for transcription
+            beam_size: Beam size for transcription (1 uses the short-clip
+                       fast path for recordings up to 30s)
             
         Returns:
             Dictionary with transcription results
         """
-        print(f"Recording for {duration} seconds...")
+        self.logger.info(f"Recording for {duration} seconds...")
         
         try:
             # Record audio
@@ -109,34 +120,64 @@ class StreamingSTT:
             )
             sd.wait()
             
-            print("Recording complete. Transcribing...")
-            
-            # Save to temp file (faster-whisper needs file path)
-            with temp_file(suffix=".wav") as temp_path:
-                sf.write(str(temp_path), audio, self.sample_rate)
-                
-                # Transcribe
-                result = self.stt_engine.transcribe(
-                    str(temp_path),
-                    language=language,
-                    beam_size=beam_size
-                )
-            
-            # Temp file automatically cleaned up by context manager
+            self.logger.debug("Recording complete. Transcribing...")
             
-            return result
+            # Hand the recording to Whisper in memory (no temp file)
+            return self._transcribe_array(audio, language, beam_size)
             
         except Exception as e:
-            print(f"❌ Error in listen_and_transcribe: {e}")
+            self.logger.error(f"Error in listen_and_transcribe: {e}", exc_info=True)
             raise
     
+    def _transcribe_array(
+        self,
+        audio: np.ndarray,
+        language: str,
+        beam_size: int,
+        on_segment: Optional[Callable] = None,
+        trust_vad: bool = False
+    ) -> Dict:
+        """
+        Transcribe a recorded waveform.
+        
+        Audio at Whisper's 16 kHz rate is passed to the engine as an array;
+        other rates are wrapped in an in-memory WAV so the decoder resamples
+        without touching disk. Greedy (beam_size=1) requests for clips of up
+        to 30s go through STTEngine.transcribe_short.
+        
+        Args:
+            audio: Mono float32 waveform, shape [samples] or [samples, 1]
+            language: Language code
+            beam_size: Beam size for transcription
+            on_segment: Optional callback for each segment as it is decoded
+            trust_vad: Audio is already VAD-gated; skip Whisper's VAD pass
+            
+        Returns:
+            Dictionary with transcription results
+        """
+        audio = audio.reshape(-1)
+        short = beam_size == 1 and len(audio) <= 30 * self.sample_rate
+        
+        if self.sample_rate != 16000:
+            wav = io.BytesIO()
+            sf.write(wav, audio, self.sample_rate, format="WAV", subtype="FLOAT")
+            wav.seek(0)
+            audio = wav
+        
+        if short:
+            return self.stt_engine.transcribe_short(audio, language=language, on_segment=on_segment)
+        return self.stt_engine.transcribe(audio, language=language, beam_size=beam_size,
+                                          on_segment=on_segment, trust_vad=trust_vad)
+    
     def start_listening(
         self,
         on_transcription: Optional[Callable] = None,
         language: str = "en",
-        beam_size: int = 5,
+        beam_size: int = 1,
         speech_threshold: int = 3,
-        silence_threshold: int = 10
+        silence_threshold: int = 10,
+        on_segment: Optional[Callable] = None,
+        result_queue: Optional[queue.Queue] = None
     ):
         """
         Start continuous listening with VAD-triggered transcription.
@@ -144,55 +185,48 @@ class StreamingSTT:
         Args:
             on_transcription: Callback function called with transcription result
             language: Language code
-            beam_size: Beam size for transcription
+            beam_size: Beam size for transcription (1 uses the short-clip
+                       fast path for utterances up to 30s)
             speech_threshold: Frames of speech to trigger recording
             silence_threshold: Frames of silence to end recording
+            on_segment: Optional callback called with each segment
+                        ({"start", "end", "text"}) as soon as it is decoded,
+                        before on_transcription receives the full result
+            result_queue: Optional queue that receives each transcription
+                          result instead of on_transcription, for handlers
+                          that must run on the caller's own thread
+                          (transcription runs on a worker thread)
         """
         if self.is_listening:
-            print("⚠️  Already listening!")
+            self.logger.warning("Already listening!")
             return
         
         self.is_listening = True
         self.on_transcription = on_transcription
+        self.on_segment = on_segment
+        self.result_queue = result_queue
         self.language = language
         self.beam_size = beam_size
         
         # Start audio capture
         self.audio_capture.start()
         
+        # Transcribe on a worker so capture keeps running during decode
+        self._worker = threading.Thread(target=self._transcription_worker, daemon=True)
+        self._worker.start()
+        
         # Define speech end handler
         def on_speech_end(audio_array: np.ndarray):
             """Called when speech segment ends."""
             if not self.is_listening:
                 return
             
-            print(f"\n🎤 Processing speech segment ({len(audio_array) / self.sample_rate:.2f}s)...")
-            
-            try:
-                # Save audio to temp file
-                with temp_file(suffix=".wav") as temp_path:
-                    sf.write(str(temp_path), audio_array, self.sample_rate)
-                    
-                    # Transcribe
-                    result = self.stt_engine.transcribe(
-                        str(temp_path),
-                        language=self.language,
-                        beam_size=self.beam_size
-                    )
-                
-                # Temp file automatically cleaned up by context manager
-                
-                # Call callback
-                if self.on_transcription:
-                    self.on_transcription(result)
-                else:
-                    print(f"📝 Transcription: {result['text']}")
-                
-            except Exception as e:
-                print(f"❌ Transcription error: {e}")
+            self.logger.debug(f"Processing speech segment ({len(audio_array) / self.sample_rate:.2f}s)...")
+            # Usually a view into the capture ring buffer (no copy); the worker releases it once decoded
+            self._segment_queue.put(audio_array)
         
         # Start monitoring speech
-        print("\n🎤 Listening for speech... (Ctrl+C to stop)")
+        self.logger.info("Listening for speech... (Ctrl+C to stop)")
         try:
             self.audio_capture.monitor_speech(
                 speech_threshold=speech_threshold,
@@ -200,18 +234,53 @@ class StreamingSTT:
                 on_speech_end=on_speech_end
             )
         except KeyboardInterrupt:
-            print("\n\nStopping...")
+            self.logger.info("Stopping...")
             self.stop_listening()
     
+    def _transcription_worker(self):
+        """
+        Transcribe queued speech segments until stopped.
+        
+        Each segment is its own utterance and gets its own decode and
+        result; capture keeps queueing segments while a decode runs.
+        """
+        while True:
+            audio = self._segment_queue.get()
+            if audio is None:
+                return
+            
+            try:
+                result = self._transcribe_array(
+                    audio, self.language, self.beam_size, self.on_segment, trust_vad=True
+                )
+                
+                # Hand the result back to the caller's thread, or call the callback here
+                if self.result_queue is not None:
+                    self.result_queue.put(result)
+                elif self.on_transcription:
+                    self.on_transcription(result)
+                else:
+                    self.logger.info(f"Transcription: {result['text']}")
+                
+            except Exception as e:
+                self.logger.error(f"Transcription error: {e}", exc_info=True)
+            finally:
+                self.audio_capture.release_speech(audio)
+    
     def stop_listening(self):
         """Stop continuous listening."""
         if not self.is_listening:
             return
         
-        print("Stopping listening...")
+        self.logger.info("Stopping listening...")
         self.is_listening = False
         self.audio_capture.stop()
-        print("Listening stopped")
+        if self._worker is not None:
+            # Let the worker finish segments already captured, then exit
+            self._segment_queue.put(None)
+            self._worker.join()
+            self._worker = None
+        self.logger.info("Listening stopped")
     
     def transcribe_audio_file(self, audio_path: str, language: str = "en") -> Dict:
         """
@@ -5,10 +5,22 @@ This module provides GPU-accelerated speech transcription using Faster-Whisper,
 which is an optimized implementation of OpenAI's Whisper model.
 """
 
+import os
+
+# Stream-ordered CUDA allocator: frees are reclaimed between utterances without
+# device-wide syncs. Must be set before CTranslate2 initializes CUDA.
+os.environ.setdefault("CT2_CUDA_ALLOCATOR", "cuda_malloc_async")
+
 from faster_whisper import WhisperModel
+import copy
+import hashlib
+import io
+import numpy as np
 import time
+import threading
+from collections import OrderedDict
 from pathlib import Path
-from typing import Dict, Optional
+from typing import BinaryIO, Callable, Dict, Iterator, Optional, Tuple, Union
 from src.config.config_schema import STTConfig
 from src.utils.logger import get_logger, log_performance, log_timing
 from src.utils.retry import retry
@@ -16,8 +28,55 @@ from src.utils.error_handler import handle_error, ErrorType
 from src.utils.memory_manager import get_memory_manager
 from src.interfaces.engines import STTEngineInterface
 
-# Global model cache
-_model_cache: Dict[str, WhisperModel] = {}
+class TransientIOError(OSError):
+    """Transient I/O failure while reading audio; safe to retry."""
+
+
+class CudaLaunchError(RuntimeError):
+    """CUDA kernel launch or driver failure during inference; safe to retry."""
+
+
+# Global model cache (LRU): cache key -> (model, VRAM in GB it occupies; 0 on CPU)
+_model_cache: "OrderedDict[str, Tuple[WhisperModel, float]]" = OrderedDict()
+# Serializes loads so concurrent engines share one model instead of each loading it
+_model_cache_lock = threading.Lock()
+
+# Approximate VRAM (GB) to run each model size at each GPU compute type, beam size 5
+_VRAM_REQUIREMENTS = {
+    "tiny": {"float16": 1.0, "int8_float16": 0.8, "int8": 0.7},
+    "base": {"float16": 1.2, "int8_float16": 0.9, "int8": 0.8},
+    "small": {"float16": 2.0, "int8_float16": 1.5, "int8": 1.3},
+    "medium": {"float16": 3.5, "int8_float16": 2.5, "int8": 2.2},
+    "large-v2": {"float16": 5.0, "int8_float16": 3.5, "int8": 3.0},
+    "large-v3": {"float16": 5.0, "int8_float16": 3.5, "int8": 3.0},
+    "large-v3-turbo": {"float16": 3.0, "int8_float16": 2.0, "int8": 1.8},
+}
+# GPU compute types from highest to lowest precision
+_GPU_COMPUTE_TYPES = ["float32", "float16", "int8_float16", "int8"]
+# Ampere+ (compute capability 8.0): bfloat16 runs at float16 speed without its overflow-prone exponent
+_AMPERE_COMPUTE_TYPES = ["float32", "bfloat16", "int8_bfloat16", "int8"]
+_BF16_EQUIVALENTS = {"float16": "bfloat16", "int8_float16": "int8_bfloat16"}
+# Free VRAM kept back for activations and other models
+_VRAM_HEADROOM_GB = 1.0
+# Arrays up to one Whisper window (30s at 16 kHz) skip the batched pipeline
+_BATCH_MIN_SAMPLES = 30 * 16000
+
+
+def _vram_required_gb(model_size: str, compute_type: str) -> float:
+    """Estimated VRAM (GB) to run a model size at a GPU compute type."""
+    requirements = _VRAM_REQUIREMENTS.get(model_size, _VRAM_REQUIREMENTS["large-v3"])
+    if compute_type == "float32":
+        return requirements["float16"] * 2
+    if compute_type == "bfloat16":
+        return requirements["float16"]
+    if compute_type == "int8_bfloat16":
+        return requirements["int8_float16"]
+    return requirements.get(compute_type, requirements["float16"])
+
+# Recent transcription results keyed by audio hash + decode settings (LRU)
+_transcription_cache: "OrderedDict[tuple, Dict]" = OrderedDict()
+_transcription_cache_lock = threading.Lock()
+_TRANSCRIPTION_CACHE_SIZE = 64
 
 
 class STTEngine(STTEngineInterface):
@@ -28,6 +87,9 @@ class STTEngine(STTEngineInterface):
     accuracy/speed trade-offs.
     """
     
+    # Cap on VRAM (GB) held by cached GPU models; None = limited only by free memory
+    max_vram_gb: Optional[float] = None
+    
     def __init__(
         self,
         config: Optional[STTConfig] = None,
@@ -36,19 +98,29 @@ class STTEngine(STTEngineInterface):
         compute_type: Optional[str] = None,
         num_workers: Optional[int] = None,
         use_cache: bool = True,
-        auto_quantize: bool = True
+        auto_quantize: bool = True,
+        batch_size: Optional[int] = None,
+        device_index: Optional[int] = None,
+        warmup: bool = True,
+        use_tensorrt: Optional[bool] = None
     ):
         """
         Initialize the STT engine.
         
         Args:
             config: STTConfig object (takes precedence over individual params)
-            model_size: Whisper model size (tiny, base, small, medium, large-v2, large-v3)
+            model_size: Whisper model size (tiny, base, small, medium, large-v2, large-v3, large-v3-turbo)
             device: Device to use ("cuda" or "cpu")
             compute_type: Computation type ("float16", "int8", "int8_float16")
             num_workers: Number of workers for processing
             use_cache: Whether to use cached model if available
             auto_quantize: Whether to auto-select quantization based on GPU memory
+            batch_size: 30s chunks decoded per batch for long audio on GPU (0 = off)
+            device_index: CUDA device to load the model on
+            warmup: Run a short silent transcription after loading on GPU so
+                    CUDA kernel setup isn't paid by the first real request
+            use_tensorrt: Run the encoder from a prebuilt TensorRT FP16 engine
+                          (GPU only; falls back to CTranslate2 if unavailable)
         """
         # Use config if provided, otherwise use individual params or defaults
         if config:
@@ -56,63 +128,183 @@ class STTEngine(STTEngineInterface):
             device = config.device
             compute_type = config.compute_type
             num_workers = config.num_workers
+            batch_size = config.batch_size
+            device_index = config.device_index
+            use_tensorrt = config.use_tensorrt
         else:
             # Use provided params or defaults
             model_size = model_size or "medium"
             device = device or "cuda"
             compute_type = compute_type or "float16"
             num_workers = num_workers or 4
+            batch_size = batch_size if batch_size is not None else 8
+            device_index = device_index or 0
+            use_tensorrt = bool(use_tensorrt)
         
         # Store device early for auto-quantization check
         self.device = device
+        self.device_index = device_index
         self.logger = get_logger(__name__)
         
-        # Auto-select quantization if enabled
-        if auto_quantize:
-            compute_type = self._auto_select_quantization(compute_type)
-        
-        # Check cache
-        cache_key = f"{model_size}_{device}_{compute_type}"
-        if use_cache and cache_key in _model_cache:
-            self.logger.info(f"Using cached Whisper {model_size} model")
-            self.model = _model_cache[cache_key]
+        # A shared STT server already holds the model; forward to it instead of loading one
+        remote_socket = os.environ.get("JANE_STT_SOCKET")
+        self.remote = bool(remote_socket)
+        if remote_socket:
+            from src.backend.stt_engine_server import RemoteWhisperModel
+            self.logger.info(f"Using shared STT server at {remote_socket}")
+            self.model = RemoteWhisperModel(remote_socket)
+            # The server applies its own batching
+            batch_size = 0
         else:
-            self.logger.info(f"Loading Whisper {model_size} on {device}...")
-            self.logger.debug(f"  Compute type: {compute_type}")
-            self.logger.debug(f"  Workers: {num_workers}")
+            # Auto-select quantization if enabled
+            if auto_quantize:
+                compute_type = self._auto_select_quantization(compute_type, model_size)
             
-            try:
-                with log_timing(f"Whisper model loading ({model_size})", self.logger):
-                    self.model = WhisperModel(
-                        model_size,
-                        device=device,
-                        compute_type=compute_type,
-                        num_workers=num_workers
-                    )
-                
-                # Cache the model
-                if use_cache:
-                    _model_cache[cache_key] = self.model
-                    self.logger.debug(f"Cached model: {cache_key}")
-                
-                self.logger.info("Whisper model loaded successfully!")
-                
-            except Exception as e:
-                self.logger.error(f"Error loading Whisper model: {e}", exc_info=True)
-                raise
+            # Check cache
+            use_tensorrt = use_tensorrt and device == "cuda"
+            cache_key = f"{model_size}_{device}{device_index}_{compute_type}{'_trt' if use_tensorrt else ''}"
+            with _model_cache_lock:
+                if use_cache and cache_key in _model_cache:
+                    self.logger.info(f"Using cached Whisper {model_size} model")
+                    _model_cache.move_to_end(cache_key)
+                    self.model = _model_cache[cache_key][0]
+                else:
+                    self.logger.info(f"Loading Whisper {model_size} on {device}...")
+                    self.logger.debug(f"  Compute type: {compute_type}")
+                    self.logger.debug(f"  Workers: {num_workers}")
+                    
+                    vram_gb = 0.0
+                    free_before_gb = None
+                    if device == "cuda":
+                        vram_gb = _vram_required_gb(model_size, compute_type)
+                        self._evict_cached_models(vram_gb)
+                        gpu_info = get_memory_manager().get_gpu_memory_info(device_index)
+                        free_before_gb = gpu_info.get("device_free_gb") if gpu_info else None
+                    
+                    try:
+                        with log_timing(f"Whisper model loading ({model_size})", self.logger):
+                            self.model = WhisperModel(
+                                model_size,
+                                device=device,
+                                device_index=device_index,
+                                compute_type=compute_type,
+                                num_workers=num_workers
+                            )
+                        
+                        if use_tensorrt:
+                            from src.backend.whisper_tensorrt import attach_tensorrt_encoder
+                            attach_tensorrt_encoder(self.model, model_size, device_index, compute_type)
+                        
+                        # Cache the model with the VRAM it actually took, when measurable
+                        if use_cache:
+                            if free_before_gb is not None:
+                                gpu_info = get_memory_manager().get_gpu_memory_info(device_index)
+                                if gpu_info and free_before_gb - gpu_info["device_free_gb"] > 0:
+                                    vram_gb = free_before_gb - gpu_info["device_free_gb"]
+                            _model_cache[cache_key] = (self.model, vram_gb)
+                            self.logger.debug(f"Cached model: {cache_key} (~{vram_gb:.1f}GB VRAM)")
+                        
+                        self.logger.info("Whisper model loaded successfully!")
+                        
+                        if warmup and device == "cuda":
+                            self._warmup()
+                        
+                    except Exception as e:
+                        self.logger.error(f"Error loading Whisper model: {e}", exc_info=True)
+                        raise
         
         # Store configuration
         self.model_size = model_size
         self.device = device
         self.compute_type = compute_type
         self.num_workers = num_workers
+        self.use_cache = use_cache
+        self.use_tensorrt = bool(use_tensorrt) and device == "cuda"
+        self.sample_rate = config.sample_rate if config else 16000
+        self._streaming_stt = None
+        self.batch_size = batch_size
+        self.batched_model = self._create_batched_pipeline() if device == "cuda" and batch_size > 0 else None
     
-    def _auto_select_quantization(self, preferred: str) -> str:
+    def _evict_cached_models(self, required_gb: float):
+        """
+        Drop least-recently-used cached GPU models until a new model fits.
+        
+        A model is evicted while cached models plus the new one would exceed
+        max_vram_gb, or free device memory minus headroom is below
+        required_gb. Its VRAM is released once no other engine still holds
+        a reference to it. Caller must hold _model_cache_lock.
+        
+        Args:
+            required_gb: Estimated VRAM of the model about to be loaded
+        """
+        memory_manager = get_memory_manager()
+        while True:
+            gpu_keys = [key for key, (_, vram_gb) in _model_cache.items() if vram_gb > 0]
+            if not gpu_keys:
+                return
+            
+            cached_gb = sum(_model_cache[key][1] for key in gpu_keys)
+            over_budget = self.max_vram_gb is not None and cached_gb + required_gb > self.max_vram_gb
+            gpu_info = memory_manager.get_gpu_memory_info(self.device_index)
+            low_memory = gpu_info is not None and gpu_info["device_free_gb"] - _VRAM_HEADROOM_GB < required_gb
+            if not (over_budget or low_memory):
+                return
+            
+            _, vram_gb = _model_cache.pop(gpu_keys[0])
+            self.logger.info(f"Evicting cached Whisper model {gpu_keys[0]} (~{vram_gb:.1f}GB) to make room")
+            memory_manager.clear_gpu_cache()
+    
+    def _warmup(self):
+        """Decode one second of silence to initialize CUDA kernels and buffers."""
+        try:
+            with log_timing("Whisper warmup", self.logger):
+                segments, _ = self.model.transcribe(
+                    np.zeros(16000, dtype=np.float32),
+                    language="en",
+                    beam_size=1,
+                    vad_filter=False
+                )
+                # Segments are decoded lazily; consume them to run the decoder
+                for _ in segments:
+                    pass
+        except Exception as e:
+            self.logger.warning(f"Whisper warmup failed: {e}")
+    
+    def _create_batched_pipeline(self):
+        """
+        Wrap the model in faster-whisper's batched pipeline.
+        
+        The pipeline splits long audio into VAD-bounded chunks of up to 30s
+        and runs them through the encoder/decoder as one batch instead of
+        one window after another.
+        
+        Returns:
+            BatchedInferencePipeline, or None if this faster-whisper version
+            doesn't provide it
+        """
+        try:
+            from faster_whisper import BatchedInferencePipeline
+        except ImportError:
+            self.logger.debug("BatchedInferencePipeline unavailable (faster-whisper < 1.1), using sequential decoding")
+            return None
+        self.logger.debug(f"  Batched inference: batch_size={self.batch_size}")
+        return BatchedInferencePipeline(model=self.model)
+    
+    def _auto_select_quantization(self, preferred: str, model_size: str = "large-v3") -> str:
         """
         Auto-select quantization based on GPU memory availability.
         
+        Picks the highest-precision compute type, no higher than
+        ``preferred``, whose VRAM requirement for ``model_size`` fits in free
+        device memory minus headroom. int8 weights with float16 activations
+        match float16 accuracy in ~35% less memory, so they're chosen as
+        soon as float16 doesn't fit. On Ampere or newer GPUs the bfloat16
+        variants replace float16 ones (same speed, wider range); older GPUs
+        get the float16 variant of a requested bfloat16 type.
+        
         Args:
             preferred: Preferred compute type
+            model_size: Whisper model size (for the VRAM requirement table)
         
         Returns:
             Selected compute type
@@ -126,63 +318,91 @@ class STTEngine(STTEngineInterface):
         
         try:
             memory_manager = get_memory_manager()
-            gpu_info = memory_manager.get_gpu_memory_info()
+            gpu_info = memory_manager.get_gpu_memory_info(self.device_index)
             
-            if gpu_info:
-                free_gb = gpu_info.get("free_gb", 0)
-                
-                # If low on GPU memory, use int8
-                if free_gb < 2.0:
-                    self.logger.info(f"Low GPU memory ({free_gb:.2f}GB free), using int8 quantization")
-                    return "int8"
-                elif free_gb < 4.0:
-                    self.logger.info(f"Moderate GPU memory ({free_gb:.2f}GB free), using int8_float16")
-                    return "int8_float16"
-                else:
-                    self.logger.debug(f"Sufficient GPU memory ({free_gb:.2f}GB free), using {preferred}")
-                    return preferred
-            else:
-                # No GPU info, use preferred
+            if not gpu_info or preferred not in _GPU_COMPUTE_TYPES + _AMPERE_COMPUTE_TYPES:
+                # No GPU info (or unknown type), use preferred
                 return preferred
+            
+            free_gb = gpu_info.get("device_free_gb", gpu_info.get("free_gb", 0))
+            budget_gb = free_gb - _VRAM_HEADROOM_GB
+            ampere = tuple(gpu_info.get("compute_capability", (0, 0))) >= (8, 0)
+            
+            if ampere:
+                candidates = _AMPERE_COMPUTE_TYPES
+                requested, preferred = preferred, _BF16_EQUIVALENTS.get(preferred, preferred)
+            else:
+                candidates = _GPU_COMPUTE_TYPES
+                fp16_equivalents = {bf16: fp16 for fp16, bf16 in _BF16_EQUIVALENTS.items()}
+                requested, preferred = preferred, fp16_equivalents.get(preferred, preferred)
+            if preferred != requested:
+                self.logger.info(f"Using {preferred} instead of {requested} on this GPU")
+            
+            for compute_type in candidates[candidates.index(preferred):]:
+                required = _vram_required_gb(model_size, compute_type)
+                if required <= budget_gb:
+                    if compute_type != preferred:
+                        self.logger.info(
+                            f"GPU memory ({free_gb:.2f}GB free): {model_size} needs ~{required:.1f}GB "
+                            f"as {compute_type}, using it instead of {preferred}"
+                        )
+                    else:
+                        self.logger.debug(f"Sufficient GPU memory ({free_gb:.2f}GB free), using {preferred}")
+                    return compute_type
+            
+            self.logger.warning(f"Low GPU memory ({free_gb:.2f}GB free) for {model_size}, using int8 quantization")
+            return "int8"
         except Exception as e:
             self.logger.warning(f"Could not determine GPU memory, using {preferred}: {e}")
             return preferred
     
-    @log_performance("STT Transcription")
-    @retry(max_retries=2, initial_delay=1.0, retryable_exceptions=(RuntimeError, OSError))
-    def transcribe(
+    def transcribe_stream(
         self,
-        audio_path: str,
+        audio_path: Union[str, BinaryIO, np.ndarray],
         language: str = "en",
         beam_size: int = 5,
         vad_filter: bool = True,
         initial_prompt: Optional[str] = None,
-        chunk_length_s: Optional[float] = None
-    ) -> Dict:
+        chunk_length_s: Optional[float] = None,
+        **decode_options
+    ) -> Iterator[Dict]:
         """
-        Transcribe audio from a file.
+        Transcribe audio, yielding each segment as soon as it is decoded.
+        
+        faster-whisper decodes lazily, so the first segment is available
+        long before the last one on long audio. Stop iterating to abandon
+        the rest of the decode (e.g. on barge-in).
         
         Args:
-            audio_path: Path to audio file
+            audio_path: Path to audio file, a file-like object with encoded
+                        audio, or a mono float32 numpy array sampled at
+                        16 kHz (passed straight to Whisper, no decode)
             language: Language code (e.g., "en", "es", "fr")
             beam_size: Beam size for beam search (higher = more accurate, slower)
             vad_filter: Enable voice activity detection filter
             initial_prompt: Optional text prompt to guide transcription
+            chunk_length_s: Optional chunk length in seconds for long audio
+            **decode_options: Extra faster-whisper transcribe options
+                              (e.g. best_of, without_timestamps)
             
-        Returns:
-            Dictionary with transcription results:
-            {
-                "text": str,           # Transcribed text
-                "language": str,       # Detected language
-                "duration": float,      # Processing time in seconds
-                "segments": list       # List of segment dictionaries
-            }
+        Yields:
+            Segment dictionaries {"start": float, "end": float, "text": str},
+            then a final {"info": {"language", "language_probability",
+            "audio_duration"}}
         """
-        if not Path(audio_path).exists():
-            self.logger.error(f"Audio file not found: {audio_path}")
-            raise FileNotFoundError(f"Audio file not found: {audio_path}")
+        if isinstance(audio_path, np.ndarray):
+            audio_source = f"array ({audio_path.shape[0] / 16000:.2f}s)"
+        elif hasattr(audio_path, "read"):
+            # Rewind so a retry after a failed attempt decodes from the start
+            audio_path.seek(0)
+            audio_source = "in-memory buffer"
+        else:
+            if not Path(audio_path).exists():
+                self.logger.error(f"Audio file not found: {audio_path}")
+                raise FileNotFoundError(f"Audio file not found: {audio_path}")
+            audio_source = audio_path
         
-        self.logger.debug(f"Transcribing audio: {audio_path}")
+        self.logger.debug(f"Transcribing audio: {audio_source}")
         self.logger.debug(f"  Language: {language}, Beam size: {beam_size}, VAD: {vad_filter}")
         
         try:
@@ -190,7 +410,8 @@ class STTEngine(STTEngineInterface):
             transcribe_kwargs = {
                 "language": language,
                 "beam_size": beam_size,
-                "vad_filter": vad_filter
+                "vad_filter": vad_filter,
+                **decode_options
             }
             
             if initial_prompt:
@@ -200,46 +421,297 @@ class STTEngine(STTEngineInterface):
             if chunk_length_s is not None:
                 transcribe_kwargs["chunk_length"] = chunk_length_s
             
-            segments, info = self.model.transcribe(
-                audio_path,
-                **transcribe_kwargs
+            # Short clips fit in one 30s window, where batching gains nothing.
+            # The batched pipeline also needs speech chunks to batch: without
+            # its VAD (or explicit clip_timestamps) it rejects audio longer than
+            # one window, so that audio is decoded sequentially.
+            use_batched = (
+                self.batched_model is not None
+                and (vad_filter or decode_options.get("clip_timestamps"))
+                and not (isinstance(audio_path, np.ndarray) and audio_path.shape[0] <= _BATCH_MIN_SAMPLES)
             )
-            
-            # Collect segments
-            segment_list = []
-            text_parts = []
+            if use_batched:
+                segments, info = self.batched_model.transcribe(
+                    audio_path,
+                    batch_size=self.batch_size,
+                    **transcribe_kwargs
+                )
+            else:
+                segments, info = self.model.transcribe(
+                    audio_path,
+                    **transcribe_kwargs
+                )
             
             for segment in segments:
-                segment_dict = {
+                yield {
                     "start": segment.start,
                     "end": segment.end,
                     "text": segment.text.strip()
                 }
-                segment_list.append(segment_dict)
-                text_parts.append(segment.text.strip())
-            
-            # Combine all text
-            full_text = " ".join(text_parts)
             
-            result = {
-                "text": full_text.strip(),
-                "language": info.language,
-                "language_probability": info.language_probability,
-                "duration": 0,  # Will be set by decorator
-                "segments": segment_list,
-                "audio_duration": info.duration if hasattr(info, 'duration') else None
+            yield {
+                "info": {
+                    "language": info.language,
+                    "language_probability": info.language_probability,
+                    "audio_duration": info.duration if hasattr(info, 'duration') else None
+                }
             }
             
-            self.logger.info(f"Transcription complete: {len(full_text)} characters, "
-                           f"language: {info.language} ({info.language_probability:.2%})")
-            
-            return result
-            
         except Exception as e:
-            error_info = handle_error(e, context={"audio_path": audio_path, "language": language}, logger=self.logger)
+            error_info = handle_error(e, context={"audio_path": audio_source, "language": language}, logger=self.logger)
             self.logger.error(f"Error during transcription: {error_info['message']}", exc_info=True)
+            # Only errors that can go away on their own are worth a retry
+            if isinstance(e, OSError) and not isinstance(e, (FileNotFoundError, PermissionError, IsADirectoryError)):
+                raise TransientIOError(str(e)) from e
+            message = str(e).lower()
+            if isinstance(e, RuntimeError) and "cuda" in message and "out of memory" not in message:
+                raise CudaLaunchError(str(e)) from e
             raise
     
+    @log_performance("STT Transcription")
+    @retry(max_retries=2, initial_delay=1.0, retryable_exceptions=(TransientIOError, CudaLaunchError))
+    def transcribe(
+        self,
+        audio_path: Union[str, BinaryIO, np.ndarray],
+        language: str = "en",
+        beam_size: int = 5,
+        vad_filter: bool = True,
+        initial_prompt: Optional[str] = None,
+        chunk_length_s: Optional[float] = None,
+        on_segment: Optional[Callable[[Dict], None]] = None,
+        trust_vad: bool = False,
+        **decode_options
+    ) -> Dict:
+        """
+        Transcribe audio from a file or an in-memory waveform.
+        
+        Args:
+            audio_path: Path to audio file, a file-like object with encoded
+                        audio, or a mono float32 numpy array sampled at
+                        16 kHz (passed straight to Whisper, no decode)
+            language: Language code (e.g., "en", "es", "fr")
+            beam_size: Beam size for beam search (higher = more accurate, slower)
+            vad_filter: Enable voice activity detection filter
+            initial_prompt: Optional text prompt to guide transcription
+            chunk_length_s: Optional chunk length in seconds for long audio
+            on_segment: Optional callback called with each segment dictionary
+                        as soon as it is decoded
+            trust_vad: Audio was already cut to speech by an upstream VAD;
+                       skips Whisper's own VAD pass (forces vad_filter=False)
+            **decode_options: Extra faster-whisper transcribe options
+            
+        Returns:
+            Dictionary with transcription results:
+            {
+                "text": str,           # Transcribed text
+                "language": str,       # Detected language
+                "duration": float,      # Processing time in seconds
+                "segments": list       # List of segment dictionaries
+            }
+        """
+        if trust_vad:
+            vad_filter = False
+        
+        digest = self._audio_digest(audio_path)
+        cache_key = None
+        if digest is not None:
+            cache_key = (digest, language, beam_size, vad_filter, initial_prompt,
+                         chunk_length_s, self.model_size, self.compute_type,
+                         tuple(sorted(decode_options.items())))
+            with _transcription_cache_lock:
+                cached = _transcription_cache.get(cache_key)
+                if cached is not None:
+                    _transcription_cache.move_to_end(cache_key)
+            if cached is not None:
+                self.logger.debug("Transcription cache hit")
+                result = copy.deepcopy(cached)
+                if on_segment:
+                    for segment in result["segments"]:
+                        on_segment(segment)
+                return result
+        
+        segment_list = []
+        info = {}
+        for attempt in range(2):
+            try:
+                for item in self.transcribe_stream(
+                    audio_path,
+                    language=language,
+                    beam_size=beam_size,
+                    vad_filter=vad_filter,
+                    initial_prompt=initial_prompt,
+                    chunk_length_s=chunk_length_s,
+                    **decode_options
+                ):
+                    if "info" in item:
+                        info = item["info"]
+                        continue
+                    segment_list.append(item)
+                    if on_segment:
+                        on_segment(item)
+                break
+            except (TransientIOError, CudaLaunchError) as e:
+                # A retry would decode from the start and repeat segments on_segment already got
+                if segment_list and on_segment:
+                    raise e.__cause__
+                raise
+            except RuntimeError as e:
+                # Out of memory won't fix itself: decode once more with int8 weights,
+                # unless segments were already handed out
+                if attempt or segment_list or not self._can_downgrade_for(e):
+                    raise
+                if not self._downgrade_to_int8():
+                    raise
+        
+        # Segments are stripped as they're decoded; skipping empty ones keeps the join clean
+        full_text = " ".join(filter(None, (segment["text"] for segment in segment_list)))
+        
+        result = {
+            "text": full_text,
+            "language": info.get("language"),
+            "language_probability": info.get("language_probability"),
+            "duration": 0,  # Will be set by decorator
+            "segments": segment_list,
+            "audio_duration": info.get("audio_duration")
+        }
+        
+        self.logger.info(f"Transcription complete: {len(full_text)} characters, "
+                       f"language: {result['language']} ({result['language_probability'] or 0:.2%})")
+        
+        if cache_key is not None:
+            with _transcription_cache_lock:
+                _transcription_cache[cache_key] = copy.deepcopy(result)
+                if len(_transcription_cache) > _TRANSCRIPTION_CACHE_SIZE:
+                    _transcription_cache.popitem(last=False)
+        
+        return result
+    
+    def _can_downgrade_for(self, error: Exception) -> bool:
+        """Whether a failed decode is a CUDA OOM that an int8 reload could fix."""
+        return (
+            "out of memory" in str(error).lower()
+            and self.device == "cuda"
+            and not self.remote
+            and self.compute_type != "int8"
+        )
+    
+    def _downgrade_to_int8(self) -> bool:
+        """
+        Reload the model with int8 weights after running out of GPU memory.
+        
+        The current model stays in use until the int8 one has loaded, so a
+        failed reload leaves the engine as it was.
+        
+        Returns:
+            True if the engine now uses the int8 model
+        """
+        self.logger.warning(
+            f"CUDA out of memory with {self.compute_type}; reloading Whisper {self.model_size} as int8"
+        )
+        get_memory_manager().clear_gpu_cache()
+        
+        cache_key = f"{self.model_size}_{self.device}{self.device_index}_int8{'_trt' if self.use_tensorrt else ''}"
+        with _model_cache_lock:
+            cached = _model_cache.get(cache_key) if self.use_cache else None
+            if cached is not None:
+                _model_cache.move_to_end(cache_key)
+                model = cached[0]
+            else:
+                try:
+                    with log_timing(f"Whisper model loading ({self.model_size}, int8)", self.logger):
+                        model = WhisperModel(
+                            self.model_size,
+                            device=self.device,
+                            device_index=self.device_index,
+                            compute_type="int8",
+                            num_workers=self.num_workers
+                        )
+                    if self.use_tensorrt:
+                        from src.backend.whisper_tensorrt import attach_tensorrt_encoder
+                        attach_tensorrt_encoder(model, self.model_size, self.device_index, "int8")
+                except Exception as e:
+                    self.logger.error(f"Failed to reload Whisper as int8: {e}", exc_info=True)
+                    return False
+                if self.use_cache:
+                    _model_cache[cache_key] = (model, _vram_required_gb(self.model_size, "int8"))
+            
+            # Release the higher-precision model so its VRAM can be freed
+            for key in [key for key, (cached_model, _) in _model_cache.items() if cached_model is self.model]:
+                del _model_cache[key]
+        
+        self.model = model
+        self.compute_type = "int8"
+        self.batched_model = self._create_batched_pipeline() if self.batch_size > 0 else None
+        get_memory_manager().clear_gpu_cache()
+        return True
+    
+    def transcribe_short(
+        self,
+        audio: Union[str, BinaryIO, np.ndarray],
+        language: str = "en",
+        on_segment: Optional[Callable[[Dict], None]] = None
+    ) -> Dict:
+        """
+        Fast path for short, voice-gated clips (push-to-talk, one VAD utterance).
+        
+        Audio up to one 30s Whisper window is decoded greedily without VAD,
+        timestamp tokens or conditioning on previous text, trading a little
+        accuracy for several times fewer decoder steps.
+        
+        Args:
+            audio: Clip of at most 30s (same input types as transcribe)
+            language: Language code
+            on_segment: Optional callback for each segment as it is decoded
+            
+        Returns:
+            Dictionary with transcription results (same format as transcribe)
+        """
+        return self.transcribe(
+            audio,
+            language=language,
+            beam_size=1,
+            vad_filter=False,
+            on_segment=on_segment,
+            best_of=1,
+            without_timestamps=True,
+            condition_on_previous_text=False
+        )
+    
+    @staticmethod
+    def _audio_digest(audio: Union[str, BinaryIO, np.ndarray]) -> Optional[bytes]:
+        """
+        Hash audio content for the transcription cache.
+        
+        Args:
+            audio: Path, seekable file-like object, or numpy array
+            
+        Returns:
+            SHA-256 digest, or None if the audio can't be read without
+            consuming it (non-seekable stream, missing file)
+        """
+        sha = hashlib.sha256()
+        if isinstance(audio, np.ndarray):
+            sha.update(f"{audio.dtype}{audio.shape}".encode())
+            sha.update(np.ascontiguousarray(audio).data)
+            return sha.digest()
+        
+        if hasattr(audio, "read"):
+            if not (hasattr(audio, "seekable") and audio.seekable()):
+                return None
+            position = audio.tell()
+            for chunk in iter(lambda: audio.read(1 << 20), b""):
+                sha.update(chunk)
+            audio.seek(position)
+            return sha.digest()
+        
+        try:
+            with open(audio, "rb") as f:
+                for chunk in iter(lambda: f.read(1 << 20), b""):
+                    sha.update(chunk)
+        except OSError:
+            return None
+        return sha.digest()
+    
     def transcribe_bytes(
         self,
         audio_bytes: bytes,
@@ -247,45 +719,70 @@ class STTEngine(STTEngineInterface):
         language: str = "en",
         beam_size: int = 5,
         vad_filter: bool = True,
-        chunk_length_s: Optional[float] = None
+        chunk_length_s: Optional[float] = None,
+        input_dtype: str = "float32"
     ) -> Dict:
         """
         Transcribe audio from bytes.
         
         Args:
-            audio_bytes: Audio data as bytes
+            audio_bytes: Raw mono PCM samples
             sample_rate: Sample rate of audio (default 16000 for Whisper)
             language: Language code
             beam_size: Beam size for beam search
             vad_filter: Enable voice activity detection filter
             chunk_length_s: Optional chunk length in seconds for long audio
+            input_dtype: Sample format of audio_bytes: "float32" (normalized
+                         to [-1, 1]) or "int16"
         
         Returns:
             Dictionary with transcription results
+            
+        Raises:
+            ValueError: If input_dtype is not supported
         """
-        import soundfile as sf
-        import numpy as np
-        from src.utils.memory_manager import temp_file
+        if input_dtype not in ("float32", "int16"):
+            raise ValueError(f"Unsupported input_dtype: {input_dtype} (expected float32 or int16)")
         
         try:
-            # Convert bytes to numpy array (optimized - no copy if possible)
-            audio_array = np.frombuffer(audio_bytes, dtype=np.float32)
+            # View the bytes as samples (no copy)
+            audio_array = np.frombuffer(audio_bytes, dtype=input_dtype)
             
-            # Save to temporary file (faster-whisper needs file path)
-            with temp_file(suffix=".wav") as temp_path:
-                sf.write(str(temp_path), audio_array, sample_rate)
+            if sample_rate == 16000:
+                if input_dtype == "int16":
+                    # Scale to float32 in one pass into a single output buffer
+                    audio_array = np.multiply(
+                        audio_array, np.float32(1.0 / 32768.0),
+                        out=np.empty(audio_array.shape, dtype=np.float32),
+                        dtype=np.float32
+                    )
                 
-                # Transcribe with chunked processing if needed
-                result = self.transcribe(
-                    str(temp_path),
+                # Whisper's native rate: transcribe the array directly
+                return self.transcribe(
+                    audio_array,
                     language=language,
                     beam_size=beam_size,
                     vad_filter=vad_filter,
                     chunk_length_s=chunk_length_s
                 )
             
-            # Temp file automatically cleaned up by context manager
-            return result
+            # Other rates: wrap in an in-memory WAV so the decoder resamples to 16 kHz
+            import soundfile as sf
+            
+            # Store samples in their own format; the decoder normalizes int16 itself
+            wav = io.BytesIO()
+            sf.write(wav, audio_array, sample_rate, format="WAV",
+                     subtype="PCM_16" if input_dtype == "int16" else "FLOAT")
+            wav.seek(0)
+            
+            # Transcribe with chunked processing if needed
+            return self.transcribe(
+                wav,
+                language=language,
+                beam_size=beam_size,
+                vad_filter=vad_filter,
+                chunk_length_s=chunk_length_s
+            )
             
         except Exception as e:
             self.logger.error(f"Error transcribing bytes: {e}", exc_info=True)
@@ -317,18 +814,14 @@ class STTEngine(STTEngineInterface):
         Returns:
             Dictionary with transcription results (same format as transcribe)
         """
-        # Import here to avoid circular dependency
-        from src.backend.streaming_stt import StreamingSTT
-        
-        # Create a temporary StreamingSTT instance for this operation
-        streaming_stt = StreamingSTT(
-            config=self.config,
-            model_size=self.model_size,
-            device=self.device,
-            compute_type=self.compute_type
-        )
+        if self._streaming_stt is None:
+            # Import here to avoid circular dependency
+            from src.backend.streaming_stt import StreamingSTT
+            
+            # Share this engine's model instead of constructing a second engine
+            self._streaming_stt = StreamingSTT(sample_rate=self.sample_rate, stt_engine=self)
         
-        return streaming_stt.listen_and_transcribe(duration=duration)
+        return self._streaming_stt.listen_and_transcribe(duration=duration)
     
     def get_model_info(self) -> Dict:
         """Get information about the loaded model."""
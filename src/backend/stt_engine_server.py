@@ -0,0 +1,295 @@
+"""
+Shared Speech-to-Text Server
+
+Loads the Whisper model once per machine and serves transcriptions to
+other Jane processes over a Unix domain socket. Clients opt in by setting
+JANE_STT_SOCKET; STTEngine then forwards transcriptions here instead of
+loading its own model, so new workers start without the multi-second
+model load.
+
+Audio arrays are handed over through shared memory; only the small
+request/response envelopes go over the socket.
+
+Messages are pickled, so every connection is authenticated: the shared
+key comes from JANE_STT_AUTHKEY or, if unset, from a key file readable
+only by the owning user (created by the server on first start). The
+socket defaults to a per-user directory rather than /tmp.
+
+Usage:
+    python -m src.backend.stt_engine_server --socket $XDG_RUNTIME_DIR/jane-stt.sock
+"""
+
+import os
+import sys
+import argparse
+import threading
+from contextlib import contextmanager
+from multiprocessing.connection import Client, Listener
+from multiprocessing import AuthenticationError, resource_tracker, shared_memory
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Dict, Tuple
+import numpy as np
+from src.utils.logger import get_logger
+
+# Environment variable clients use to find the server
+SOCKET_ENV_VAR = "JANE_STT_SOCKET"
+# Shared secret for the connection handshake; overrides the key file
+AUTHKEY_ENV_VAR = "JANE_STT_AUTHKEY"
+# Key file used when the environment variable isn't set (mode 0600)
+AUTHKEY_FILE = Path.home() / ".cache" / "jane" / "stt-authkey"
+
+
+def default_socket_path() -> str:
+    """Socket path in the user's runtime directory, or ~/.cache/jane without one."""
+    runtime_dir = os.environ.get("XDG_RUNTIME_DIR")
+    directory = Path(runtime_dir) if runtime_dir else Path.home() / ".cache" / "jane"
+    return str(directory / "jane-stt.sock")
+
+
+def _authkey(create: bool = False) -> bytes:
+    """
+    Get the connection authkey.
+    
+    Args:
+        create: Generate the key file if it doesn't exist (server side)
+    
+    Returns:
+        The key from JANE_STT_AUTHKEY, else the contents of the key file
+    
+    Raises:
+        RuntimeError: If there is no key and create is False
+    """
+    key = os.environ.get(AUTHKEY_ENV_VAR)
+    if key:
+        return key.encode("utf-8")
+    
+    if create and not AUTHKEY_FILE.exists():
+        AUTHKEY_FILE.parent.mkdir(parents=True, exist_ok=True, mode=0o700)
+        try:
+            # O_EXCL with 0600 so the key is never readable by others, even briefly
+            fd = os.open(AUTHKEY_FILE, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+        except FileExistsError:
+            pass
+        else:
+            with os.fdopen(fd, "wb") as f:
+                f.write(os.urandom(32).hex().encode("ascii"))
+    try:
+        return AUTHKEY_FILE.read_bytes().strip()
+    except FileNotFoundError:
+        raise RuntimeError(
+            f"No STT server authkey: set {AUTHKEY_ENV_VAR} or start the server to create {AUTHKEY_FILE}"
+        ) from None
+
+
+@contextmanager
+def _private_umask():
+    """Create files (the socket) accessible only by the owning user."""
+    old = os.umask(0o077)
+    try:
+        yield
+    finally:
+        os.umask(old)
+
+
+def _attach_shared_memory(name: str) -> shared_memory.SharedMemory:
+    """
+    Map a client's shared memory block without taking ownership of it.
+    
+    The client unlinks its blocks; before Python 3.13 attaching also
+    registers them with this process's resource tracker, which would
+    then warn about (and try to unlink) every one of them at shutdown.
+    """
+    if sys.version_info >= (3, 13):
+        return shared_memory.SharedMemory(name=name, track=False)
+    shm = shared_memory.SharedMemory(name=name)
+    resource_tracker.unregister(shm._name, "shared_memory")
+    return shm
+
+
+class RemoteWhisperModel:
+    """
+    Client-side stand-in for faster_whisper.WhisperModel.
+    
+    Implements transcribe() with the same (segments, info) return shape,
+    so STTEngine can use it in place of a locally loaded model.
+    """
+    
+    def __init__(self, socket_path: str):
+        """
+        Initialize the proxy.
+        
+        Args:
+            socket_path: Path of the server's Unix domain socket
+        
+        Raises:
+            RuntimeError: If no authkey is configured
+        """
+        self.socket_path = socket_path
+        self._authkey = _authkey()
+        self.logger = get_logger(__name__)
+        self._local = threading.local()
+    
+    def _connection(self):
+        """Get this thread's connection to the server, connecting on first use."""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = Client(self.socket_path, family="AF_UNIX", authkey=self._authkey)
+            self._local.conn = conn
+        return conn
+    
+    def transcribe(self, audio, **kwargs) -> Tuple[iter, SimpleNamespace]:
+        """
+        Transcribe on the server.
+        
+        Args:
+            audio: File path, file-like object, or float32 numpy array
+            **kwargs: faster-whisper transcribe options
+        
+        Returns:
+            Tuple of (segment iterator, info) like WhisperModel.transcribe
+        """
+        shm = None
+        try:
+            if isinstance(audio, np.ndarray):
+                # Copy once into shared memory; the server maps it without another copy
+                audio = np.ascontiguousarray(audio, dtype=np.float32)
+                shm = shared_memory.SharedMemory(create=True, size=max(audio.nbytes, 1))
+                np.ndarray(audio.shape, dtype=np.float32, buffer=shm.buf)[:] = audio
+                source = ("shm", shm.name, audio.shape)
+            elif hasattr(audio, "read"):
+                source = ("bytes", audio.read())
+            else:
+                source = ("path", os.path.abspath(str(audio)))
+            
+            conn = self._connection()
+            try:
+                conn.send({"audio": source, "kwargs": kwargs})
+                response = conn.recv()
+            except (EOFError, OSError):
+                # Server restarted; drop the stale connection so the next call reconnects
+                self._local.conn = None
+                raise
+        finally:
+            if shm is not None:
+                shm.close()
+                shm.unlink()
+        
+        if "error" in response:
+            raise RuntimeError(f"STT server error: {response['error']}")
+        
+        segments = iter([SimpleNamespace(**segment) for segment in response["segments"]])
+        return segments, SimpleNamespace(**response["info"])
+
+
+class STTEngineServer:
+    """
+    Serves one shared STTEngine over a Unix domain socket.
+    
+    Each client connection is handled on its own thread; requests on a
+    connection are processed in order.
+    """
+    
+    def __init__(self, socket_path: str, config=None):
+        """
+        Initialize the server and load the model.
+        
+        Args:
+            socket_path: Path for the Unix domain socket
+            config: STTConfig (defaults to the loaded application config)
+        """
+        # Never proxy to ourselves
+        os.environ.pop(SOCKET_ENV_VAR, None)
+        
+        from src.backend.stt_engine import STTEngine
+        from src.config import get_config
+        
+        self.logger = get_logger(__name__)
+        self.socket_path = socket_path
+        self.engine = STTEngine(config=config or get_config().stt)
+    
+    def _transcribe(self, request: Dict) -> Dict:
+        """Run one transcription request."""
+        kind, *payload = request["audio"]
+        kwargs = dict(request["kwargs"])
+        kwargs["chunk_length_s"] = kwargs.pop("chunk_length", None)
+        
+        shm = None
+        try:
+            if kind == "shm":
+                name, shape = payload
+                shm = _attach_shared_memory(name)
+                audio = np.ndarray(shape, dtype=np.float32, buffer=shm.buf)
+            elif kind == "bytes":
+                import io
+                audio = io.BytesIO(payload[0])
+            else:
+                audio = payload[0]
+            
+            segments = []
+            info = {}
+            for item in self.engine.transcribe_stream(audio, **kwargs):
+                if "info" in item:
+                    info = item["info"]
+                else:
+                    segments.append(item)
+            
+            info["duration"] = info.pop("audio_duration", None)
+            return {"segments": segments, "info": info}
+        finally:
+            if shm is not None:
+                # Drop our view before closing the mapping
+                audio = None
+                shm.close()
+    
+    def _serve_connection(self, conn):
+        """Handle requests from one client until it disconnects."""
+        with conn:
+            while True:
+                try:
+                    request = conn.recv()
+                except (EOFError, OSError):
+                    return
+                try:
+                    response = self._transcribe(request)
+                except Exception as e:
+                    self.logger.error(f"Transcription request failed: {e}", exc_info=True)
+                    response = {"error": f"{type(e).__name__}: {e}"}
+                conn.send(response)
+    
+    def serve_forever(self):
+        """Accept client connections until interrupted."""
+        if os.path.exists(self.socket_path):
+            os.unlink(self.socket_path)
+        Path(self.socket_path).parent.mkdir(parents=True, exist_ok=True, mode=0o700)
+        authkey = _authkey(create=True)
+        
+        # Bind with a private umask so only the owning user can ever connect
+        with _private_umask():
+            listener = Listener(self.socket_path, family="AF_UNIX", authkey=authkey)
+        with listener:
+            self.logger.info(f"STT server listening on {self.socket_path}")
+            self.logger.info(f"Set {SOCKET_ENV_VAR}={self.socket_path} in clients to use it")
+            while True:
+                try:
+                    conn = listener.accept()
+                except (OSError, AuthenticationError) as e:
+                    self.logger.warning(f"Rejected STT client connection: {e}")
+                    continue
+                threading.Thread(target=self._serve_connection, args=(conn,), daemon=True).start()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Jane shared Speech-to-Text server")
+    parser.add_argument(
+        "--socket",
+        default=os.environ.get(SOCKET_ENV_VAR) or default_socket_path(),
+        help="Unix domain socket path"
+    )
+    
+    args = parser.parse_args()
+    
+    try:
+        STTEngineServer(args.socket).serve_forever()
+    except KeyboardInterrupt:
+        print("\nSTT server stopped")
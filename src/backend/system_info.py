@@ -4,22 +4,145 @@ System Information Module
 Provides system information functions for the assistant.
 """
 
+import heapq
+import os
 import platform
 import psutil
-from typing import Dict, List, Optional
+import socket
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Dict, List, Mapping, Optional, Tuple
 from datetime import datetime
 from src.utils.logger import get_logger, log_performance
 from src.utils.error_handler import handle_error
 
+# /proc is read directly on Linux; other platforms go through psutil
+_IS_LINUX = platform.system() == "Linux"
+_IS_WINDOWS = platform.system() == "Windows"
+# Disk checked when get_disk_info is asked for "/" (or no path)
+_DEFAULT_DISK_PATH = "C:\\" if _IS_WINDOWS else "/"
+# Large enough to take /proc/meminfo and the aggregate line of /proc/stat in one read
+_PROC_READ_SIZE = 8192
+# Open descriptors for /proc files, kept for the life of the process
+_proc_fds: Dict[str, int] = {}
+# str() of the common address families, so get_network_info doesn't format the enum per address
+_FAMILY_NAMES = {family: str(family) for family in (socket.AF_INET, socket.AF_INET6, psutil.AF_LINK)}
+
+
+@lru_cache(maxsize=None)
+def _static_platform_info() -> Mapping[str, str]:
+    """
+    Platform details that can't change while the process runs.
+    
+    platform.platform() and platform.processor() may read files or run a
+    subprocess, so they're looked up once. The snapshot is read-only since
+    every caller shares it; copy it into a new dict to extend it.
+    """
+    return MappingProxyType({
+        "system": platform.system(),
+        "platform": platform.platform(),
+        "processor": platform.processor(),
+        "python_version": platform.python_version(),
+        "architecture": platform.machine(),
+        "hostname": platform.node()
+    })
+
+
+@lru_cache(maxsize=None)
+def _physical_cpu_count() -> Optional[int]:
+    """Physical core count (psutil scans sysfs for it, so it's read once)."""
+    return psutil.cpu_count(logical=False)
+
+
+_BYTE_UNITS = ("B", "KB", "MB", "GB", "TB", "PB")
+
+
+def _format_bytes(num_bytes: int) -> str:
+    """Format a byte count as a human-readable string (e.g. "1.50 GB")."""
+    # Each unit is 2**10 of the previous one, so the bit length picks the unit directly
+    exponent = min(max(0, (int(num_bytes).bit_length() - 1) // 10), len(_BYTE_UNITS) - 1)
+    return f"{num_bytes / (1 << (exponent * 10)):.2f} {_BYTE_UNITS[exponent]}"
+
+
+def _read_proc(path: str) -> bytes:
+    """
+    Read a /proc file in a single syscall.
+    
+    The descriptor is opened once and reused; pread from offset 0 makes the
+    kernel regenerate the file, so every call sees a consistent snapshot.
+    """
+    fd = _proc_fds.get(path)
+    if fd is None:
+        fd = _proc_fds.setdefault(path, os.open(path, os.O_RDONLY))
+    return os.pread(fd, _PROC_READ_SIZE, 0)
+
+
+def _linux_memory() -> Dict:
+    """Memory totals from /proc/meminfo, in bytes."""
+    fields = {}
+    for line in _read_proc("/proc/meminfo").split(b"\n"):
+        name, _, value = line.partition(b":")
+        if name in (b"MemTotal", b"MemAvailable"):
+            fields[name] = int(value.split()[0]) * 1024
+            if len(fields) == 2:
+                break
+    
+    total = fields[b"MemTotal"]
+    available = fields[b"MemAvailable"]
+    # Same definitions psutil uses for virtual_memory()
+    return {
+        "total": total,
+        "available": available,
+        "used": total - available,
+        "percent": round((total - available) / total * 100, 1) if total else 0.0
+    }
+
+
+def _linux_cpu_times() -> Tuple[int, int]:
+    """
+    Aggregate (busy, total) jiffies from the first line of /proc/stat.
+    
+    guest time is already counted in user/nice, and iowait counts as idle,
+    matching psutil.cpu_percent().
+    """
+    line = _read_proc("/proc/stat").split(b"\n", 1)[0]
+    values = [int(v) for v in line.split()[1:]]
+    total = sum(values[:8])  # user..steal; guest and guest_nice are already in user/nice
+    idle = values[3] + (values[4] if len(values) > 4 else 0)
+    return total - idle, total
+
+
+def _available_cpu_count() -> int:
+    """CPUs this process may run on (affinity-aware where supported)."""
+    if hasattr(os, "sched_getaffinity"):
+        return len(os.sched_getaffinity(0))
+    return os.cpu_count() or 1
+
 
 class SystemInfo:
     """
     System information provider.
     """
     
+    # How long (seconds) a disk/memory reading is reused for back-to-back polls
+    DISK_CACHE_TTL = 1.0
+    MEMORY_CACHE_TTL = 0.1
+    
     def __init__(self):
         """Initialize the system info module."""
         self.logger = get_logger(__name__)
+        # path -> (monotonic time, info); statvfs can be slow on network/FUSE mounts
+        self._disk_cache: Dict[str, Tuple[float, Dict]] = {}
+        self._memory_cache: Optional[Tuple[float, Dict]] = None
+        # Baseline so the first non-blocking CPU reading has something to diff against
+        self._cpu_lock = threading.Lock()
+        if _IS_LINUX:
+            self._cpu_times = _linux_cpu_times()
+        else:
+            psutil.cpu_percent(interval=None)
         self.logger.info("SystemInfo initialized")
     
     @log_performance()
@@ -39,15 +162,8 @@ class SystemInfo:
             }
         """
         try:
-            info = {
-                "success": True,
-                "system": platform.system(),
-                "platform": platform.platform(),
-                "processor": platform.processor(),
-                "python_version": platform.python_version(),
-                "architecture": platform.machine(),
-                "hostname": platform.node()
-            }
+            # Fresh dict each call; callers (and log_performance) add keys to it
+            info = {"success": True, **_static_platform_info()}
             
             self.logger.debug("Retrieved system information")
             return info
@@ -70,7 +186,8 @@ class SystemInfo:
                 "success": bool,
                 "cpu_count": int,  # Physical cores
                 "cpu_count_logical": int,  # Logical cores
-                "cpu_percent": float,  # Current CPU usage %
+                "cpu_count_available": int,  # Logical cores this process may use
+                "cpu_percent": float,  # CPU usage % since the previous reading
                 "cpu_freq": Dict,  # CPU frequency info
                 "error": str  # Error message if success is False
             }
@@ -79,9 +196,11 @@ class SystemInfo:
             cpu_freq = psutil.cpu_freq()
             info = {
                 "success": True,
-                "cpu_count": psutil.cpu_count(logical=False),
-                "cpu_count_logical": psutil.cpu_count(logical=True),
-                "cpu_percent": psutil.cpu_percent(interval=0.1),
+                "cpu_count": _physical_cpu_count(),
+                "cpu_count_logical": os.cpu_count(),
+                "cpu_count_available": _available_cpu_count(),
+                # Non-blocking: usage since the last call instead of sleeping 100ms to sample
+                "cpu_percent": self._cpu_percent(),
                 "cpu_freq": {
                     "current": cpu_freq.current if cpu_freq else None,
                     "min": cpu_freq.min if cpu_freq else None,
@@ -99,6 +218,20 @@ class SystemInfo:
                 "error": error_info["message"]
             }
     
+    def _cpu_percent(self) -> float:
+        """CPU usage % since the previous reading."""
+        if not _IS_LINUX:
+            return psutil.cpu_percent(interval=None)
+        
+        # The instance is shared between threads; keep each read/update pair together
+        with self._cpu_lock:
+            busy, total = _linux_cpu_times()
+            last_busy, last_total = self._cpu_times
+            self._cpu_times = (busy, total)
+        if total <= last_total:
+            return 0.0
+        return round(min(100.0, max(0.0, (busy - last_busy) / (total - last_total) * 100)), 1)
+    
     @log_performance()
     def get_memory_info(self) -> Dict:
         """
@@ -115,18 +248,27 @@ class SystemInfo:
                 "error": str  # Error message if success is False
             }
         """
+        now = time.monotonic()
+        cached = self._memory_cache
+        if cached and now - cached[0] < self.MEMORY_CACHE_TTL:
+            return dict(cached[1])
+        
         try:
-            mem = psutil.virtual_memory()
-            info = {
-                "success": True,
-                "total": mem.total,
-                "available": mem.available,
-                "used": mem.used,
-                "percent": mem.percent
-            }
+            if _IS_LINUX:
+                info = {"success": True, **_linux_memory()}
+            else:
+                mem = psutil.virtual_memory()
+                info = {
+                    "success": True,
+                    "total": mem.total,
+                    "available": mem.available,
+                    "used": mem.used,
+                    "percent": mem.percent
+                }
             
+            self._memory_cache = (now, info)
             self.logger.debug("Retrieved memory information")
-            return info
+            return dict(info)
         
         except Exception as e:
             error_info = handle_error(e, logger=self.logger)
@@ -136,13 +278,14 @@ class SystemInfo:
             }
     
     @log_performance()
-    def get_disk_info(self, path: str = "/") -> Dict:
+    def get_disk_info(self, path: Optional[str] = None) -> Dict:
         """
         Get disk usage information.
         
         Args:
-            path: Path to check (default: "/" for root)
-            
+            path: Path to check (default: the root drive; "/" means the
+                  same, and is "C:\\" on Windows)
+        
         Returns:
             Dictionary with disk information:
             {
@@ -156,9 +299,13 @@ class SystemInfo:
             }
         """
         try:
-            # On Windows, use "C:\\" as default
-            if platform.system() == "Windows" and path == "/":
-                path = "C:\\"
+            if path is None or path == "/":
+                path = _DEFAULT_DISK_PATH
+            
+            now = time.monotonic()
+            cached = self._disk_cache.get(path)
+            if cached and now - cached[0] < self.DISK_CACHE_TTL:
+                return dict(cached[1])
             
             disk = psutil.disk_usage(path)
             info = {
@@ -170,8 +317,9 @@ class SystemInfo:
                 "path": path
             }
             
+            self._disk_cache[path] = (now, info)
             self.logger.debug(f"Retrieved disk information for {path}")
-            return info
+            return dict(info)
         
         except Exception as e:
             error_info = handle_error(e, context={"path": path}, logger=self.logger)
@@ -182,10 +330,15 @@ class SystemInfo:
             }
     
     @log_performance()
-    def get_network_info(self) -> Dict:
+    def get_network_info(self, include_stats: bool = False) -> Dict:
         """
         Get network interface information.
         
+        Args:
+            include_stats: Also report whether each interface is up. This
+                           costs one ioctl per interface, which is slow on
+                           hosts with many interfaces; otherwise "isup" is None.
+        
         Returns:
             Dictionary with network information:
             {
@@ -197,18 +350,19 @@ class SystemInfo:
         try:
             interfaces = []
             net_if_addrs = psutil.net_if_addrs()
-            net_if_stats = psutil.net_if_stats()
+            net_if_stats = psutil.net_if_stats() if include_stats else {}
             
             for interface_name, addresses in net_if_addrs.items():
+                stats = net_if_stats.get(interface_name)
                 interface_info = {
                     "name": interface_name,
                     "addresses": [],
-                    "isup": net_if_stats.get(interface_name, {}).isup if interface_name in net_if_stats else None
+                    "isup": stats.isup if stats else None
                 }
                 
                 for addr in addresses:
                     interface_info["addresses"].append({
-                        "family": str(addr.family),
+                        "family": _FAMILY_NAMES.get(addr.family) or str(addr.family),
                         "address": addr.address,
                         "netmask": addr.netmask,
                         "broadcast": addr.broadcast
@@ -238,7 +392,7 @@ class SystemInfo:
         
         Args:
             limit: Maximum number of processes to return (default: 10)
-            
+        
         Returns:
             Dictionary with process information:
             {
@@ -248,24 +402,32 @@ class SystemInfo:
             }
         """
         try:
+            # First pass reads only CPU usage; attrs makes psutil swallow
+            # NoSuchProcess/AccessDenied (the value becomes None)
+            candidates = [
+                proc for proc in psutil.process_iter(['cpu_percent'])
+                if proc.info['cpu_percent'] is not None
+            ]
+            # Top processes by CPU usage, without sorting the whole list
+            top = heapq.nlargest(limit, candidates, key=lambda proc: proc.info['cpu_percent'])
+            
+            # Name and memory are only looked up for the processes returned
             processes = []
-            for proc in psutil.process_iter(['pid', 'name', 'cpu_percent', 'memory_percent']):
+            for proc in top:
                 try:
-                    processes.append({
-                        "pid": proc.info['pid'],
-                        "name": proc.info['name'],
-                        "cpu_percent": proc.info['cpu_percent'],
-                        "memory_percent": proc.info['memory_percent']
-                    })
+                    with proc.oneshot():
+                        processes.append({
+                            "pid": proc.pid,
+                            "name": proc.name(),
+                            "cpu_percent": proc.info['cpu_percent'],
+                            "memory_percent": proc.memory_percent()
+                        })
                 except (psutil.NoSuchProcess, psutil.AccessDenied):
                     continue
             
-            # Sort by CPU usage
-            processes.sort(key=lambda x: x['cpu_percent'] or 0, reverse=True)
-            
             info = {
                 "success": True,
-                "processes": processes[:limit]
+                "processes": processes
             }
             
             self.logger.debug(f"Retrieved information for {len(info['processes'])} processes")
@@ -280,10 +442,23 @@ class SystemInfo:
 
 
 # Convenience functions for function handler
+# Shared provider for the convenience functions below
+_system_info: Optional[SystemInfo] = None
+# Worker pool for get_all_info_parallel, created on first use
+_info_executor: Optional[ThreadPoolExecutor] = None
+
+
+def get_system_info_provider() -> SystemInfo:
+    """Get the global SystemInfo instance."""
+    global _system_info
+    if _system_info is None:
+        _system_info = SystemInfo()
+    return _system_info
+
+
 def get_system_info() -> str:
     """Get system information as formatted string."""
-    sys_info = SystemInfo()
-    info = sys_info.get_system_info()
+    info = get_system_info_provider().get_system_info()
     
     if not info.get("success"):
         return f"Error: {info.get('error', 'Unknown error')}"
@@ -302,8 +477,7 @@ def get_system_info() -> str:
 
 def get_cpu_info() -> str:
     """Get CPU information as formatted string."""
-    sys_info = SystemInfo()
-    info = sys_info.get_cpu_info()
+    info = get_system_info_provider().get_cpu_info()
     
     if not info.get("success"):
         return f"Error: {info.get('error', 'Unknown error')}"
@@ -323,58 +497,39 @@ def get_cpu_info() -> str:
 
 def get_memory_info() -> str:
     """Get memory information as formatted string."""
-    sys_info = SystemInfo()
-    info = sys_info.get_memory_info()
+    info = get_system_info_provider().get_memory_info()
     
     if not info.get("success"):
         return f"Error: {info.get('error', 'Unknown error')}"
     
-    def format_bytes(bytes_val):
-        """Format bytes to human-readable format."""
-        for unit in ['B', 'KB', 'MB', 'GB', 'TB']:
-            if bytes_val < 1024.0:
-                return f"{bytes_val:.2f} {unit}"
-            bytes_val /= 1024.0
-        return f"{bytes_val:.2f} PB"
-    
     lines = [
         "Memory Information:",
-        f"  Total: {format_bytes(info['total'])}",
-        f"  Used: {format_bytes(info['used'])} ({info['percent']:.1f}%)",
-        f"  Available: {format_bytes(info['available'])}"
+        f"  Total: {_format_bytes(info['total'])}",
+        f"  Used: {_format_bytes(info['used'])} ({info['percent']:.1f}%)",
+        f"  Available: {_format_bytes(info['available'])}"
     ]
     return "\n".join(lines)
 
 
 def get_disk_usage(path: str = "/") -> str:
     """Get disk usage information as formatted string."""
-    sys_info = SystemInfo()
-    info = sys_info.get_disk_info(path)
+    info = get_system_info_provider().get_disk_info(path)
     
     if not info.get("success"):
         return f"Error: {info.get('error', 'Unknown error')}"
     
-    def format_bytes(bytes_val):
-        """Format bytes to human-readable format."""
-        for unit in ['B', 'KB', 'MB', 'GB', 'TB']:
-            if bytes_val < 1024.0:
-                return f"{bytes_val:.2f} {unit}"
-            bytes_val /= 1024.0
-        return f"{bytes_val:.2f} PB"
-    
     lines = [
         f"Disk Usage ({info['path']}):",
-        f"  Total: {format_bytes(info['total'])}",
-        f"  Used: {format_bytes(info['used'])} ({info['percent']:.1f}%)",
-        f"  Free: {format_bytes(info['free'])}"
+        f"  Total: {_format_bytes(info['total'])}",
+        f"  Used: {_format_bytes(info['used'])} ({info['percent']:.1f}%)",
+        f"  Free: {_format_bytes(info['free'])}"
     ]
     return "\n".join(lines)
 
 
 def get_network_info() -> str:
     """Get network information as formatted string."""
-    sys_info = SystemInfo()
-    info = sys_info.get_network_info()
+    info = get_system_info_provider().get_network_info()
     
     if not info.get("success"):
         return f"Error: {info.get('error', 'Unknown error')}"
@@ -389,6 +544,33 @@ def get_network_info() -> str:
     return "\n".join(lines)
 
 
+def get_all_info_parallel() -> Dict[str, str]:
+    """
+    Get all the formatted reports at once.
+    
+    The lookups run on a thread pool; psutil releases the GIL in its C
+    calls, so the total time is roughly that of the slowest lookup.
+    
+    Returns:
+        Dictionary mapping "system", "cpu", "memory", "disk" and "network"
+        to their formatted strings
+    """
+    global _info_executor
+    if _info_executor is None:
+        _info_executor = ThreadPoolExecutor(max_workers=5, thread_name_prefix="system-info")
+    
+    # Create the provider up front so the workers don't race to build it
+    get_system_info_provider()
+    futures = {
+        "system": _info_executor.submit(get_system_info),
+        "cpu": _info_executor.submit(get_cpu_info),
+        "memory": _info_executor.submit(get_memory_info),
+        "disk": _info_executor.submit(get_disk_usage),
+        "network": _info_executor.submit(get_network_info)
+    }
+    return {name: future.result() for name, future in futures.items()}
+
+
 if __name__ == "__main__":
     # Test the system info module
     print("=" * 60)
@@ -441,11 +623,8 @@ if __name__ == "__main__":
     
     # Test convenience functions
     print("\n6. Testing convenience functions:")
-    print("\n" + get_system_info())
-    print("\n" + get_cpu_info())
-    print("\n" + get_memory_info())
-    print("\n" + get_disk_usage())
-    print("\n" + get_network_info())
+    for report in get_all_info_parallel().values():
+        print("\n" + report)
     
     print("\n" + "=" * 60)
     print("✅ System Info test complete!")
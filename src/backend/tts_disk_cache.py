@@ -0,0 +1,203 @@
+"""
+On-Disk TTS Waveform Cache
+
+Keeps synthesized waveforms across restarts so recurring phrases ("How can
+I help you today?") skip the model entirely. Entries are content-addressed
+by sha256(model key|speaker|language|text), where the model key covers the
+model name and its precision, and stored as a small header plus raw
+float32 samples, so a hit is one read with no audio decoding.
+
+Entries expire after a TTL, and the least recently used ones are evicted
+when the directory grows past its size cap.
+"""
+
+import os
+import hashlib
+import struct
+import threading
+import time
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+import numpy as np
+from src.utils.logger import get_logger
+
+# Default location, next to the other Jane caches
+CACHE_DIR = Path.home() / ".cache" / "jane" / "tts"
+# Sample rate header in front of the samples
+_HEADER = struct.Struct("<I")
+_SUFFIX = ".f32"
+
+
+class WaveformDiskCache:
+    """
+    Size-capped LRU cache of waveforms in a directory.
+    
+    File modification times record last use; hits refresh them, and
+    eviction removes the oldest files first.
+    """
+    
+    def __init__(
+        self,
+        directory: Path = CACHE_DIR,
+        max_bytes: int = 500 * 1024 * 1024,
+        ttl_seconds: float = 30 * 24 * 3600
+    ):
+        """
+        Initialize the cache.
+        
+        Args:
+            directory: Directory holding the cache files (created if missing)
+            max_bytes: Size cap; older entries are evicted past it
+            ttl_seconds: Entries unused for longer than this are treated as misses
+        """
+        self.logger = get_logger(__name__)
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+        self.ttl_seconds = ttl_seconds
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        # Total size of the cache files, computed on first write
+        self._size_bytes: Optional[int] = None
+    
+    def _path(self, model_key: str, text: str, speaker: Optional[str], language: Optional[str]) -> Path:
+        """Path of the entry for a phrase."""
+        key = "|".join((model_key, speaker or "", language or "", text))
+        return self.directory / (hashlib.sha256(key.encode("utf-8")).hexdigest() + _SUFFIX)
+    
+    def get(
+        self,
+        model_key: str,
+        text: str,
+        speaker: Optional[str],
+        language: Optional[str]
+    ) -> Optional[Tuple[np.ndarray, int]]:
+        """
+        Look up a phrase.
+        
+        Args:
+            model_key: Model name plus its precision/vocoder variant
+            text: Synthesized text
+            speaker: Speaker name, if any
+            language: Language code, if any
+        
+        Returns:
+            Tuple of (read-only float32 waveform, sample rate), or None on a miss
+        """
+        path = self._path(model_key, text, speaker, language)
+        try:
+            if time.time() - path.stat().st_mtime > self.ttl_seconds:
+                self._remove(path)
+                self.misses += 1
+                return None
+            data = path.read_bytes()
+            # Mark as recently used
+            os.utime(path)
+        except OSError:
+            self.misses += 1
+            return None
+        
+        if len(data) < _HEADER.size or (len(data) - _HEADER.size) % 4:
+            # Truncated or not one of ours
+            self._remove(path)
+            self.misses += 1
+            return None
+        
+        (sample_rate,) = _HEADER.unpack_from(data)
+        waveform = np.frombuffer(data, dtype=np.float32, offset=_HEADER.size)
+        self.hits += 1
+        return waveform, sample_rate
+    
+    def put(
+        self,
+        model_key: str,
+        text: str,
+        speaker: Optional[str],
+        language: Optional[str],
+        waveform: np.ndarray,
+        sample_rate: int
+    ):
+        """Store a phrase, evicting old entries if the cache is over its cap."""
+        path = self._path(model_key, text, speaker, language)
+        data = _HEADER.pack(sample_rate) + np.ascontiguousarray(waveform, dtype=np.float32).tobytes()
+        
+        # Write then rename, so readers never see a partial file
+        temp_path = path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+        try:
+            # Size of the entry being replaced, if any
+            old_size = path.stat().st_size
+        except OSError:
+            old_size = 0
+        try:
+            temp_path.write_bytes(data)
+            os.replace(temp_path, path)
+        except OSError as e:
+            self.logger.warning(f"Failed to write TTS cache entry: {e}")
+            temp_path.unlink(missing_ok=True)
+            return
+        
+        with self._lock:
+            if self._size_bytes is None:
+                self._size_bytes = self._scan_size()
+            else:
+                self._size_bytes += len(data) - old_size
+            if self._size_bytes > self.max_bytes:
+                self._evict()
+    
+    def _scan_size(self) -> int:
+        """Total size of the cache files on disk."""
+        total = 0
+        with os.scandir(self.directory) as entries:
+            for entry in entries:
+                if entry.name.endswith(_SUFFIX):
+                    total += entry.stat().st_size
+        return total
+    
+    def _evict(self):
+        """Remove least recently used entries until the cache is at 90% of its cap."""
+        with os.scandir(self.directory) as entries:
+            files = [
+                (entry.stat().st_mtime, entry.stat().st_size, entry.path)
+                for entry in entries if entry.name.endswith(_SUFFIX)
+            ]
+        files.sort()
+        
+        size = sum(file_size for _, file_size, _ in files)
+        target = self.max_bytes * 0.9
+        removed = 0
+        for _, file_size, file_path in files:
+            if size <= target:
+                break
+            if self._remove(Path(file_path)):
+                size -= file_size
+                removed += 1
+        
+        self._size_bytes = size
+        self.logger.debug(f"Evicted {removed} TTS cache entries")
+    
+    @staticmethod
+    def _remove(path: Path) -> bool:
+        """Delete one entry, ignoring entries another process already removed."""
+        try:
+            path.unlink()
+            return True
+        except OSError:
+            return False
+    
+    def stats(self) -> Dict:
+        """
+        Get cache statistics.
+        
+        Returns:
+            Dictionary with hits, misses, entries, size_bytes and max_bytes
+        """
+        with os.scandir(self.directory) as entries:
+            sizes = [entry.stat().st_size for entry in entries if entry.name.endswith(_SUFFIX)]
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "entries": len(sizes),
+            "size_bytes": sum(sizes),
+            "max_bytes": self.max_bytes
+        }
@@ -8,16 +8,445 @@ import torch
 from TTS.api import TTS
 import sounddevice as sd
 import soundfile as sf
+import asyncio
+import functools
+import io
+import itertools
+import numpy as np
+import re
+import threading
 import time
-from pathlib import Path
-from typing import Optional, Dict, List
-import tempfile
-import os
+import weakref
+from collections import OrderedDict
+from contextlib import contextmanager
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
 from src.config.config_schema import TTSConfig
 from src.utils.logger import get_logger, log_performance, log_timing
-from src.utils.memory_manager import temp_file, get_memory_manager
+from src.utils.memory_manager import get_memory_manager
+from src.utils.sentence_splitter import SentenceSplitter
 from src.interfaces.engines import TTSEngineInterface
 
+# Loaded models shared by every TTSEngine in the process (keeps the model
+# resident and CUDA warm across instances):
+# "{model_name}_{device}_{precision}" -> (TTS, lock serializing synthesis on that model)
+_model_cache: Dict[str, Tuple[TTS, threading.Lock]] = {}
+_model_cache_lock = threading.Lock()
+# One synthesis at a time per CUDA device: concurrent Coqui calls on one GPU
+# interleave streams and can spike memory. CPU models get a lock each.
+_device_locks: Dict[str, threading.Lock] = {}
+
+# Recently synthesized waveforms for repeated phrases (LRU):
+# (model_name, text, speaker, language) -> (read-only waveform, sample rate)
+_waveform_cache: "OrderedDict[tuple, Tuple[np.ndarray, int]]" = OrderedDict()
+_waveform_cache_lock = threading.Lock()
+_WAVEFORM_CACHE_SIZE = 64
+# Output files synthesize() cycles through when no output_path is given
+_TEMP_RING_SIZE = 4
+# Streaming playback: the first synthesis unit is cut near this many characters,
+# and later units may grow (doubling) up to the cap
+_FIRST_SEGMENT_CHARS = 40
+_MAX_SEGMENT_CHARS = 320
+# Longer texts are synthesized in sentence chunks of at most this many characters
+_MAX_CHUNK_CHARS = 200
+# Crossfade between chunks when joining them (seconds)
+_CROSSFADE_SECONDS = 0.015
+# Playback ring capacity (seconds) and audio callback block size (samples)
+_RING_SECONDS = 30
+_BLOCK_SIZE = 512
+# Reduced-precision modes for CUDA inference -> autocast dtype. No bf16:
+# Coqui converts model outputs with .numpy(), which has no bfloat16.
+_AUTOCAST_DTYPES = {"fp16": torch.float16}
+# Clause breaks the first unit may be cut at
+_CLAUSE_BREAK = re.compile(r"[,;:]\s+")
+
+
+def _to_pcm16(audio: np.ndarray) -> np.ndarray:
+    """
+    Convert a float waveform in [-1, 1] to contiguous int16 PCM.
+    
+    Handing sounddevice int16 lets PortAudio take the buffer as-is instead
+    of converting float samples for the device, and halves the bytes moved.
+    """
+    # The multiply makes a new array (cached waveforms are read-only), so clip it in place
+    scaled = np.multiply(audio, 32767.0, dtype=np.float32)
+    np.clip(scaled, -32768, 32767, out=scaled)
+    return np.ascontiguousarray(scaled.astype(np.int16, copy=False))
+
+
+def _write_wav(target, audio: np.ndarray, sample_rate: int):
+    """
+    Write a waveform as a 16-bit PCM WAV file or file-like object.
+    
+    Peak-normalized the same way Coqui's tts_to_file saves audio, so the
+    output matches what the model would have written itself.
+    """
+    peak = max(0.01, float(np.max(np.abs(audio)))) if audio.size else 1.0
+    pcm = np.multiply(audio, 32767.0 / peak, dtype=np.float32).astype(np.int16)
+    sf.write(target, pcm, sample_rate, format="WAV", subtype="PCM_16")
+
+
+def _split_sentences(text: str) -> List[str]:
+    """Split text into sentences with the shared SentenceSplitter."""
+    splitter = SentenceSplitter()
+    sentences = splitter.add_text(text)
+    # add_text returns at most one sentence per call; drain the rest of the buffer
+    while True:
+        more = splitter.add_text("")
+        if not more:
+            break
+        sentences.extend(more)
+    remaining = splitter.flush()
+    if remaining:
+        sentences.append(remaining)
+    return sentences
+
+
+def _chunk_text(text: str, max_chars: int = _MAX_CHUNK_CHARS) -> List[str]:
+    """
+    Pack whole sentences into chunks of at most max_chars characters.
+    
+    A single sentence longer than max_chars becomes its own chunk.
+    """
+    chunks: List[str] = []
+    for sentence in _split_sentences(text):
+        if chunks and len(chunks[-1]) + 1 + len(sentence) <= max_chars:
+            chunks[-1] = f"{chunks[-1]} {sentence}"
+        else:
+            chunks.append(sentence)
+    return chunks
+
+
+def _crossfade_concat(waveforms: List[np.ndarray], fade_samples: int) -> np.ndarray:
+    """
+    Join waveforms, overlapping each boundary with a Hann crossfade.
+    
+    Args:
+        waveforms: Float waveforms in order
+        fade_samples: Overlap length in samples (shortened for very short pieces)
+    
+    Returns:
+        New float32 waveform
+    """
+    if len(waveforms) == 1:
+        return np.array(waveforms[0], dtype=np.float32)
+    
+    total = sum(len(w) for w in waveforms)
+    out = np.empty(total, dtype=np.float32)
+    pos = 0
+    for i, waveform in enumerate(waveforms):
+        overlap = min(fade_samples, pos, len(waveform)) if i else 0
+        if overlap:
+            # Rising half of a Hann window; the previous piece fades with its complement
+            fade_in = np.sin(np.linspace(0, np.pi / 2, overlap, dtype=np.float32)) ** 2
+            start = pos - overlap
+            out[start:pos] = out[start:pos] * (1 - fade_in) + waveform[:overlap] * fade_in
+        out[pos:pos + len(waveform) - overlap] = waveform[overlap:]
+        pos += len(waveform) - overlap
+    return out[:pos]
+
+
+def _memoize_speaker_embeddings(tts: TTS):
+    """
+    Cache a multi-speaker model's per-speaker embeddings.
+    
+    Models that condition on d-vectors (e.g. YourTTS) look up a named
+    speaker's embedding by averaging its reference clips' embeddings on
+    every synthesis. The result only depends on the speaker, so it is
+    computed once per speaker (random sampling is left uncached).
+    """
+    tts_model = getattr(getattr(tts, "synthesizer", None), "tts_model", None)
+    manager = getattr(tts_model, "speaker_manager", None)
+    compute = getattr(manager, "get_mean_embedding", None)
+    if compute is None:
+        return
+    
+    embeddings = {}
+    
+    @functools.wraps(compute)
+    def get_mean_embedding(speaker_idx, num_samples=None, randomize=False):
+        if randomize:
+            return compute(speaker_idx, num_samples, randomize)
+        key = (speaker_idx, num_samples)
+        if key not in embeddings:
+            embeddings[key] = compute(speaker_idx, num_samples, randomize)
+        return embeddings[key]
+    
+    manager.get_mean_embedding = get_mean_embedding
+
+
+def _length_buckets(lengths: List[int], tolerance: float = 0.1, max_batch: int = 8) -> List[List[int]]:
+    """
+    Group items of similar length so padded batches waste little compute.
+    
+    Args:
+        lengths: Length of each item
+        tolerance: Longest item in a bucket may exceed the shortest by this fraction
+        max_batch: Maximum items per bucket
+    
+    Returns:
+        Lists of item indices, one per bucket
+    """
+    buckets: List[List[int]] = []
+    shortest = 0
+    for index in sorted(range(len(lengths)), key=lengths.__getitem__):
+        if (
+            buckets
+            and len(buckets[-1]) < max_batch
+            and lengths[index] <= shortest * (1 + tolerance)
+        ):
+            buckets[-1].append(index)
+        else:
+            buckets.append([index])
+            shortest = lengths[index]
+    return buckets
+
+
+def _progressive_segments(sentences: List[str]) -> List[str]:
+    """
+    Regroup sentences into synthesis units that start short and grow.
+    
+    A long first sentence is cut at its first clause break so the first
+    audio is ready sooner; after that each unit may hold about twice as
+    many characters as the one before (whole sentences only), so fewer,
+    longer syntheses keep ahead of playback.
+    
+    Args:
+        sentences: Sentences in speaking order
+    
+    Returns:
+        Text units to synthesize in order
+    """
+    sentences = list(sentences)
+    if sentences and len(sentences[0]) > _FIRST_SEGMENT_CHARS:
+        match = _CLAUSE_BREAK.search(sentences[0], _FIRST_SEGMENT_CHARS // 2, len(sentences[0]) - 10)
+        if match:
+            first = sentences.pop(0)
+            sentences[:0] = [first[:match.start() + 1], first[match.end():]]
+    
+    segments: List[str] = []
+    target = 0
+    for sentence in sentences:
+        if segments and len(segments[-1]) + len(sentence) < target:
+            segments[-1] = f"{segments[-1]} {sentence}"
+        else:
+            if segments:
+                target = min(max(target, len(segments[-1])) * 2, _MAX_SEGMENT_CHARS)
+            segments.append(sentence)
+    return segments
+
+
+@functools.lru_cache(maxsize=1)
+def _available_models() -> Tuple[str, ...]:
+    """Model names from Coqui's bundled model index (read once per process)."""
+    # ModelManager only parses the index; TTS() would also set up a synthesizer
+    from TTS.utils.manager import ModelManager
+    return tuple(ModelManager(progress_bar=False).list_models())
+
+
+class _AudioOutput:
+    """
+    One long-lived output stream fed from a ring buffer.
+    
+    Opening a stream per utterance costs tens of milliseconds on some
+    drivers and leaves a gap between utterances. This stream stays open:
+    its callback drains a preallocated ring and plays silence while the
+    ring is empty, so back-to-back utterances play without gaps.
+    
+    Positions are running sample counts. Only the callback advances the
+    read position and only a writer holding write_lock advances the write
+    position, so the audio thread never takes a lock.
+    """
+    
+    def __init__(self, sample_rate: int, seconds: int = _RING_SECONDS):
+        """
+        Open and start the stream.
+        
+        Args:
+            sample_rate: Stream sample rate
+            seconds: Ring capacity; writers wait while it is full
+        """
+        self.sample_rate = sample_rate
+        self.write_lock = threading.Lock()
+        self._ring = np.zeros(sample_rate * seconds, dtype=np.int16)
+        self._written = 0
+        self._read = 0
+        # Playback skips ahead to this position (see flush)
+        self._flush_to = 0
+        # (position, callback) pairs, called once playback passes position
+        self._marks: List[Tuple[int, Callable[[], None]]] = []
+        self._consumed = threading.Event()
+        self.stream = sd.OutputStream(
+            samplerate=sample_rate,
+            channels=1,
+            dtype="int16",
+            blocksize=_BLOCK_SIZE,
+            callback=self._fill
+        )
+        self.stream.start()
+    
+    @property
+    def position(self) -> int:
+        """Number of samples written so far."""
+        return self._written
+    
+    def write(self, pcm: np.ndarray, cancelled: threading.Event) -> bool:
+        """
+        Append samples, waiting for room while the ring is full.
+        
+        Call with write_lock held.
+        
+        Args:
+            pcm: int16 samples
+            cancelled: Stops writing once set
+        
+        Returns:
+            False if cancelled before all samples were written
+        """
+        size = len(self._ring)
+        offset = 0
+        while offset < len(pcm):
+            if cancelled.is_set():
+                return False
+            free = size - (self._written - self._read)
+            if free == 0:
+                self._consumed.clear()
+                # Re-check after clearing, in case the callback ran in between
+                if size - (self._written - self._read) == 0:
+                    self._consumed.wait(0.1)
+                continue
+            
+            count = min(free, len(pcm) - offset)
+            start = self._written % size
+            first = min(count, size - start)
+            self._ring[start:start + first] = pcm[offset:offset + first]
+            self._ring[:count - first] = pcm[offset + first:offset + count]
+            # Publish only after the samples are in place
+            self._written += count
+            offset += count
+        return True
+    
+    def mark(self, position: int, callback: Callable[[], None]):
+        """Call callback (from the audio thread) once playback passes position."""
+        self._marks.append((position, callback))
+    
+    def flush(self, position: int):
+        """Skip playback of everything written before position."""
+        self._flush_to = max(self._flush_to, position)
+    
+    def _fill(self, outdata, frames, time_info, status):
+        """Audio callback: copy ring samples into the device buffer."""
+        out = outdata[:, 0]
+        read = max(self._read, self._flush_to)
+        count = min(frames, self._written - read)
+        size = len(self._ring)
+        start = read % size
+        first = min(count, size - start)
+        out[:first] = self._ring[start:start + first]
+        out[first:count] = self._ring[:count - first]
+        out[count:] = 0
+        self._read = read + count
+        self._consumed.set()
+        
+        if self._marks:
+            due = [mark for mark in self._marks if mark[0] <= self._read]
+            for mark in due:
+                self._marks.remove(mark)
+                mark[1]()
+    
+    def close(self):
+        """Close the stream and release anyone waiting on a mark."""
+        self.stream.abort()
+        self.stream.close()
+        marks, self._marks = self._marks, []
+        for _, callback in marks:
+            callback()
+
+
+class _Playback:
+    """
+    One utterance queued on an _AudioOutput.
+    
+    A worker thread (run) writes each synthesized unit to the ring while
+    earlier units play, so synthesis of the next unit overlaps playback
+    of the current one. The utterance counts as finished once its last
+    sample has been handed to the device.
+    """
+    
+    def __init__(self):
+        self.cancelled = threading.Event()
+        # Set once the first unit is queued (or nothing will play)
+        self.started = threading.Event()
+        self.finished = threading.Event()
+        self.error: Optional[Exception] = None
+        self.sample_rate: Optional[int] = None
+        self.output: Optional[_AudioOutput] = None
+        # Ring position just past this utterance's samples
+        self._end = 0
+        self._callbacks = []
+        self._lock = threading.Lock()
+    
+    def run(self, waveforms: Iterator[Tuple[np.ndarray, int]], get_output: Callable[[int], _AudioOutput]):
+        """
+        Queue waveforms for playback.
+        
+        Args:
+            waveforms: (waveform, sample rate) units, synthesized lazily
+            get_output: Returns the engine's output stream for a sample rate
+        """
+        try:
+            for audio_data, sample_rate in waveforms:
+                if self.cancelled.is_set():
+                    break
+                pcm = _to_pcm16(audio_data)
+                output = get_output(sample_rate)
+                with output.write_lock:
+                    written = output.write(pcm, self.cancelled)
+                    self._end = output.position
+                self.output = output
+                self.sample_rate = sample_rate
+                self.started.set()
+                if not written:
+                    break
+        except Exception as e:
+            self.error = e
+        
+        self.started.set()
+        if self.output is None:
+            # Nothing played: empty text, cancelled, or the first unit failed
+            self._on_finished()
+            return
+        
+        with self.output.write_lock:
+            if self.cancelled.is_set():
+                self.output.flush(self._end)
+            self.output.mark(self._end, self._on_finished)
+    
+    def _on_finished(self):
+        """Mark the utterance finished and run done callbacks."""
+        with self._lock:
+            self.finished.set()
+            callbacks, self._callbacks = self._callbacks, []
+        for callback in callbacks:
+            callback()
+    
+    def add_done_callback(self, callback: Callable[[], None]):
+        """Call callback (from an audio thread) once playback ends, or now if it has."""
+        with self._lock:
+            if not self.finished.is_set():
+                self._callbacks.append(callback)
+                return
+        callback()
+    
+    def cancel(self):
+        """Stop playback at the next audio block."""
+        if self.cancelled.is_set():
+            return
+        self.cancelled.set()
+        output = self.output
+        if output is not None:
+            # This is the newest utterance, so everything written so far is its own
+            output.flush(output.position)
+
 
 class TTSEngine(TTSEngineInterface):
     """
@@ -30,7 +459,13 @@ class TTSEngine(TTSEngineInterface):
         self,
         config: Optional[TTSConfig] = None,
         model_name: Optional[str] = None,
-        device: Optional[str] = None
+        device: Optional[str] = None,
+        warmup: bool = True,
+        use_cache: bool = True,
+        precision: str = "fp32",
+        quantize_on_cpu: bool = True,
+        compile_vocoder: bool = False,
+        disk_cache_mb: int = 500
     ):
         """
         Initialize the TTS engine.
@@ -39,40 +474,471 @@ class TTSEngine(TTSEngineInterface):
             config: TTSConfig object (takes precedence over individual params)
             model_name: TTS model name (see TTS.list_models() for options)
             device: Device to use ("cuda" or "cpu"). Auto-detects if None.
+            warmup: Synthesize a short phrase after loading on GPU so CUDA
+                    context and kernel setup aren't paid by the first reply
+            use_cache: Share an already loaded model instead of loading
+                       another copy
+            precision: "fp32" or "fp16". Reduced precision runs
+                       synthesis under autocast on CUDA (fp16 also stores
+                       the weights in half precision). Ignored on CPU.
+            quantize_on_cpu: On CPU, quantize the acoustic model's linear
+                             and LSTM layers to int8 (dynamic quantization)
+            compile_vocoder: On CUDA, compile the vocoder with torch.compile
+                             in reduce-overhead mode (CUDA graphs). The first
+                             call for each new mel length compiles.
+            disk_cache_mb: Size cap of the on-disk phrase cache in MB
+                           (0 disables it)
+        
+        Raises:
+            ValueError: If precision is not one of the supported values
         """
         # Use config if provided, otherwise use individual params or defaults
         if config:
             model_name = config.model_name
             device = config.device
+            precision = config.precision
+            quantize_on_cpu = config.quantize_on_cpu
+            compile_vocoder = config.compile_vocoder
+            disk_cache_mb = config.disk_cache_mb
         else:
             model_name = model_name or "tts_models/en/ljspeech/tacotron2-DDC"
         
         if device is None:
             device = "cuda" if torch.cuda.is_available() else "cpu"
         
+        if precision != "fp32" and precision not in _AUTOCAST_DTYPES:
+            raise ValueError(f"Unsupported TTS precision: {precision} (expected fp32 or fp16)")
+        if device != "cuda":
+            # "int8" is only ever set here: it marks a CPU model with quantized layers
+            precision = "int8" if quantize_on_cpu else "fp32"
+        
         self.device = device
         self.model_name = model_name
+        self.precision = precision
+        self._autocast_dtype = _AUTOCAST_DTYPES.get(precision)
+        self.compile_vocoder = compile_vocoder and device == "cuda"
+        # Identifies the model configuration in the phrase caches, so audio
+        # synthesized at another precision or with another vocoder isn't replayed
+        self._model_key = f"{model_name}|{precision}{'|compiled' if self.compile_vocoder else ''}"
         self.logger = get_logger(__name__)
+        # Reused temp output paths, created on first use (see _next_temp_path)
+        self._temp_paths: Optional[itertools.cycle] = None
+        # Utterance currently playing (see _start_playback)
+        self._playback: Optional[_Playback] = None
+        self._playback_lock = threading.Lock()
+        # Output stream, opened on first playback and kept open (see _audio_output)
+        self._output: Optional[_AudioOutput] = None
+        self._close_output: Optional[weakref.finalize] = None
+        # Pinned host buffer for batched outputs, grown on demand (see _to_host)
+        self._pinned_out: Optional[torch.Tensor] = None
+        # Synthesized phrases kept across restarts (behind the in-memory cache)
+        self._disk_cache = None
+        if disk_cache_mb > 0:
+            from src.backend.tts_disk_cache import WaveformDiskCache
+            try:
+                self._disk_cache = WaveformDiskCache(max_bytes=disk_cache_mb * 1024 * 1024)
+            except OSError as e:
+                self.logger.warning(f"TTS disk cache disabled: {e}")
         
         self.logger.info(f"Loading TTS model: {model_name}")
         self.logger.debug(f"  Device: {device}")
+        self.logger.debug(f"  Precision: {precision}")
         
+        self._cache_key = (
+            f"{model_name}_{device}_{precision}{'_compiled' if self.compile_vocoder else ''}"
+            if use_cache else None
+        )
+        loaded = False
         try:
-            with log_timing(f"TTS model loading ({model_name})", self.logger):
-                self.tts = TTS(model_name).to(device)
-            self.logger.info("TTS model loaded successfully!")
+            with _model_cache_lock:
+                if self._cache_key in _model_cache:
+                    self.logger.info(f"Using cached TTS model {model_name}")
+                    self.tts, self._synthesis_lock = _model_cache[self._cache_key]
+                else:
+                    with log_timing(f"TTS model loading ({model_name})", self.logger):
+                        self.tts = self._load_model()
+                    if device == "cuda":
+                        self._synthesis_lock = _device_locks.setdefault(device, threading.Lock())
+                    else:
+                        self._synthesis_lock = threading.Lock()
+                    if self._cache_key:
+                        _model_cache[self._cache_key] = (self.tts, self._synthesis_lock)
+                    loaded = True
+                    self.logger.info("TTS model loaded successfully!")
             
             # Get model info
             self.speaker = None
             self.language = None
-            if hasattr(self.tts, 'speakers') and self.tts.speakers:
-                self.speaker = self.tts.speakers[0] if len(self.tts.speakers) > 0 else None
-            if hasattr(self.tts, 'language'):
-                self.language = self.tts.language
+            speakers = getattr(self.tts, 'speakers', None) or []
+            if speakers:
+                self.speaker = speakers[0]
             
+            # Voice capabilities, resolved once for _voice_kwargs and
+            # get_model_info (a reload keeps the same model)
+            self._speakers = list(speakers)
+            self._speaker_set = frozenset(speakers)
+            self._has_language = hasattr(self.tts, 'language')
+            if self._has_language:
+                self.language = self.tts.language
+        
         except Exception as e:
             self.logger.error(f"Error loading TTS model: {e}", exc_info=True)
             raise
+        
+        # A cached model is already warm
+        if warmup and loaded and device == "cuda":
+            self._warmup()
+    
+    def _load_model(self) -> TTS:
+        """Load the model onto the device in the configured precision."""
+        tts = TTS(self.model_name).to(self.device)
+        if self.precision == "fp16":
+            # Half-precision weights halve VRAM; autocast keeps mixed ops consistent
+            synthesizer = tts.synthesizer
+            for name in ("tts_model", "vocoder_model"):
+                module = getattr(synthesizer, name, None)
+                if module is not None:
+                    module.half()
+        elif self.precision == "int8":
+            self._quantize_for_cpu(tts)
+        if self.compile_vocoder:
+            self._compile_vocoder(tts)
+        _memoize_speaker_embeddings(tts)
+        return tts
+    
+    def _compile_vocoder(self, tts: TTS):
+        """
+        Compile the vocoder's inference call with CUDA graphs.
+        
+        The vocoder is a fixed stack of convolutions, so compiling it removes
+        most per-kernel launch overhead. The autoregressive acoustic model
+        changes shape every step and is left eager. Lengths are marked
+        dynamic so new utterance lengths don't each force a full recompile.
+        """
+        vocoder = getattr(getattr(tts, "synthesizer", None), "vocoder_model", None)
+        if vocoder is None or not hasattr(torch, "compile"):
+            self.logger.warning("No separate vocoder or torch.compile unavailable; not compiling")
+            return
+        vocoder.inference = torch.compile(vocoder.inference, mode="reduce-overhead", dynamic=True)
+        self.logger.info("TTS vocoder compiled (first syntheses will be slower)")
+    
+    def _quantize_for_cpu(self, tts: TTS):
+        """
+        Swap the acoustic model's linear and LSTM layers for int8 versions.
+        
+        Weights are quantized once at load; activations are quantized per
+        call. The vocoder is mostly convolutions, which dynamic quantization
+        doesn't cover, so it is left as is. Falls back to fp32 on failure.
+        """
+        synthesizer = getattr(tts, "synthesizer", None)
+        model = getattr(synthesizer, "tts_model", None)
+        if model is None:
+            return
+        try:
+            with log_timing("TTS int8 quantization", self.logger):
+                synthesizer.tts_model = torch.quantization.quantize_dynamic(
+                    model,
+                    {torch.nn.Linear, torch.nn.LSTM, torch.nn.LSTMCell},
+                    dtype=torch.qint8
+                )
+        except Exception as e:
+            self.logger.warning(f"TTS int8 quantization failed, using fp32: {e}")
+    
+    @contextmanager
+    def _inference(self):
+        """Context for running the model: no autograd, autocast for reduced precision."""
+        with torch.inference_mode():
+            if self._autocast_dtype is None:
+                yield
+            else:
+                with torch.autocast("cuda", dtype=self._autocast_dtype):
+                    yield
+    
+    def _reload_model(self):
+        """
+        Replace the loaded model with a fresh copy.
+        
+        Used when Tacotron2's attention state is corrupted. The shared cache
+        entry is updated so other engines pick up the new model too; the
+        synthesis lock is kept.
+        """
+        self.tts = None
+        get_memory_manager().clear_gpu_cache()
+        self.tts = self._load_model()
+        if self._cache_key:
+            with _model_cache_lock:
+                _model_cache[self._cache_key] = (self.tts, self._synthesis_lock)
+    
+    def _warmup(self):
+        """Run one short synthesis to initialize CUDA kernels and buffers."""
+        kwargs = {"speaker": self.speaker} if self.speaker else {}
+        try:
+            with log_timing("TTS warmup", self.logger), self._synthesis_lock, self._inference():
+                self.tts.tts(text="Warming up.", **kwargs)
+        except Exception as e:
+            self.logger.warning(f"TTS warmup failed: {e}")
+    
+    def _voice_kwargs(self, speaker: Optional[str], language: Optional[str]) -> Dict:
+        """Speaker/language arguments the loaded model accepts."""
+        if speaker and speaker in self._speaker_set:
+            return {"speaker": speaker}
+        if language and self._has_language:
+            return {"language": language}
+        return {}
+    
+    def _next_temp_path(self) -> str:
+        """
+        Get the next output path from a small ring of reused temp files.
+        
+        Overwriting a few fixed files avoids creating (and leaking) a new
+        temp file per call. The directory is registered with the memory
+        manager, so cleanup_temp_dirs() removes it.
+        """
+        if self._temp_paths is None:
+            with get_memory_manager().temp_directory(delete=False) as temp_dir:
+                paths = [str(temp_dir / f"tts_{i}.wav") for i in range(_TEMP_RING_SIZE)]
+            self._temp_paths = itertools.cycle(paths)
+        return next(self._temp_paths)
+    
+    def _synthesize_array(
+        self,
+        text: str,
+        speaker: Optional[str] = None,
+        language: Optional[str] = None
+    ) -> Tuple[np.ndarray, int]:
+        """
+        Synthesize to an in-memory waveform (no file I/O).
+        
+        Args:
+            text: Text to synthesize
+            speaker: Speaker ID (for multi-speaker models)
+            language: Language code (for multi-language models)
+        
+        Returns:
+            Tuple of (float32 waveform, sample rate); the waveform may be
+            shared with the phrase cache and is read-only
+        """
+        cached = self._cached_waveform(text, speaker, language)
+        if cached is not None:
+            return cached
+        
+        voice = self._voice_kwargs(speaker, language)
+        try:
+            wav = self._run_tts(text, voice)
+        except RuntimeError as e:
+            # Tacotron2 tensor size mismatch (internal state corruption): reload once and retry
+            if not ("size of tensor" in str(e) and "must match" in str(e)):
+                raise
+            self.logger.warning(f"TTS tensor size mismatch (likely state corruption): {e}")
+            self._reload_model()
+            wav = self._run_tts(text, voice)
+        
+        return self._cache_waveform(text, speaker, language, wav)
+    
+    def _run_tts(self, text: str, voice: Dict) -> List[float]:
+        """
+        Make one model call, holding the device lock and inference context.
+        
+        Args:
+            text: Text to synthesize
+            voice: Arguments from _voice_kwargs
+        
+        Returns:
+            Waveform as returned by Coqui's TTS.tts
+        """
+        with self._synthesis_lock, self._inference():
+            return self.tts.tts(text=text, **voice)
+    
+    def _synthesize_text(
+        self,
+        text: str,
+        speaker: Optional[str] = None,
+        language: Optional[str] = None
+    ) -> Tuple[np.ndarray, int]:
+        """
+        Synthesize text of any length to one waveform.
+        
+        Texts over _MAX_CHUNK_CHARS are synthesized in sentence chunks
+        (batched where the model allows) and joined with a short crossfade,
+        which keeps memory use bounded and avoids the quality loss models
+        show on very long inputs. Shorter texts go straight through.
+        """
+        if len(text) <= _MAX_CHUNK_CHARS:
+            return self._synthesize_array(text, speaker=speaker, language=language)
+        
+        chunks = _chunk_text(text)
+        if len(chunks) == 1:
+            return self._synthesize_array(text, speaker=speaker, language=language)
+        
+        pieces = self.synthesize_many(chunks, speaker=speaker, language=language)
+        sample_rate = pieces[0][1]
+        waveform = _crossfade_concat([wav for wav, _ in pieces], int(sample_rate * _CROSSFADE_SECONDS))
+        return waveform, sample_rate
+    
+    def _sample_rate(self) -> int:
+        """Output sample rate of the loaded model."""
+        return getattr(getattr(self.tts, "synthesizer", None), "output_sample_rate", None) or 22050
+    
+    def _cached_waveform(
+        self,
+        text: str,
+        speaker: Optional[str],
+        language: Optional[str]
+    ) -> Optional[Tuple[np.ndarray, int]]:
+        """Look up a phrase in the in-memory waveform cache, then on disk."""
+        cache_key = (self._model_key, text, speaker, language)
+        with _waveform_cache_lock:
+            cached = _waveform_cache.get(cache_key)
+            if cached is not None:
+                _waveform_cache.move_to_end(cache_key)
+                self.logger.debug("TTS phrase cache hit")
+                return cached
+        
+        if self._disk_cache is None:
+            return None
+        cached = self._disk_cache.get(*cache_key)
+        if cached is not None:
+            self.logger.debug("TTS disk cache hit")
+            self._remember_waveform(cache_key, cached)
+        return cached
+    
+    @staticmethod
+    def _remember_waveform(cache_key: tuple, entry: Tuple[np.ndarray, int]):
+        """Add an entry to the in-memory waveform cache."""
+        with _waveform_cache_lock:
+            _waveform_cache[cache_key] = entry
+            if len(_waveform_cache) > _WAVEFORM_CACHE_SIZE:
+                _waveform_cache.popitem(last=False)
+    
+    def _cache_waveform(
+        self,
+        text: str,
+        speaker: Optional[str],
+        language: Optional[str],
+        wav
+    ) -> Tuple[np.ndarray, int]:
+        """Store a synthesized phrase as a read-only float32 waveform and return it."""
+        waveform = np.asarray(wav, dtype=np.float32)
+        waveform.flags.writeable = False
+        entry = (waveform, self._sample_rate())
+        
+        cache_key = (self._model_key, text, speaker, language)
+        self._remember_waveform(cache_key, entry)
+        if self._disk_cache is not None:
+            self._disk_cache.put(*cache_key, *entry)
+        
+        return entry
+    
+    def _supports_batching(self, speaker: Optional[str], language: Optional[str]) -> bool:
+        """
+        Whether texts can be synthesized in one padded batch.
+        
+        Coqui's VITS inference takes per-item input lengths; Tacotron2 stops
+        decoding on a batch-wide stop token, so it runs one text at a time.
+        Multi-speaker/multi-language requests also go one at a time.
+        """
+        model = getattr(getattr(self.tts, "synthesizer", None), "tts_model", None)
+        return (
+            type(model).__name__ == "Vits"
+            and not self._voice_kwargs(speaker, language)
+            and hasattr(model, "tokenizer")
+        )
+    
+    def _synthesize_batch(self, texts: List[str]) -> List[np.ndarray]:
+        """
+        Run one padded VITS forward pass for several texts.
+        
+        Args:
+            texts: Texts of similar length
+        
+        Returns:
+            Waveforms (float32, trimmed to each text's length) in input order
+        """
+        from torch.nn.utils.rnn import pad_sequence
+        
+        model = self.tts.synthesizer.tts_model
+        token_ids = [torch.as_tensor(model.tokenizer.text_to_ids(text), dtype=torch.long) for text in texts]
+        device = next(model.parameters()).device
+        inputs = pad_sequence(token_ids, batch_first=True)
+        lengths = torch.tensor([len(ids) for ids in token_ids])
+        inputs = inputs.to(device)
+        lengths = lengths.to(device)
+        hop_length = model.config.audio.hop_length
+        
+        with self._synthesis_lock, self._inference():
+            outputs = model.inference(inputs, aux_input={"x_lengths": lengths})
+            waveforms = self._to_host(outputs["model_outputs"].squeeze(1).float())
+            # y_mask marks each item's valid spectrogram frames
+            frames = outputs["y_mask"].sum(dim=(1, 2)).long().cpu().tolist()
+            # Copy out of the host buffer before releasing the lock; the next batch reuses it
+            return [waveforms[i, :frames[i] * hop_length].copy() for i in range(len(texts))]
+    
+    def _to_host(self, tensor: torch.Tensor) -> np.ndarray:
+        """
+        Copy a float32 tensor to host memory.
+        
+        CUDA tensors are copied into a reused pinned buffer, which avoids
+        staging through pageable memory. The returned array is a view of
+        that buffer and is only valid until the next call.
+        
+        Args:
+            tensor: float32 tensor on any device
+        
+        Returns:
+            numpy array with the tensor's shape
+        """
+        if tensor.device.type != "cuda":
+            return tensor.numpy()
+        
+        size = tensor.numel()
+        if self._pinned_out is None or self._pinned_out.numel() < size:
+            self._pinned_out = torch.empty(size, dtype=torch.float32, pin_memory=True)
+        host = self._pinned_out[:size].view(tensor.shape)
+        host.copy_(tensor, non_blocking=True)
+        torch.cuda.current_stream(tensor.device).synchronize()
+        return host.numpy()
+    
+    def synthesize_many(
+        self,
+        texts: List[str],
+        speaker: Optional[str] = None,
+        language: Optional[str] = None
+    ) -> List[Tuple[np.ndarray, int]]:
+        """
+        Synthesize several texts to in-memory waveforms.
+        
+        Cached phrases are reused and duplicates synthesized once. On models
+        that support it (VITS), the rest run as padded batches of similar
+        length; other models synthesize them one at a time.
+        
+        Args:
+            texts: Texts to synthesize
+            speaker: Speaker ID (for multi-speaker models)
+            language: Language code (for multi-language models)
+        
+        Returns:
+            List of (float32 waveform, sample rate) tuples in input order;
+            waveforms are read-only
+        """
+        results: Dict[str, Tuple[np.ndarray, int]] = {}
+        pending = []
+        for text in dict.fromkeys(texts):
+            cached = self._cached_waveform(text, speaker, language)
+            if cached is not None:
+                results[text] = cached
+            else:
+                pending.append(text)
+        
+        if len(pending) > 1 and self._supports_batching(speaker, language):
+            for bucket in _length_buckets([len(text) for text in pending]):
+                batch = [pending[i] for i in bucket]
+                for text, wav in zip(batch, self._synthesize_batch(batch)):
+                    results[text] = self._cache_waveform(text, speaker, language, wav)
+        else:
+            for text in pending:
+                results[text] = self._synthesize_array(text, speaker=speaker, language=language)
+        
+        return [results[text] for text in texts]
     
     @log_performance("TTS Synthesis")
     def synthesize(
@@ -87,10 +953,12 @@ class TTSEngine(TTSEngineInterface):
         
         Args:
             text: Text to synthesize
-            output_path: Output file path (creates temp file if None)
+            output_path: Output file path. If None, one of a few reused temp
+                         files is written; it is overwritten after
+                         another few calls, so copy it if it must persist.
             speaker: Speaker ID (for multi-speaker models)
             language: Language code (for multi-language models)
-            
+        
         Returns:
             Dictionary with synthesis results:
             {
@@ -102,152 +970,231 @@ class TTSEngine(TTSEngineInterface):
         """
         self.logger.debug(f"Synthesizing text: '{text[:50]}{'...' if len(text) > 50 else ''}'")
         
-        # Use temp file if no output path provided
-        if output_path is None:
-            with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as f:
-                output_path = f.name
-            temp_file = True
-        else:
-            temp_file = False
-        
+        # Synthesize in memory (sharing the phrase cache); the only disk I/O is the final write
         try:
-            # Synthesize
-            if speaker and hasattr(self.tts, 'speakers') and speaker in self.tts.speakers:
-                self.tts.tts_to_file(
-                    text=text,
-                    file_path=output_path,
-                    speaker=speaker
-                )
-            elif language and hasattr(self.tts, 'language'):
-                self.tts.tts_to_file(
-                    text=text,
-                    file_path=output_path,
-                    language=language
-                )
-            else:
-                self.tts.tts_to_file(
-                    text=text,
-                    file_path=output_path
-                )
-            
-            # Get sample rate from audio file
-            try:
-                audio_data, sample_rate = sf.read(output_path)
-            except:
-                sample_rate = 22050  # Default for most TTS models
-            
-            result = {
-                "output_path": output_path,
-                "duration": 0,  # Will be set by decorator
-                "text": text,
-                "sample_rate": sample_rate,
-                "is_temp": temp_file
-            }
-            
-            self.logger.debug(f"Synthesis complete: {output_path}")
-            
-            return result
-            
-        except RuntimeError as e:
-            # Handle Tacotron2 tensor size mismatch (internal state corruption)
-            if "size of tensor" in str(e) and "must match" in str(e):
-                self.logger.warning(f"TTS tensor size mismatch (likely state corruption): {e}")
-                self.logger.info("Attempting to reset TTS model state by reinitializing...")
-                # Try to reset by reinitializing the model
-                try:
-                    old_model = self.tts
-                    self.tts = TTS(self.model_name).to(self.device)
-                    # Retry synthesis once
-                    if speaker and hasattr(self.tts, 'speakers') and speaker in self.tts.speakers:
-                        self.tts.tts_to_file(text=text, file_path=output_path, speaker=speaker)
-                    elif language and hasattr(self.tts, 'language'):
-                        self.tts.tts_to_file(text=text, file_path=output_path, language=language)
-                    else:
-                        self.tts.tts_to_file(text=text, file_path=output_path)
-                    
-                    # Get sample rate
-                    try:
-                        audio_data, sample_rate = sf.read(output_path)
-                    except:
-                        sample_rate = 22050
-                    
-                    result = {
-                        "output_path": output_path,
-                        "duration": 0,
-                        "text": text,
-                        "sample_rate": sample_rate,
-                        "is_temp": temp_file
-                    }
-                    self.logger.info("TTS synthesis succeeded after model reset")
-                    return result
-                except Exception as retry_error:
-                    self.logger.error(f"TTS synthesis failed even after reset: {retry_error}", exc_info=True)
-                    if temp_file and Path(output_path).exists():
-                        os.unlink(output_path)
-                    raise
-            
-            # Other runtime errors
-            self.logger.error(f"Error during synthesis: {e}", exc_info=True)
-            if temp_file and Path(output_path).exists():
-                os.unlink(output_path)
-            raise
+            audio_data, sample_rate = self._synthesize_text(text, speaker=speaker, language=language)
         except Exception as e:
             self.logger.error(f"Error during synthesis: {e}", exc_info=True)
-            # Cleanup temp file on error
-            if temp_file and Path(output_path).exists():
-                os.unlink(output_path)
             raise
+        
+        # Use temp file if no output path provided
+        temp_file = output_path is None
+        if temp_file:
+            output_path = self._next_temp_path()
+        _write_wav(output_path, audio_data, sample_rate)
+        
+        self.logger.debug(f"Synthesis complete: {output_path}")
+        
+        return {
+            "output_path": output_path,
+            "duration": 0,  # Will be set by decorator
+            "text": text,
+            "sample_rate": sample_rate,
+            "is_temp": temp_file
+        }
+    
+    async def asynthesize(
+        self,
+        text: str,
+        output_path: Optional[str] = None,
+        speaker: Optional[str] = None,
+        language: Optional[str] = None
+    ) -> Dict:
+        """
+        Async version of synthesize() for use inside an event loop.
+        
+        Synthesis runs on a worker thread; concurrent calls queue on the
+        device's synthesis lock there instead of blocking the loop.
+        
+        Args:
+            text: Text to synthesize
+            output_path: Output file path (see synthesize)
+            speaker: Speaker ID (for multi-speaker models)
+            language: Language code (for multi-language models)
+        
+        Returns:
+            Same dictionary as synthesize()
+        """
+        return await asyncio.to_thread(self.synthesize, text, output_path, speaker, language)
+    
+    async def asynthesize_to_bytes(
+        self,
+        text: str,
+        speaker: Optional[str] = None,
+        language: Optional[str] = None
+    ) -> bytes:
+        """
+        Async version of synthesize_to_bytes() (runs on a worker thread).
+        
+        Args:
+            text: Text to synthesize
+            speaker: Speaker ID (for multi-speaker models)
+            language: Language code (for multi-language models)
+        
+        Returns:
+            Audio data as bytes (WAV format)
+        """
+        return await asyncio.to_thread(self.synthesize_to_bytes, text, speaker, language)
     
     def speak(
         self,
         text: str,
         speaker: Optional[str] = None,
         language: Optional[str] = None,
-        wait: bool = True
+        wait: bool = True,
+        stream: bool = False,
+        output_path: Optional[str] = None
     ) -> Dict:
         """
         Synthesize and play audio.
         
+        Playback runs on the audio device's callback thread. Starting a new
+        utterance stops the current one, and stop_speaking() cuts it off.
+        
         Args:
             text: Text to speak
             speaker: Speaker ID (for multi-speaker models)
             language: Language code (for multi-language models)
             wait: Whether to wait for playback to finish
-            
+            stream: Synthesize sentence by sentence and start playing the
+                    first one while the rest are generated. Off by default:
+                    Tacotron2's attention state can corrupt on rapid short
+                    inputs, which costs a model reload.
+            output_path: Also save the audio here (not with stream=True).
+                         By default nothing is written to disk.
+        
         Returns:
-            Dictionary with synthesis results
+            Dictionary with synthesis results (output_path is None unless
+            given; the audio is played from memory). With stream=True,
+            "duration" is the time until playback started.
+        
+        Raises:
+            ValueError: If output_path is given with stream=True
+            Exception: If synthesis fails (for streamed text, a later
+                       unit's failure is only raised when waiting)
         """
-        self.logger.info(f"🔊 Speaking: '{text[:50]}{'...' if len(text) > 50 else ''}'")
+        if stream and output_path:
+            raise ValueError("output_path is not supported with stream=True")
         
-        # Synthesize
-        result = self.synthesize(text, speaker=speaker, language=language)
+        result, playback = self._begin_speaking(text, speaker, language, stream, output_path)
+        if wait:
+            playback.finished.wait()
+            if playback.error is not None:
+                raise playback.error
+        return result
+    
+    async def aspeak(
+        self,
+        text: str,
+        speaker: Optional[str] = None,
+        language: Optional[str] = None,
+        stream: bool = False
+    ) -> Dict:
+        """
+        Async version of speak() that returns once playback finishes.
         
-        # Load and play audio
+        Synthesis of the first unit runs in a worker thread; waiting for
+        playback holds no thread. Cancelling the task stops playback.
+        """
+        result, playback = await asyncio.to_thread(self._begin_speaking, text, speaker, language, stream)
+        loop = asyncio.get_running_loop()
+        done = asyncio.Event()
+        
+        def wake():
+            # A cancelled caller's loop may have closed before playback stops
+            if not loop.is_closed():
+                loop.call_soon_threadsafe(done.set)
+        
+        playback.add_done_callback(wake)
         try:
-            output_path = result["output_path"]
-            audio_data, sample_rate = sf.read(output_path)
-            sd.play(audio_data, sample_rate)
-            
-            if wait:
-                sd.wait()
-            
-            self.logger.debug(f"⏱️  TTS latency: {result['duration']:.2f}s")
-            
-            # Note: Temp files are cleaned up by context manager in synthesize()
-            # Only cleanup if this is a persistent temp file
-            if result.get("is_temp") and "_temp_path" not in result:
-                # This shouldn't happen with new implementation, but keep for safety
-                if Path(output_path).exists():
-                    try:
-                        os.unlink(output_path)
-                    except:
-                        pass
-            
-            return result
-            
-        except Exception as e:
-            self.logger.error(f"Error playing audio: {e}", exc_info=True)
+            await done.wait()
+        except asyncio.CancelledError:
+            playback.cancel()
             raise
+        if playback.error is not None:
+            raise playback.error
+        return result
+    
+    def stop_speaking(self):
+        """Stop the current utterance immediately (e.g. on barge-in)."""
+        with self._playback_lock:
+            playback = self._playback
+        if playback is not None:
+            playback.cancel()
+    
+    def _begin_speaking(
+        self,
+        text: str,
+        speaker: Optional[str],
+        language: Optional[str],
+        stream: bool,
+        output_path: Optional[str] = None
+    ) -> Tuple[Dict, _Playback]:
+        """
+        Start playing text and return once audio has started.
+        
+        With stream=True, units start short (the first clause) and grow,
+        and a worker thread synthesizes each one while the previous plays,
+        so playback starts after the first clause instead of the whole text.
+        """
+        self.logger.info(f"🔊 Speaking: '{text[:50]}{'...' if len(text) > 50 else ''}'")
+        
+        start = time.perf_counter()
+        if stream:
+            units = _progressive_segments(_split_sentences(text))
+            waveforms = (self._synthesize_array(unit, speaker=speaker, language=language) for unit in units)
+        else:
+            # Synthesize in memory; the file is only for callers who keep it
+            audio_data, sample_rate = self._synthesize_text(text, speaker=speaker, language=language)
+            if output_path:
+                _write_wav(output_path, audio_data, sample_rate)
+            waveforms = iter([(audio_data, sample_rate)])
+        
+        playback = self._start_playback(waveforms)
+        playback.started.wait()
+        if playback.output is None and playback.error is not None:
+            self.logger.error(f"Error playing audio: {playback.error}")
+            raise playback.error
+        
+        result = {
+            "output_path": output_path,
+            "duration": time.perf_counter() - start,
+            "text": text,
+            "sample_rate": playback.sample_rate,
+            "is_temp": False
+        }
+        self.logger.debug(f"⏱️  TTS time to first audio: {result['duration']:.2f}s")
+        return result, playback
+    
+    def _start_playback(self, waveforms: Iterator[Tuple[np.ndarray, int]]) -> _Playback:
+        """Play waveforms on a new _Playback, replacing the current one."""
+        playback = _Playback()
+        with self._playback_lock:
+            previous, self._playback = self._playback, playback
+        if previous is not None:
+            previous.cancel()
+        threading.Thread(target=playback.run, args=(waveforms, self._audio_output), daemon=True).start()
+        return playback
+    
+    def _audio_output(self, sample_rate: int) -> _AudioOutput:
+        """Get the engine's output stream, opening it on first use."""
+        with self._playback_lock:
+            if self._output is None or self._output.sample_rate != sample_rate:
+                if self._close_output is not None:
+                    self._close_output()
+                self._output = _AudioOutput(sample_rate)
+                # Close the stream when the engine is garbage collected
+                self._close_output = weakref.finalize(self, self._output.close)
+            return self._output
+    
+    def close(self):
+        """Stop speaking and close the audio output stream."""
+        self.stop_speaking()
+        with self._playback_lock:
+            if self._close_output is not None:
+                self._close_output()
+            self._output = None
+            self._close_output = None
     
     def synthesize_to_bytes(
         self,
@@ -262,37 +1209,16 @@ class TTSEngine(TTSEngineInterface):
             text: Text to synthesize
             speaker: Speaker ID (for multi-speaker models)
             language: Language code (for multi-language models)
-            
+        
         Returns:
             Audio data as bytes (WAV format)
         """
-        # Use temp file context manager
-        with temp_file(suffix=".wav") as temp_path:
-            # Synthesize to temp file
-            if speaker and hasattr(self.tts, 'speakers') and speaker in self.tts.speakers:
-                self.tts.tts_to_file(
-                    text=text,
-                    file_path=str(temp_path),
-                    speaker=speaker
-                )
-            elif language and hasattr(self.tts, 'language'):
-                self.tts.tts_to_file(
-                    text=text,
-                    file_path=str(temp_path),
-                    language=language
-                )
-            else:
-                self.tts.tts_to_file(
-                    text=text,
-                    file_path=str(temp_path)
-                )
-            
-            # Read bytes before cleanup
-            with open(temp_path, "rb") as f:
-                audio_bytes = f.read()
-            
-            # Temp file automatically cleaned up by context manager
-            return audio_bytes
+        audio_data, sample_rate = self._synthesize_text(text, speaker=speaker, language=language)
+        
+        # Encode the WAV in memory
+        buffer = io.BytesIO()
+        _write_wav(buffer, audio_data, sample_rate)
+        return buffer.getvalue()
     
     def play(self, audio_path: str) -> None:
         """
@@ -305,7 +1231,8 @@ class TTSEngine(TTSEngineInterface):
         import soundfile as sf
         
         try:
-            audio_data, sample_rate = sf.read(audio_path)
+            # Read straight to int16 so playback needs no float conversion
+            audio_data, sample_rate = sf.read(audio_path, dtype="int16")
             sd.play(audio_data, sample_rate)
             sd.wait()
             self.logger.debug(f"Played audio: {audio_path}")
@@ -326,21 +1253,45 @@ class TTSEngine(TTSEngineInterface):
         if self.language:
             info["language"] = self.language
         
-        if hasattr(self.tts, 'speakers') and self.tts.speakers:
-            info["available_speakers"] = list(self.tts.speakers)
+        if self._speakers:
+            info["available_speakers"] = list(self._speakers)
         
         return info
     
+    def cache_stats(self) -> Dict:
+        """
+        Get phrase cache statistics.
+        
+        Returns:
+            Dictionary with "memory_entries" and, when the disk cache is
+            enabled, "disk" (hits, misses, entries, size_bytes, max_bytes)
+        """
+        stats = {"memory_entries": len(_waveform_cache)}
+        if self._disk_cache is not None:
+            stats["disk"] = self._disk_cache.stats()
+        return stats
+    
+    @staticmethod
+    def clear_cache():
+        """Drop the shared models and release their GPU memory."""
+        with _model_cache_lock:
+            _model_cache.clear()
+        get_memory_manager().clear_gpu_cache()
+        get_logger(__name__).info("TTS model cache cleared")
+    
+    @staticmethod
+    def get_cache_size() -> int:
+        """Get the number of cached models."""
+        return len(_model_cache)
+    
     @staticmethod
-    def list_models() -> List[str]:
-        """List all available TTS models."""
+    def list_models() -> Tuple[str, ...]:
+        """List all available TTS models (cached after the first call)."""
         try:
-            tts = TTS()
-            models = tts.list_models()
-            return models
+            return _available_models()
         except Exception as e:
             print(f"⚠️  Error listing models: {e}")
-            return []
+            return ()
 
 
 if __name__ == "__main__":
@@ -399,7 +1350,7 @@ if __name__ == "__main__":
         print("\n" + "=" * 60)
         print("✅ TTS Engine test complete!")
         print("=" * 60)
-        
+    
     except Exception as e:
         print(f"\n❌ Error: {e}")
         import traceback
@@ -0,0 +1,381 @@
+"""
+Language Model Engine using vLLM
+
+This module provides a PagedAttention-based LLM backend with continuous
+batching and automatic prefix caching. It is a drop-in alternative to the
+llama.cpp engine for multi-request throughput on large GPUs.
+"""
+
+import time
+import queue
+import threading
+from concurrent.futures import Future
+from typing import Any, AsyncIterator, Dict, List, Optional
+from src.config.config_schema import LLMConfig
+from src.utils.logger import get_logger, log_timing
+from src.utils.error_handler import handle_error
+from src.interfaces.engines import LLMEngineInterface
+from src.backend.llm_engine import iterate_in_thread, parse_tool_calls, _token_metrics
+
+
+class _BatchRequest:
+    """A pending generate/chat request waiting to be batched."""
+    
+    __slots__ = ("kind", "payload", "params", "tools", "future")
+    
+    def __init__(self, kind: str, payload: Any, params: Any, tools: Optional[List[Dict]]):
+        self.kind = kind
+        self.payload = payload
+        self.params = params
+        self.tools = tools
+        self.future: Future = Future()
+
+
+class _BatchScheduler:
+    """
+    Coalesces concurrent requests into batched vLLM calls.
+    
+    Callers on any thread submit a request and block on its future. A single
+    worker thread drains everything queued, groups compatible requests
+    (same kind and tool set) and runs each group as one ``generate``/``chat``
+    call, so concurrent requests share weight reads instead of running
+    one after another.
+    """
+    
+    def __init__(self, llm, max_batch: int, logger):
+        self._llm = llm
+        self._max_batch = max_batch
+        self._logger = logger
+        self._queue: "queue.Queue[_BatchRequest]" = queue.Queue()
+        self._worker = threading.Thread(target=self._run, daemon=True)
+        self._worker.start()
+    
+    def submit(self, kind: str, payload: Any, params: Any, tools: Optional[List[Dict]] = None):
+        """
+        Queue a request and wait for its vLLM output.
+        
+        Args:
+            kind: "generate" (payload is a prompt) or "chat" (payload is messages)
+            payload: Prompt string or message list
+            params: SamplingParams for this request
+            tools: Tool definitions (chat only)
+            
+        Returns:
+            vLLM RequestOutput for this request
+        """
+        request = _BatchRequest(kind, payload, params, tools)
+        self._queue.put(request)
+        return request.future.result()
+    
+    def _run(self):
+        """Worker loop: block for one request, then batch whatever else is waiting."""
+        pending: List[_BatchRequest] = []
+        while True:
+            if not pending:
+                pending.append(self._queue.get())
+            while len(pending) < self._max_batch:
+                try:
+                    pending.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            
+            first = pending[0]
+            batch = [r for r in pending if r.kind == first.kind and r.tools == first.tools][:self._max_batch]
+            pending = [r for r in pending if r not in batch]
+            self._execute(batch)
+    
+    def _execute(self, batch: List[_BatchRequest]):
+        """Run one batched call and resolve each request's future."""
+        self._logger.debug(f"vLLM batch: {len(batch)} {batch[0].kind} request(s)")
+        payloads = [r.payload for r in batch]
+        params = [r.params for r in batch]
+        try:
+            if batch[0].kind == "generate":
+                outputs = self._llm.generate(payloads, params, use_tqdm=False)
+            else:
+                outputs = self._llm.chat(payloads, params, tools=batch[0].tools, use_tqdm=False)
+        except Exception as e:
+            for request in batch:
+                request.future.set_exception(e)
+            return
+        for request, output in zip(batch, outputs):
+            request.future.set_result(output)
+
+
+class VLLMEngine(LLMEngineInterface):
+    """
+    Language Model engine using vLLM.
+    
+    Returns the same result dictionaries as LLMEngine so callers don't
+    need to know which backend is active.
+    """
+    
+    def __init__(
+        self,
+        config: Optional[LLMConfig] = None,
+        model: Optional[str] = None,
+        n_ctx: Optional[int] = None,
+        quantization: Optional[str] = None,
+        gpu_memory_utilization: Optional[float] = None,
+        max_num_seqs: Optional[int] = None
+    ):
+        """
+        Initialize the vLLM engine.
+        
+        Args:
+            config: LLMConfig object (takes precedence over individual params)
+            model: Hugging Face model ID or local model directory
+            n_ctx: Maximum model context length
+            quantization: Weight quantization method (awq, gptq, fp8)
+            gpu_memory_utilization: Fraction of GPU memory to reserve
+            max_num_seqs: Maximum concurrent sequences per batch
+        """
+        if config:
+            model = config.vllm_model or config.model_path
+            n_ctx = config.n_ctx
+            quantization = config.vllm_quantization
+            gpu_memory_utilization = config.gpu_memory_utilization
+            max_num_seqs = config.max_num_seqs
+        else:
+            if model is None:
+                raise ValueError("model is required if config is not provided")
+            n_ctx = n_ctx if n_ctx is not None else 4096
+            gpu_memory_utilization = gpu_memory_utilization if gpu_memory_utilization is not None else 0.9
+            max_num_seqs = max_num_seqs if max_num_seqs is not None else 64
+        
+        # Import lazily - vLLM is an optional dependency
+        from vllm import LLM
+        
+        self.logger = get_logger(__name__)
+        self.logger.info(f"Loading vLLM model: {model}")
+        self.logger.debug(f"  Max model length: {n_ctx}")
+        self.logger.debug(f"  Quantization: {quantization or 'none'}")
+        self.logger.debug(f"  GPU memory utilization: {gpu_memory_utilization}")
+        self.logger.debug(f"  Max sequences: {max_num_seqs}")
+        
+        try:
+            with log_timing("vLLM model loading", self.logger):
+                self.llm = LLM(
+                    model=model,
+                    quantization=quantization,
+                    max_model_len=n_ctx,
+                    gpu_memory_utilization=gpu_memory_utilization,
+                    max_num_seqs=max_num_seqs,
+                    enable_prefix_caching=True
+                )
+            self.logger.info("vLLM model loaded successfully!")
+        except Exception as e:
+            error_info = handle_error(e, context={"model": model}, logger=self.logger)
+            self.logger.error(f"Error loading vLLM model: {error_info['message']}", exc_info=True)
+            raise
+        
+        self.model_path = model
+        self.n_ctx = n_ctx
+        self.quantization = quantization
+        self.max_num_seqs = max_num_seqs
+        
+        # All generate/chat calls go through one scheduler so concurrent
+        # callers are decoded together in a single batch
+        self._scheduler = _BatchScheduler(self.llm, max_num_seqs, self.logger)
+    
+    @staticmethod
+    def _sampling_params(
+        max_tokens: int,
+        temperature: float,
+        top_p: float,
+        stop: Optional[List[str]] = None,
+        **kwargs
+    ):
+        """Build vLLM SamplingParams."""
+        from vllm import SamplingParams
+        return SamplingParams(
+            max_tokens=max_tokens,
+            temperature=temperature,
+            top_p=top_p,
+            stop=stop,
+            **kwargs
+        )
+    
+    @staticmethod
+    def _metrics(request_output, start_ns: int, end_ns: int) -> Dict:
+        """
+        Build TTFT/TPOT metrics for a finished request.
+        
+        Args:
+            request_output: vLLM RequestOutput
+            start_ns: perf_counter_ns() before submitting
+            end_ns: perf_counter_ns() after the result arrived
+            
+        Returns:
+            Metrics dictionary (same keys as LLMEngine results)
+        """
+        first_token_ns = None
+        stats = getattr(request_output, 'metrics', None)
+        if stats is not None and stats.first_token_time and stats.arrival_time:
+            first_token_ns = start_ns + int((stats.first_token_time - stats.arrival_time) * 1e9)
+        prompt_ids = request_output.prompt_token_ids
+        prefill_tokens = len(prompt_ids) if prompt_ids is not None else None
+        decode_tokens = len(request_output.outputs[0].token_ids)
+        metrics = _token_metrics(start_ns, first_token_ns, end_ns, prefill_tokens, decode_tokens)
+        metrics['kv_tokens_used'] = (prefill_tokens or 0) + decode_tokens
+        return metrics
+    
+    def generate(
+        self,
+        prompt: str,
+        max_tokens: int = 256,
+        temperature: float = 0.7,
+        top_p: float = 0.9,
+        top_k: int = 40,
+        repeat_penalty: float = 1.1,
+        stop: Optional[List[str]] = None
+    ) -> Dict:
+        """
+        Generate text from a prompt.
+        
+        Args:
+            prompt: Input prompt
+            max_tokens: Maximum tokens to generate
+            temperature: Sampling temperature (0.0-1.0)
+            top_p: Nucleus sampling parameter
+            top_k: Top-k sampling parameter
+            repeat_penalty: Penalty for repetition
+            stop: List of stop sequences
+        
+        Returns:
+            Dictionary with generation results (same format as LLMEngine.generate)
+        """
+        params = self._sampling_params(
+            max_tokens, temperature, top_p, stop,
+            top_k=top_k, repetition_penalty=repeat_penalty
+        )
+        start_ns = time.perf_counter_ns()
+        request_output = self._scheduler.submit("generate", prompt, params)
+        metrics = self._metrics(request_output, start_ns, time.perf_counter_ns())
+        output = request_output.outputs[0]
+        tokens = len(output.token_ids)
+        
+        self.logger.info(f"Generated {tokens} tokens in {metrics['time']:.3f}s")
+        return {
+            'text': output.text.strip(),
+            'tokens': tokens,
+            **metrics
+        }
+    
+    def chat(
+        self,
+        messages: List[Dict[str, str]],
+        max_tokens: int = 256,
+        temperature: float = 0.7,
+        top_p: float = 0.9,
+        stop: Optional[List[str]] = None,
+        tools: Optional[List[Dict]] = None
+    ) -> Dict:
+        """
+        Chat completion with message history.
+        
+        Args:
+            messages: List of message dictionaries with 'role' and 'content'
+            max_tokens: Maximum tokens to generate
+            temperature: Sampling temperature
+            top_p: Nucleus sampling parameter
+            stop: List of stop sequences
+            tools: Optional list of function definitions for function calling
+        
+        Returns:
+            Dictionary with chat results (same format as LLMEngine.chat)
+        """
+        self.logger.debug(f"Chat completion (messages={len(messages)}, max_tokens={max_tokens}, tools={len(tools) if tools else 0})")
+        
+        params = self._sampling_params(max_tokens, temperature, top_p, stop)
+        start_ns = time.perf_counter_ns()
+        request_output = self._scheduler.submit("chat", messages, params, tools)
+        metrics = self._metrics(request_output, start_ns, time.perf_counter_ns())
+        output = request_output.outputs[0]
+        tokens = len(output.token_ids)
+        
+        content, function_calls = parse_tool_calls(output.text, self.logger)
+        
+        self.logger.info(f"Chat response: {tokens} tokens, {len(function_calls)} function call(s)")
+        return {
+            'response': content.strip() if content else '',
+            'tokens': tokens,
+            'function_calls': function_calls,
+            **metrics
+        }
+    
+    def stream_chat(
+        self,
+        messages: List[Dict[str, str]],
+        max_tokens: int = 256,
+        temperature: float = 0.7,
+        include_full_text: bool = False
+    ):
+        """
+        Stream chat completion (generator).
+        
+        The offline vLLM engine completes whole requests, so the response
+        is yielded as a single delta followed by the terminal chunk.
+        
+        Args:
+            messages: List of message dictionaries
+            max_tokens: Maximum tokens to generate
+            temperature: Sampling temperature
+            include_full_text: Include the running 'text' in every chunk
+        
+        Yields:
+            Dictionary with partial response (same format as LLMEngine.stream_chat)
+        """
+        result = self.chat(messages, max_tokens=max_tokens, temperature=temperature)
+        text = result['response']
+        self.logger.debug(f"vLLM stream_chat completed in {result['time']:.3f}s")
+        
+        if text:
+            chunk = {
+                'delta': text,
+                'done': False
+            }
+            if include_full_text:
+                chunk['text'] = text
+            yield chunk
+        yield {
+            'delta': '',
+            'text': text,
+            'done': True,
+            'metrics': {k: result[k] for k in ('time', 'tokens_per_second', 'ttft_ms', 'tpot_ms', 'prefill_tokens', 'decode_tokens', 'kv_tokens_used')}
+        }
+    
+    async def astream_chat(
+        self,
+        messages: List[Dict[str, str]],
+        max_tokens: int = 256,
+        temperature: float = 0.7,
+        include_full_text: bool = False
+    ) -> AsyncIterator[Dict]:
+        """
+        Async version of stream_chat() (same format as LLMEngine.astream_chat).
+        
+        Args:
+            messages: List of message dictionaries
+            max_tokens: Maximum tokens to generate
+            temperature: Sampling temperature
+            include_full_text: Include the running 'text' in every chunk
+        
+        Yields:
+            Same chunk dictionaries as stream_chat()
+        """
+        async for chunk in iterate_in_thread(
+            lambda: self.stream_chat(messages, max_tokens, temperature, include_full_text)
+        ):
+            yield chunk
+    
+    def get_model_info(self) -> Dict:
+        """Get information about the loaded model."""
+        return {
+            "backend": "vllm",
+            "model_path": self.model_path,
+            "n_ctx": self.n_ctx,
+            "quantization": self.quantization,
+            "max_num_seqs": self.max_num_seqs,
+            "context_size": self.n_ctx
+        }
@@ -6,6 +6,7 @@ Can use keyword matching or integrate with wake word detection libraries.
 """
 
 from typing import Optional, Callable, List
+from collections import OrderedDict
 from threading import Thread, Event
 import threading
 import time
@@ -14,6 +15,47 @@ from difflib import SequenceMatcher
 from src.utils.logger import get_logger, log_performance
 from src.utils.error_handler import handle_error
 
+# Recent transcripts whose detection result is remembered
+_DETECTION_CACHE_SIZE = 256
+# Punctuation stripped from transcripts before matching
+_PUNCT_RE = re.compile(r'[^\w\s]')
+
+# rapidfuzz computes the same 2*M/(len(a)+len(b)) ratio natively; difflib is the fallback
+try:
+    from rapidfuzz.fuzz import ratio as _rf_ratio
+    from rapidfuzz.process import cdist as _rf_cdist
+    RAPIDFUZZ_AVAILABLE = True
+except ImportError:
+    RAPIDFUZZ_AVAILABLE = False
+
+
+def _ratio_bound(a: str, b: str) -> float:
+    """Upper bound of _ratio(a, b): at most the shorter string can match."""
+    return 2.0 * min(len(a), len(b)) / ((len(a) + len(b)) or 1)
+
+
+def _ratio(a: str, b: str, cutoff: float = 0.0) -> float:
+    """
+    Similarity ratio (0.0 to 1.0) of two already-normalized strings.
+    
+    Args:
+        a: First string
+        b: Second string
+        cutoff: Ratios below this are reported as 0.0, which lets the
+                scorer stop as soon as the cutoff is out of reach
+    
+    Returns:
+        Similarity ratio, or 0.0 if it is below cutoff
+    """
+    if RAPIDFUZZ_AVAILABLE:
+        return _rf_ratio(a, b, score_cutoff=cutoff * 100.0) / 100.0
+    matcher = SequenceMatcher(None, a, b)
+    # Cheap upper bounds first
+    if matcher.real_quick_ratio() < cutoff or matcher.quick_ratio() < cutoff:
+        return 0.0
+    ratio = matcher.ratio()
+    return ratio if ratio >= cutoff else 0.0
+
 
 class WakeWordDetector:
     """
@@ -60,6 +102,44 @@ class WakeWordDetector:
             "jane": ["jane", "jain", "jayne", "jane.", "jane,", "jane!", "jane?"],
             "hey jane": ["hey jane", "hey jain", "hey jayne", "hey jane.", "hey jane,", "hey jane!"]
         }
+        # (text, sensitivity) -> detection result for recent transcripts; the
+        # listen loop often sees the same short transcript many times
+        self._detection_cache: "OrderedDict[tuple, bool]" = OrderedDict()
+        self._compile_wake_words()
+    
+    def _compile_wake_words(self):
+        """
+        Build the matching patterns (call when wake_words changes).
+        
+        All wake words and their known transcription variations go into one
+        whole-word alternation, so exact detection is a single scan of the
+        transcript. Variations are normalized like transcripts (punctuation
+        removed) and map back to their wake word.
+        """
+        self._detection_cache.clear()
+        # (wake word, number of words) for the fuzzy strategies
+        self._wake_word_info = [(w, len(w.split())) for w in self.wake_words]
+        self._single_wake_words = [w for w, word_count in self._wake_word_info if word_count == 1]
+        
+        self._variant_to_wake_word = {}
+        for wake_word in self.wake_words:
+            for variant in [wake_word, *self.transcription_variations.get(wake_word, [])]:
+                variant = ' '.join(_PUNCT_RE.sub(' ', variant.lower()).split())
+                if variant:
+                    self._variant_to_wake_word.setdefault(variant, wake_word)
+        
+        # Longest first, so "hey jane" wins over "jane" at the same position
+        variants = sorted(self._variant_to_wake_word, key=len, reverse=True)
+        self._exact_re = (
+            re.compile(r'\b(?:' + '|'.join(map(re.escape, variants)) + r')\b')
+            if variants else None
+        )
+        
+        # Wake words as extract_command removes them: at the start, or as a
+        # whole word in the middle (longest first, so "hey jane" beats "jane")
+        alternation = '|'.join(map(re.escape, sorted(self.wake_words, key=len, reverse=True)))
+        self._prefix_re = re.compile(rf'^(?:{alternation})(?=[ ,.!?]|$)') if alternation else None
+        self._infix_re = re.compile(rf' (?:{alternation}) ') if alternation else None
     
     def set_stt_engine(self, stt_engine):
         """
@@ -73,17 +153,19 @@ class WakeWordDetector:
     
     def _similarity(self, a: str, b: str) -> float:
         """Calculate similarity ratio between two strings."""
-        return SequenceMatcher(None, a.lower(), b.lower()).ratio()
+        return _ratio(a.lower(), b.lower())
     
     def detect_wake_word(self, text: str) -> bool:
         """
         Detect if wake word is present in text.
         
         Uses multiple strategies:
-        1. Exact word boundary matching
+        1. Exact word boundary matching (wake words and known variations)
         2. Fuzzy matching for common transcription errors
         3. Partial matching for wake words within longer phrases
         
+        Results for recent transcripts are cached.
+        
         Args:
             text: Text to check for wake word
             
@@ -93,56 +175,81 @@ class WakeWordDetector:
         if not text:
             return False
         
+        key = (text, self.sensitivity)
+        detected = self._detection_cache.get(key)
+        if detected is not None:
+            self._detection_cache.move_to_end(key)
+            if detected:
+                self.logger.info(f"Wake word detected (repeated transcript): '{text}'")
+            return detected
+        
+        detected = self._detect_uncached(text)
+        self._detection_cache[key] = detected
+        if len(self._detection_cache) > _DETECTION_CACHE_SIZE:
+            self._detection_cache.popitem(last=False)
+        return detected
+    
+    def _detect_uncached(self, text: str) -> bool:
+        """Run the detection strategies of detect_wake_word on non-empty text."""
         # Normalize text: remove punctuation, convert to lowercase, normalize whitespace
-        text_normalized = re.sub(r'[^\w\s]', ' ', text.lower())
+        text_normalized = _PUNCT_RE.sub(' ', text.lower())
         text_normalized = ' '.join(text_normalized.split())  # Normalize whitespace
         
-        # Check if any wake word is in the text
-        for wake_word in self.wake_words:
-            wake_word_lower = wake_word.lower()
-            
-            # Strategy 1: Exact word boundary matching (most reliable)
-            # Check if wake word is at the start
-            if text_normalized.startswith(wake_word_lower):
-                # Check if it's followed by space or end of string
-                if len(text_normalized) == len(wake_word_lower) or text_normalized[len(wake_word_lower)] == ' ':
-                    self.logger.info(f"Wake word detected (start): '{wake_word}' in '{text}'")
-                    return True
-            
-            # Check if wake word appears as a whole word (with word boundaries)
-            # Use word boundary regex pattern
-            pattern = r'\b' + re.escape(wake_word_lower) + r'\b'
-            if re.search(pattern, text_normalized):
-                self.logger.info(f"Wake word detected (word boundary): '{wake_word}' in '{text}'")
+        # Strategy 1: Exact word boundary matching of any wake word or variation (most reliable)
+        match = self._exact_re.search(text_normalized) if self._exact_re else None
+        if match:
+            wake_word = self._variant_to_wake_word[match.group()]
+            self.logger.info(f"Wake word detected (word boundary): '{wake_word}' matched '{match.group()}' in '{text}'")
+            return True
+        
+        words = text_normalized.split()
+        # Use sensitivity to adjust thresholds (lower sensitivity = more lenient)
+        # Lower threshold for better detection (0.70 to 0.55)
+        word_threshold = 0.70 - (self.sensitivity * 0.15)  # Range: 0.70 to 0.55
+        sequence_threshold = 0.80 - (self.sensitivity * 0.15)  # Range: 0.80 to 0.65
+        
+        # Strategy 2, vectorized: score every word against every single-word
+        # wake word in one native call (pairs below the cutoff score 0)
+        scored_single_words = RAPIDFUZZ_AVAILABLE and bool(words) and bool(self._single_wake_words)
+        if scored_single_words:
+            scores = _rf_cdist(
+                words,
+                self._single_wake_words,
+                scorer=_rf_ratio,
+                score_cutoff=word_threshold * 100.0
+            )
+            if scores.any():
+                wake_indices, word_indices = scores.T.nonzero()
+                wake_word = self._single_wake_words[wake_indices[0]]
+                word = words[word_indices[0]]
+                similarity = scores[word_indices[0], wake_indices[0]] / 100.0
+                self.logger.info(f"Wake word detected (fuzzy): '{wake_word}' matched '{word}' (similarity: {similarity:.2f}, threshold: {word_threshold:.2f}) in '{text}'")
                 return True
-            
-            # Strategy 2: Fuzzy matching for common transcription errors
-            # Split text into words and check similarity
-            words = text_normalized.split()
-            for word in words:
-                # Check if word is similar to wake word (for single-word wake words)
-                if len(wake_word_lower.split()) == 1:
-                    similarity = self._similarity(word, wake_word_lower)
-                    # Use sensitivity to adjust threshold (lower sensitivity = more lenient)
-                    # Lower threshold for better detection (0.70 to 0.55)
-                    threshold = 0.70 - (self.sensitivity * 0.15)  # Range: 0.70 to 0.55
+        
+        # Check if any wake word is close to a word (or word sequence) in the text
+        for wake_word, word_count in self._wake_word_info:
+            if word_count == 1 and not scored_single_words:
+                # Strategy 2: Fuzzy matching for common transcription errors
+                threshold = word_threshold
+                for word in words:
+                    # Skip words whose length alone rules out a match
+                    if _ratio_bound(word, wake_word) < threshold:
+                        continue
+                    similarity = _ratio(word, wake_word, threshold)
                     if similarity >= threshold:
                         self.logger.info(f"Wake word detected (fuzzy): '{wake_word}' matched '{word}' (similarity: {similarity:.2f}, threshold: {threshold:.2f}) in '{text}'")
                         return True
             
-            # Strategy 3: Check for multi-word wake words (e.g., "hey jane")
-            if len(wake_word_lower.split()) > 1:
-                # Check if all words of wake word appear in sequence
-                wake_words_list = wake_word_lower.split()
-                text_words = text_normalized.split()
-                
+            elif word_count > 1:
+                # Strategy 3: Check for multi-word wake words (e.g., "hey jane")
+                threshold = sequence_threshold
                 # Try to find the sequence of wake word parts
-                for i in range(len(text_words) - len(wake_words_list) + 1):
+                for i in range(len(words) - word_count + 1):
                     # Check if sequence matches
-                    sequence = ' '.join(text_words[i:i+len(wake_words_list)])
-                    similarity = self._similarity(sequence, wake_word_lower)
-                    # Use sensitivity to adjust threshold (lower sensitivity = more lenient)
-                    threshold = 0.80 - (self.sensitivity * 0.15)  # Range: 0.80 to 0.65
+                    sequence = ' '.join(words[i:i + word_count])
+                    if _ratio_bound(sequence, wake_word) < threshold:
+                        continue
+                    similarity = _ratio(sequence, wake_word, threshold)
                     if similarity >= threshold:
                         self.logger.info(f"Wake word detected (multi-word fuzzy): '{wake_word}' matched '{sequence}' (similarity: {similarity:.2f}, threshold: {threshold:.2f}) in '{text}'")
                         return True
@@ -162,42 +269,27 @@ class WakeWordDetector:
         if not text:
             return ""
         
-        text_lower = text.lower()
-        
-        # Find the longest matching wake word
-        matched_wake_word = None
-        for wake_word in sorted(self.wake_words, key=len, reverse=True):
-            # Check if wake word is at the start
-            if text_lower.startswith(wake_word):
-                # Check if it's followed by space, comma, or end of string
-                if len(text_lower) == len(wake_word) or text_lower[len(wake_word)] in [' ', ',', '.', '!', '?']:
-                    matched_wake_word = wake_word
-                    break
-            # Check if wake word appears as a whole word
-            elif f" {wake_word} " in text_lower:
-                matched_wake_word = wake_word
-                break
-        
-        if not matched_wake_word:
+        if self._prefix_re is None:
             return text.strip()
         
+        text_lower = text.lower()
+        
         # Remove wake word from text
-        # Try to remove from start first
-        if text_lower.startswith(matched_wake_word):
-            command = text[len(matched_wake_word):].strip()
+        # Try to remove from start first (followed by space, punctuation, or end of string)
+        match = self._prefix_re.match(text_lower)
+        if match:
+            command = text[match.end():].strip()
             # Remove leading punctuation
             command = command.lstrip(',.!? ')
         else:
             # Remove from anywhere in the text (whole word only)
-            # Find the position of the wake word
-            pos = text_lower.find(f" {matched_wake_word} ")
-            if pos != -1:
-                # Remove wake word and surrounding spaces
-                before = text[:pos].strip()
-                after = text[pos + len(f" {matched_wake_word} "):].strip()
-                command = f"{before} {after}".strip()
-            else:
-                command = text.strip()
+            match = self._infix_re.search(text_lower)
+            if not match:
+                return text.strip()
+            # Remove wake word and surrounding spaces
+            before = text[:match.start()].strip()
+            after = text[match.end():].strip()
+            command = f"{before} {after}".strip()
         
         # Clean up extra spaces
         command = " ".join(command.split())
@@ -229,13 +321,13 @@ class WakeWordDetector:
         self.callback = callback
         self.logger.info(f"Listening for wake word(s): {self.wake_words}")
         
-        start_time = time.time()
+        start_time = time.monotonic()
         detected = False
         
         try:
             while not self.stop_event.is_set():
                 # Check duration
-                if duration > 0 and (time.time() - start_time) >= duration:
+                if duration > 0 and (time.monotonic() - start_time) >= duration:
                     self.logger.debug("Wake word listening timeout")
                     break
                 
@@ -276,10 +368,9 @@ class WakeWordDetector:
                 except Exception as e:
                     error_info = handle_error(e, logger=self.logger)
                     self.logger.debug(f"Error during wake word listening: {error_info['message']}")
-                    continue
                 
-                # Small sleep to prevent CPU spinning
-                time.sleep(0.1)
+                # Short pause to prevent CPU spinning (e.g. on repeated STT errors); returns at once on stop
+                self.stop_event.wait(0.1)
         
         except KeyboardInterrupt:
             self.logger.info("Wake word listening interrupted")
@@ -321,14 +412,14 @@ class WakeWordDetector:
                         if detected:
                             # Continue listening after wake word
                             self.logger.debug("Wake word detected, continuing to listen...")
-                            time.sleep(0.5)
+                            self.stop_event.wait(0.5)
                         else:
-                            time.sleep(0.1)
+                            self.stop_event.wait(0.1)
                     except Exception as e:
                         error_info = handle_error(e, logger=self.logger)
                         self.logger.error(f"Error in continuous listening loop: {error_info['message']}")
                         # Continue listening even if there's an error
-                        time.sleep(0.5)
+                        self.stop_event.wait(0.5)
             except Exception as e:
                 error_info = handle_error(e, logger=self.logger)
                 self.logger.error(f"Fatal error in continuous listening loop: {error_info['message']}")
@@ -370,6 +461,7 @@ class WakeWordDetector:
         wake_word_lower = wake_word.lower()
         if wake_word_lower not in self.wake_words:
             self.wake_words.append(wake_word_lower)
+            self._compile_wake_words()
             self.logger.info(f"Added wake word: '{wake_word}'")
     
     def remove_wake_word(self, wake_word: str) -> None:
@@ -382,6 +474,7 @@ class WakeWordDetector:
         wake_word_lower = wake_word.lower()
         if wake_word_lower in self.wake_words:
             self.wake_words.remove(wake_word_lower)
+            self._compile_wake_words()
             self.logger.info(f"Removed wake word: '{wake_word}'")
     
     def get_wake_words(self) -> List[str]:
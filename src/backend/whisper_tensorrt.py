@@ -0,0 +1,195 @@
+"""
+TensorRT Whisper Encoder
+
+Runs the Whisper encoder from a prebuilt TensorRT FP16 engine and hands its
+output to CTranslate2, which still runs the decoder. The encoder input is
+always one 30s mel window, so the engine is specialized for that shape.
+
+Engines live in ~/.cache/jane/whisper-{size}-encoder-fp16.plan. If the plan
+is missing but an ONNX export of the encoder sits next to it
+(whisper-{size}-encoder.onnx) and trtexec is on PATH, the plan is built on
+first use.
+"""
+
+import shutil
+import subprocess
+from collections import deque
+from pathlib import Path
+from typing import Callable, Optional
+from src.utils.logger import get_logger, log_timing
+
+# Where exported encoders and built engines are kept
+ENGINE_DIR = Path.home() / ".cache" / "jane"
+# Mel frames in one 30s Whisper window
+_MEL_FRAMES = 3000
+# CTranslate2 compute types whose decoder runs in float16, matching the FP16 engine output
+_FP16_COMPUTE_TYPES = ("float16", "int8_float16")
+# Encoder outputs kept alive after being returned; CTranslate2 only borrows their memory
+_LIVE_OUTPUTS = 2
+
+
+def _num_mels(model_size: str) -> int:
+    """large-v3 models use 128 mel bins; earlier models use 80."""
+    return 128 if model_size.startswith("large-v3") else 80
+
+
+class TensorRTEncoder:
+    """
+    Whisper encoder backed by a TensorRT engine.
+    
+    Called with the same arguments as faster_whisper's WhisperModel.encode
+    and returns a CTranslate2 StorageView, so it can replace that method.
+    Inputs other than a single window fall back to the original encoder.
+    """
+    
+    def __init__(self, plan_path: Path, fallback: Callable, device_index: int = 0):
+        """
+        Load the engine.
+        
+        Args:
+            plan_path: Serialized TensorRT engine
+            fallback: Original encode function for unsupported inputs
+            device_index: CUDA device the engine runs on
+        """
+        import tensorrt as trt
+        import torch
+        
+        self.logger = get_logger(__name__)
+        self.fallback = fallback
+        self.device = torch.device("cuda", device_index)
+        
+        runtime = trt.Runtime(trt.Logger(trt.Logger.WARNING))
+        self.engine = runtime.deserialize_cuda_engine(plan_path.read_bytes())
+        self.context = self.engine.create_execution_context()
+        
+        names = [self.engine.get_tensor_name(i) for i in range(self.engine.num_io_tensors)]
+        self.input_name = next(n for n in names if self.engine.get_tensor_mode(n) == trt.TensorIOMode.INPUT)
+        self.output_name = next(n for n in names if self.engine.get_tensor_mode(n) == trt.TensorIOMode.OUTPUT)
+        self.input_shape = tuple(self.engine.get_tensor_shape(self.input_name))
+        
+        # Preallocated device buffers; every call has the same shape
+        self.input = torch.empty(self.input_shape, dtype=torch.float32, device=self.device)
+        self.output = torch.empty(
+            tuple(self.engine.get_tensor_shape(self.output_name)),
+            dtype=torch.float16 if self.engine.get_tensor_dtype(self.output_name) == trt.float16 else torch.float32,
+            device=self.device
+        )
+        self.context.set_tensor_address(self.input_name, self.input.data_ptr())
+        self.context.set_tensor_address(self.output_name, self.output.data_ptr())
+        self.stream = torch.cuda.Stream(device=self.device)
+        # The StorageView returned by a call points into one of these, so
+        # the last few stay referenced until the decoder is done with them
+        self._live_outputs = deque(maxlen=_LIVE_OUTPUTS)
+    
+    def __call__(self, features):
+        """
+        Encode one mel window.
+        
+        Args:
+            features: Mel features, shape [n_mels, frames] or [1, n_mels, frames]
+        
+        Returns:
+            ctranslate2.StorageView with the encoder output
+        """
+        import ctranslate2
+        import numpy as np
+        import torch
+        
+        features = np.asarray(features)
+        if features.ndim == 2:
+            features = features[np.newaxis]
+        if features.shape != self.input_shape:
+            return self.fallback(features)
+        
+        with torch.cuda.stream(self.stream):
+            self.input.copy_(torch.from_numpy(np.ascontiguousarray(features, dtype=np.float32)), non_blocking=True)
+            self.context.execute_async_v3(self.stream.cuda_stream)
+            encoded = self.output.clone()
+        self.stream.synchronize()
+        
+        # from_array doesn't take ownership: keep the tensor alive past this call
+        self._live_outputs.append(encoded)
+        return ctranslate2.StorageView.from_array(encoded)
+
+
+def build_engine(model_size: str) -> Optional[Path]:
+    """
+    Find or build the TensorRT plan for a model size.
+    
+    Args:
+        model_size: Whisper model size
+    
+    Returns:
+        Path to the plan, or None if it doesn't exist and can't be built
+    """
+    logger = get_logger(__name__)
+    plan_path = ENGINE_DIR / f"whisper-{model_size}-encoder-fp16.plan"
+    if plan_path.exists():
+        return plan_path
+    
+    onnx_path = ENGINE_DIR / f"whisper-{model_size}-encoder.onnx"
+    trtexec = shutil.which("trtexec")
+    if not onnx_path.exists() or trtexec is None:
+        logger.warning(f"No TensorRT engine at {plan_path} and no {onnx_path.name} + trtexec to build one")
+        return None
+    
+    input_name = "mel"
+    try:
+        import onnx
+        input_name = onnx.load(str(onnx_path), load_external_data=False).graph.input[0].name
+    except ImportError:
+        pass
+    
+    shape = f"{input_name}:1x{_num_mels(model_size)}x{_MEL_FRAMES}"
+    with log_timing(f"TensorRT encoder build ({model_size})", logger):
+        completed = subprocess.run(
+            [trtexec, f"--onnx={onnx_path}", f"--saveEngine={plan_path}", "--fp16", f"--shapes={shape}"],
+            capture_output=True,
+            text=True
+        )
+    if completed.returncode != 0:
+        logger.warning(f"trtexec failed: {completed.stderr.strip()[-500:]}")
+        return None
+    return plan_path
+
+
+def attach_tensorrt_encoder(model, model_size: str, device_index: int = 0, compute_type: str = "float16") -> bool:
+    """
+    Swap a WhisperModel's encoder for a TensorRT engine.
+    
+    The engine outputs float16, so it is only attached to models whose
+    decoder runs in float16.
+    
+    Args:
+        model: faster_whisper.WhisperModel on CUDA
+        model_size: Whisper model size (selects the engine file)
+        device_index: CUDA device the model runs on
+        compute_type: CTranslate2 compute type the model was loaded with
+    
+    Returns:
+        True if the TensorRT encoder is in use, False if the CTranslate2
+        encoder was kept
+    """
+    logger = get_logger(__name__)
+    if compute_type not in _FP16_COMPUTE_TYPES:
+        logger.warning(f"TensorRT encoder outputs float16 but the model runs {compute_type}; using the CTranslate2 encoder")
+        return False
+    
+    try:
+        import tensorrt  # noqa: F401
+    except ImportError:
+        logger.warning("TensorRT is not installed; using the CTranslate2 encoder")
+        return False
+    
+    plan_path = build_engine(model_size)
+    if plan_path is None:
+        return False
+    
+    try:
+        model.encode = TensorRTEncoder(plan_path, model.encode, device_index)
+    except Exception as e:
+        logger.warning(f"Failed to load TensorRT encoder {plan_path}: {e}")
+        return False
+    
+    logger.info(f"Using TensorRT encoder: {plan_path}")
+    return True
@@ -52,9 +52,10 @@ def _get_env_overrides() -> dict:
     
     # Known field names for each section
     config_structure = {
-        'stt': ['model_size', 'device', 'compute_type', 'num_workers', 'sample_rate'],
-        'tts': ['model_name', 'device'],
-        'llm': ['model_path', 'n_gpu_layers', 'n_ctx', 'n_batch', 'verbose', 'temperature', 'max_tokens'],
+        'stt': ['model_size', 'device', 'compute_type', 'num_workers', 'sample_rate', 'batch_size', 'device_index', 'use_tensorrt'],
+        'tts': ['model_name', 'device', 'precision', 'quantize_on_cpu', 'compile_vocoder', 'disk_cache_mb'],
+        'llm': ['backend', 'model_path', 'n_gpu_layers', 'n_ctx', 'n_batch', 'n_ubatch', 'verbose', 'temperature', 'max_tokens',
+                'flash_attn', 'kv_cache_type', 'num_pred_tokens', 'prompt_cache_mb', 'max_kv_tokens_per_request', 'vllm_model', 'vllm_quantization', 'gpu_memory_utilization', 'max_num_seqs'],
         'file_controller': ['safe_mode', 'allowed_directories'],
         'app_controller': ['common_apps'],
         'input_controller': ['safe_mode', 'pause'],
@@ -5,7 +5,7 @@ Defines all configuration models for the Jane AI Assistant.
 """
 
 from pydantic import BaseModel, Field
-from typing import Optional, List
+from typing import Optional, List, Literal
 from pathlib import Path
 
 
@@ -14,7 +14,7 @@ class STTConfig(BaseModel):
     
     model_size: str = Field(
         default="medium",
-        description="Whisper model size (tiny, base, small, medium, large-v2, large-v3)"
+        description="Whisper model size (tiny, base, small, medium, large-v2, large-v3, large-v3-turbo)"
     )
     device: str = Field(
         default="cuda",
@@ -32,6 +32,18 @@ class STTConfig(BaseModel):
         default=16000,
         description="Audio sample rate in Hz"
     )
+    batch_size: int = Field(
+        default=8,
+        description="30s chunks decoded per batch for long audio on GPU (0 = disable batched inference)"
+    )
+    device_index: int = Field(
+        default=0,
+        description="CUDA device index to load the model on"
+    )
+    use_tensorrt: bool = Field(
+        default=False,
+        description="Run the Whisper encoder from a prebuilt TensorRT FP16 engine (~/.cache/jane)"
+    )
 
 
 class TTSConfig(BaseModel):
@@ -45,11 +57,31 @@ class TTSConfig(BaseModel):
         default=None,
         description="Device to use (cuda or cpu). Auto-detects if None."
     )
+    precision: Literal["fp32", "fp16"] = Field(
+        default="fp32",
+        description="Inference precision on CUDA (fp32 or fp16); ignored on CPU"
+    )
+    quantize_on_cpu: bool = Field(
+        default=True,
+        description="Dynamically quantize the acoustic model's linear/LSTM layers to int8 when running on CPU"
+    )
+    compile_vocoder: bool = Field(
+        default=False,
+        description="torch.compile the vocoder with CUDA graphs on CUDA (slow first calls per new length)"
+    )
+    disk_cache_mb: int = Field(
+        default=500,
+        description="Size cap in MB of the on-disk cache of synthesized phrases (0 disables it)"
+    )
 
 
 class LLMConfig(BaseModel):
     """Language Model engine configuration."""
     
+    backend: str = Field(
+        default="llama_cpp",
+        description="Inference backend (llama_cpp or vllm)"
+    )
     model_path: str = Field(
         default="models/Qwen2.5-7B-Instruct-Q4_K_M.gguf",
         description="Path to LLM GGUF model file"
@@ -63,8 +95,12 @@ class LLMConfig(BaseModel):
         description="Context window size"
     )
     n_batch: int = Field(
+        default=2048,
+        description="Logical batch size for prompt processing (prefill)"
+    )
+    n_ubatch: int = Field(
         default=512,
-        description="Batch size for processing"
+        description="Physical micro-batch size submitted to the backend per step"
     )
     verbose: bool = Field(
         default=False,
@@ -78,17 +114,53 @@ class LLMConfig(BaseModel):
         default=512,
         description="Maximum tokens to generate"
     )
-    n_threads: int = Field(
-        default=8,
-        description="Number of CPU threads for non-GPU work"
+    n_threads: Optional[int] = Field(
+        default=None,
+        description="Number of CPU threads for non-GPU work (None = auto-detect, max 16)"
     )
     use_mmap: bool = Field(
         default=True,
         description="Use memory mapping for faster model loading"
     )
-    n_threads_batch: int = Field(
-        default=8,
-        description="Number of threads for batch processing"
+    n_threads_batch: Optional[int] = Field(
+        default=None,
+        description="Number of threads for batch processing (None = same as n_threads)"
+    )
+    flash_attn: bool = Field(
+        default=True,
+        description="Use FlashAttention kernels (faster long-context prefill; required for quantized V cache)"
+    )
+    kv_cache_type: Literal["f16", "q8_0", "q4_0"] = Field(
+        default="f16",
+        description="KV cache storage type (f16, q8_0, q4_0); quantized types enable flash attention"
+    )
+    num_pred_tokens: int = Field(
+        default=0,
+        description="Draft tokens per step for prompt-lookup speculative decoding (0 = disabled)"
+    )
+    prompt_cache_mb: int = Field(
+        default=2048,
+        description="RAM cache for evaluated prompt prefixes in MB (0 = disabled)"
+    )
+    max_kv_tokens_per_request: Optional[int] = Field(
+        default=None,
+        description="KV cache tokens (prompt + output) one request may use (None = n_ctx); oldest history is dropped to fit"
+    )
+    vllm_model: Optional[str] = Field(
+        default=None,
+        description="Hugging Face model ID or local directory for the vLLM backend"
+    )
+    vllm_quantization: Optional[str] = Field(
+        default=None,
+        description="vLLM weight quantization (awq, gptq, fp8). None = use model's own"
+    )
+    gpu_memory_utilization: float = Field(
+        default=0.9,
+        description="Fraction of GPU memory vLLM may reserve for weights and KV cache"
+    )
+    max_num_seqs: int = Field(
+        default=64,
+        description="Maximum concurrent sequences per vLLM batch"
     )
 
 
@@ -139,7 +211,7 @@ class InputControllerConfig(BaseModel):
     )
     pause: float = Field(
         default=0.1,
-        description="Pause between actions in seconds"
+        description="Pause after each input action in seconds"
     )
 
 
@@ -4,11 +4,12 @@ Factory Functions for Component Creation
 Provides factory functions for creating components with dependency injection.
 """
 
-from typing import Optional
+from typing import Optional, Union
 from src.config import AssistantConfig, get_config
 from src.backend.streaming_stt import StreamingSTT
 from src.backend.tts_engine import TTSEngine
 from src.backend.llm_engine import LLMEngine
+from src.backend.vllm_engine import VLLMEngine
 from src.backend.file_controller import FileController
 from src.backend.app_controller import AppController
 from src.backend.input_controller import InputController
@@ -48,18 +49,24 @@ def create_tts_engine(config: Optional[AssistantConfig] = None) -> TTSEngine:
     return TTSEngine(config=config.tts)
 
 
-def create_llm_engine(config: Optional[AssistantConfig] = None) -> LLMEngine:
+def create_llm_engine(config: Optional[AssistantConfig] = None) -> Union[LLMEngine, VLLMEngine]:
     """
     Factory function to create an LLM engine.
     
+    The backend is selected by ``config.llm.backend`` ("llama_cpp" or "vllm").
+    
     Args:
         config: AssistantConfig object (uses default if not provided)
         
     Returns:
-        LLMEngine instance
+        LLMEngine or VLLMEngine instance
     """
     if config is None:
         config = get_config()
+    if config.llm.backend == "vllm":
+        return VLLMEngine(config=config.llm)
+    if config.llm.backend != "llama_cpp":
+        raise ValueError(f"Unknown LLM backend: {config.llm.backend}")
     return LLMEngine(config=config.llm)
 
 
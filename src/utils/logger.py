@@ -159,6 +159,10 @@ def log_performance(operation_name: Optional[str] = None):
     """
     Decorator to log performance metrics for function execution.
     
+    The level is checked once when the function is decorated: if its logger
+    won't emit INFO records, the function is returned unwrapped so the call
+    pays no timing or logging overhead.
+    
     Args:
         operation_name: Custom name for the operation. If None, uses function name.
     
@@ -170,15 +174,19 @@ def log_performance(operation_name: Optional[str] = None):
     def decorator(func: Callable) -> Callable:
         op_name = operation_name or func.__name__
         logger = get_logger(func.__module__)
+        if not logger.isEnabledFor(logging.INFO):
+            return func
+        debug_enabled = logger.isEnabledFor(logging.DEBUG)
         
         @functools.wraps(func)
         def wrapper(*args, **kwargs) -> Any:
-            start_time = time.time()
-            logger.debug(f"Starting {op_name}...")
+            start_time = time.perf_counter()
+            if debug_enabled:
+                logger.debug(f"Starting {op_name}...")
             
             try:
                 result = func(*args, **kwargs)
-                elapsed = time.time() - start_time
+                elapsed = time.perf_counter() - start_time
                 
                 # Update timing in result if it's a dict (for LLM/STT/TTS results)
                 if isinstance(result, dict) and 'time' in result:
@@ -190,7 +198,7 @@ def log_performance(operation_name: Optional[str] = None):
                 logger.info(f"{op_name} completed in {elapsed:.3f}s")
                 return result
             except Exception as e:
-                elapsed = time.time() - start_time
+                elapsed = time.perf_counter() - start_time
                 logger.error(f"{op_name} failed after {elapsed:.3f}s: {e}")
                 raise
         
@@ -126,10 +126,13 @@ class MemoryManager:
         if cleaned > 0:
             self.logger.info(f"Cleaned up {cleaned} temporary directories")
     
-    def get_gpu_memory_info(self) -> Optional[Dict]:
+    def get_gpu_memory_info(self, device_index: Optional[int] = None) -> Optional[Dict]:
         """
         Get GPU memory usage information.
         
+        Args:
+            device_index: CUDA device to query (default: current device)
+        
         Returns:
             Dictionary with GPU memory info or None if not available
         """
@@ -140,17 +143,22 @@ class MemoryManager:
             return None
         
         try:
-            device = torch.cuda.current_device()
+            device = torch.cuda.current_device() if device_index is None else device_index
             allocated = torch.cuda.memory_allocated(device) / (1024**3)  # GB
             reserved = torch.cuda.memory_reserved(device) / (1024**3)  # GB
             max_allocated = torch.cuda.max_memory_allocated(device) / (1024**3)  # GB
+            # Whole-device numbers (includes memory held by other libraries and processes)
+            device_free, device_total = torch.cuda.mem_get_info(device)
             
             return {
                 "device": device,
                 "allocated_gb": allocated,
                 "reserved_gb": reserved,
                 "max_allocated_gb": max_allocated,
-                "free_gb": reserved - allocated
+                "free_gb": reserved - allocated,
+                "device_free_gb": device_free / (1024**3),
+                "total_gb": device_total / (1024**3),
+                "compute_capability": torch.cuda.get_device_capability(device)
             }
         except Exception as e:
             self.logger.warning(f"Failed to get GPU memory info: {e}")
@@ -143,6 +143,15 @@ def test_validation():
     except Exception as e:
         print(f"✅ Validation caught invalid temperature: {type(e).__name__}")
     
+    # Test unsupported TTS precision (bf16 outputs can't be converted to numpy)
+    from pydantic import ValidationError
+    try:
+        TTSConfig(precision="bf16")
+    except ValidationError as e:
+        print(f"✅ Validation caught unsupported TTS precision: {type(e).__name__}")
+    else:
+        assert False, "Validation should have failed for precision='bf16'"
+    
     # Test valid config
     valid_config = STTConfig(
         model_size="medium",
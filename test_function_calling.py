@@ -175,6 +175,54 @@ def test_function_schema():
     print("✅ Function schema is valid")
 
 
+def test_function_argument_dispatch():
+    """Test argument filtering, defaults and missing required parameters."""
+    print("\n" + "=" * 60)
+    print("Test 8: Argument Dispatch")
+    print("=" * 60)
+    
+    handler = FunctionHandler()
+    
+    def greet(name: str, greeting: str = "Hello", *, punctuation: str = "!") -> str:
+        """Build a greeting."""
+        return f"{greeting}, {name}{punctuation}"
+    
+    handler.register(
+        "greet",
+        greet,
+        "Greet someone",
+        {
+            "type": "object",
+            "properties": {
+                "name": {"type": "string"},
+                "greeting": {"type": "string"},
+                "punctuation": {"type": "string"}
+            },
+            "required": ["name"]
+        }
+    )
+    
+    # Defaults are respected and unknown arguments are dropped
+    result = handler.execute("greet", {"name": "Jane", "unused": 1})
+    assert result["success"], "Function should execute successfully"
+    assert result["result"] == "Hello, Jane!", f"Unexpected result: {result['result']}"
+    
+    # Optional and keyword-only arguments are passed through
+    result = handler.execute("greet", {"name": "Jane", "greeting": "Hi", "punctuation": "?"})
+    assert result["result"] == "Hi, Jane?", f"Unexpected result: {result['result']}"
+    
+    # Missing required parameter is reported, not raised
+    result = handler.execute("greet", {"greeting": "Hi"})
+    assert not result["success"], "Missing required parameter should fail"
+    assert result["error"] == "Missing required parameter: name"
+    
+    # Internals are not exposed through get_function_info
+    info = handler.get_function_info("greet")
+    assert set(info) == {"description", "parameters"}, f"Unexpected info keys: {set(info)}"
+    
+    print("✅ Argument dispatch works correctly")
+
+
 if __name__ == "__main__":
     print("=" * 60)
     print("LLM Function Calling Tests")
@@ -188,6 +236,7 @@ if __name__ == "__main__":
         test_function_list()
         test_multi_function_chain()
         test_function_schema()
+        test_function_argument_dispatch()
         
         print("\n" + "=" * 60)
         print("✅ All Function Calling Tests Passed!")
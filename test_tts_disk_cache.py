@@ -0,0 +1,106 @@
+"""
+Test script for the on-disk TTS waveform cache.
+
+Tests:
+- Round trip of waveform and sample rate
+- TTL expiry
+- LRU eviction past the size cap
+- Corrupt entries are treated as misses
+"""
+
+import os
+import time
+import tempfile
+import numpy as np
+from src.backend.tts_disk_cache import WaveformDiskCache
+
+
+def test_round_trip():
+    """Test that a stored waveform comes back unchanged."""
+    with tempfile.TemporaryDirectory() as directory:
+        cache = WaveformDiskCache(directory)
+        waveform = np.linspace(-1, 1, 1000, dtype=np.float32)
+        
+        assert cache.get("model", "Hello", None, "en") is None
+        cache.put("model", "Hello", None, "en", waveform, 22050)
+        
+        cached, sample_rate = cache.get("model", "Hello", None, "en")
+        assert sample_rate == 22050
+        assert np.array_equal(cached, waveform)
+        # Other speakers and languages are separate entries
+        assert cache.get("model", "Hello", "p225", "en") is None
+        assert cache.stats()["hits"] == 1
+        assert cache.stats()["misses"] == 2
+        
+        print("✅ Round trip works")
+
+
+def test_ttl():
+    """Test that entries unused for longer than the TTL are misses."""
+    with tempfile.TemporaryDirectory() as directory:
+        cache = WaveformDiskCache(directory, ttl_seconds=60)
+        cache.put("model", "Hello", None, None, np.zeros(10, dtype=np.float32), 16000)
+        
+        path = cache._path("model", "Hello", None, None)
+        old = time.time() - 120
+        os.utime(path, (old, old))
+        
+        assert cache.get("model", "Hello", None, None) is None
+        assert not path.exists()
+        
+        print("✅ TTL expiry works")
+
+
+def test_eviction():
+    """Test that the least recently used entries are evicted past the cap."""
+    with tempfile.TemporaryDirectory() as directory:
+        # Each entry is 4 + 400 bytes; the cap fits two
+        cache = WaveformDiskCache(directory, max_bytes=1000)
+        waveform = np.zeros(100, dtype=np.float32)
+        for i, text in enumerate(["one", "two"]):
+            cache.put("model", text, None, None, waveform, 16000)
+            stamp = time.time() - 100 + i
+            os.utime(cache._path("model", text, None, None), (stamp, stamp))
+        
+        # Overwriting an entry doesn't grow the cache
+        cache.put("model", "two", None, None, waveform, 16000)
+        assert cache._size_bytes == 808
+        assert cache.stats()["entries"] == 2
+        
+        cache.put("model", "three", None, None, waveform, 16000)
+        assert cache.get("model", "one", None, None) is None
+        assert cache.get("model", "two", None, None) is not None
+        assert cache.get("model", "three", None, None) is not None
+        assert cache.stats()["size_bytes"] <= 1000
+        
+        print("✅ Eviction works")
+
+
+def test_corrupt_entry():
+    """Test that truncated or foreign files are removed and reported as misses."""
+    with tempfile.TemporaryDirectory() as directory:
+        cache = WaveformDiskCache(directory)
+        for text, data in [("short", b"\x01\x02"), ("odd", b"\x00" * 7)]:
+            path = cache._path("model", text, None, None)
+            path.write_bytes(data)
+            
+            assert cache.get("model", text, None, None) is None
+            assert not path.exists()
+        assert cache.stats()["misses"] == 2
+        
+        print("✅ Corrupt entries are misses")
+
+
+if __name__ == "__main__":
+    print("=" * 60)
+    print("TTS Disk Cache Tests")
+    print("=" * 60)
+    
+    test_round_trip()
+    test_ttl()
+    test_eviction()
+    test_corrupt_entry()
+    
+    print("\n" + "=" * 60)
+    print("✅ All TTS disk cache tests passed!")
+    print("=" * 60)